@@ -1,5 +1,6 @@
 import 'dart:convert';
 import 'dart:io';
+import 'dart:math';
 
 import 'package:flutter/services.dart';
 import 'package:flutter/widgets.dart';
@@ -21,6 +22,22 @@ const String _warmupRunsDefine = String.fromEnvironment(
   'KIWI_BENCH_WARMUP_RUNS',
   defaultValue: '3',
 );
+const String _warmupModeDefine = String.fromEnvironment(
+  'KIWI_BENCH_WARMUP_MODE',
+  defaultValue: 'fixed',
+);
+const String _warmupCvThresholdDefine = String.fromEnvironment(
+  'KIWI_BENCH_WARMUP_CV_THRESHOLD',
+  defaultValue: '0.05',
+);
+const String _warmupWindowDefine = String.fromEnvironment(
+  'KIWI_BENCH_WARMUP_WINDOW',
+  defaultValue: '3',
+);
+const String _warmupMaxRunsDefine = String.fromEnvironment(
+  'KIWI_BENCH_WARMUP_MAX_RUNS',
+  defaultValue: '50',
+);
 const String _measureRunsDefine = String.fromEnvironment(
   'KIWI_BENCH_MEASURE_RUNS',
   defaultValue: '15',
@@ -76,6 +93,8 @@ const String _analyzeImplJson = 'json';
 const String _analyzeImplTokenCount = 'token_count';
 const String _executionModeSingle = 'single';
 const String _executionModeBatch = 'batch';
+const String _warmupModeFixed = 'fixed';
+const String _warmupModeAdaptive = 'adaptive';
 
 Future<void> main() async {
   WidgetsFlutterBinding.ensureInitialized();
@@ -138,6 +157,10 @@ class _BenchmarkConfig {
     required this.modelPath,
     required this.outputPath,
     required this.warmupRuns,
+    required this.warmupMode,
+    required this.warmupCvThreshold,
+    required this.warmupWindow,
+    required this.warmupMaxRuns,
     required this.measureRuns,
     required this.topN,
     required this.numThreads,
@@ -154,6 +177,10 @@ class _BenchmarkConfig {
   final String modelPath;
   final String outputPath;
   final int warmupRuns;
+  final String warmupMode;
+  final double warmupCvThreshold;
+  final int warmupWindow;
+  final int warmupMaxRuns;
   final int measureRuns;
   final int topN;
   final int numThreads;
@@ -171,6 +198,13 @@ class _BenchmarkConfig {
       modelPath: _modelPathDefine,
       outputPath: _outputPathDefine,
       warmupRuns: _parseInt(_warmupRunsDefine, fallback: 3, minimum: 0),
+      warmupMode: _parseWarmupMode(_warmupModeDefine),
+      warmupCvThreshold: _parseDouble(
+        _warmupCvThresholdDefine,
+        fallback: 0.05,
+      ),
+      warmupWindow: _parseInt(_warmupWindowDefine, fallback: 3, minimum: 2),
+      warmupMaxRuns: _parseInt(_warmupMaxRunsDefine, fallback: 50, minimum: 1),
       measureRuns: _parseInt(_measureRunsDefine, fallback: 15, minimum: 1),
       topN: _parseInt(_topNDefine, fallback: 1, minimum: 1),
       numThreads: _parseInt(_numThreadsDefine, fallback: -1, minimum: -1),
@@ -207,6 +241,18 @@ class _RunStats {
   final int totalTokens;
 }
 
+class _WarmupStats {
+  const _WarmupStats({
+    required this.passes,
+    required this.converged,
+    required this.finalCv,
+  });
+
+  final int passes;
+  final bool converged;
+  final double? finalCv;
+}
+
 class _BenchmarkSentence {
   const _BenchmarkSentence({required this.text, required this.runeLength});
 
@@ -238,6 +284,8 @@ class _BenchmarkResult {
   const _BenchmarkResult({
     required this.platform,
     required this.warmupRuns,
+    required this.warmupMode,
+    required this.warmup,
     required this.measureRuns,
     required this.topN,
     required this.numThreads,
@@ -260,6 +308,8 @@ class _BenchmarkResult {
 
   final String platform;
   final int warmupRuns;
+  final String warmupMode;
+  final _WarmupStats warmup;
   final int measureRuns;
   final int topN;
   final int numThreads;
@@ -318,6 +368,11 @@ class _BenchmarkResult {
       'platform': platform,
       'generated_at_utc': DateTime.now().toUtc().toIso8601String(),
       'warmup_runs': warmupRuns,
+      'warmup_mode': warmupMode,
+      'warmup_passes': warmup.passes,
+      if (warmupMode == _warmupModeAdaptive)
+        'warmup_converged': warmup.converged,
+      if (warmup.finalCv != null) 'warmup_final_cv': warmup.finalCv!,
       'measure_runs': measureRuns,
       'top_n': topN,
       'num_threads': numThreads,
@@ -374,13 +429,12 @@ Future<_BenchmarkResult> _runBenchmark(_BenchmarkConfig config) async {
         ? _analyzeImplTokenCount
         : _analyzeImplJson;
 
-    await _executeRuns(
+    final _WarmupStats warmup = await _runWarmup(
       analyzer: analyzer,
       sentences: sentences,
-      runs: config.warmupRuns,
+      config: config,
       options: options,
       analyzeImpl: primaryImpl,
-      executionMode: config.executionMode,
     );
 
     final _RunStats primaryMeasured = await _executeRuns(
@@ -391,13 +445,12 @@ Future<_BenchmarkResult> _runBenchmark(_BenchmarkConfig config) async {
       analyzeImpl: primaryImpl,
       executionMode: config.executionMode,
     );
-    await _executeRuns(
+    await _runWarmup(
       analyzer: analyzer,
       sentences: sentences,
-      runs: config.warmupRuns,
+      config: config,
       options: options,
       analyzeImpl: secondaryImpl,
-      executionMode: config.executionMode,
     );
     final _RunStats secondaryMeasured = await _executeRuns(
       analyzer: analyzer,
@@ -426,6 +479,8 @@ Future<_BenchmarkResult> _runBenchmark(_BenchmarkConfig config) async {
     return _BenchmarkResult(
       platform: Platform.operatingSystem,
       warmupRuns: config.warmupRuns,
+      warmupMode: config.warmupMode,
+      warmup: warmup,
       measureRuns: config.measureRuns,
       topN: config.topN,
       numThreads: config.numThreads,
@@ -577,6 +632,92 @@ Future<_RunStats> _executeRuns({
   );
 }
 
+/// Warms up for a fixed pass count, or until per-pass throughput settles.
+///
+/// Adaptive mode runs one pass at a time and stops once the coefficient of
+/// variation over the last `warmupWindow` passes is at or below
+/// `warmupCvThreshold`, after at least `warmupRuns` passes.
+Future<_WarmupStats> _runWarmup({
+  required KiwiAnalyzer analyzer,
+  required List<_BenchmarkSentence> sentences,
+  required _BenchmarkConfig config,
+  required KiwiAnalyzeOptions options,
+  required String analyzeImpl,
+}) async {
+  if (config.warmupMode != _warmupModeAdaptive) {
+    await _executeRuns(
+      analyzer: analyzer,
+      sentences: sentences,
+      runs: config.warmupRuns,
+      options: options,
+      analyzeImpl: analyzeImpl,
+      executionMode: config.executionMode,
+    );
+    return _WarmupStats(
+      passes: config.warmupRuns,
+      converged: true,
+      finalCv: null,
+    );
+  }
+
+  final int minPasses = config.warmupRuns > config.warmupWindow
+      ? config.warmupRuns
+      : config.warmupWindow;
+  final List<double> passThroughputs = <double>[];
+  double? windowCv;
+  while (passThroughputs.length < config.warmupMaxRuns) {
+    final _RunStats stats = await _executeRuns(
+      analyzer: analyzer,
+      sentences: sentences,
+      runs: 1,
+      options: options,
+      analyzeImpl: analyzeImpl,
+      executionMode: config.executionMode,
+    );
+    passThroughputs.add(
+      _safeDivide(stats.totalAnalyses, stats.elapsedMs / 1000.0),
+    );
+    if (passThroughputs.length < config.warmupWindow) {
+      continue;
+    }
+    windowCv = _coefficientOfVariation(
+      passThroughputs.sublist(passThroughputs.length - config.warmupWindow),
+    );
+    if (passThroughputs.length >= minPasses &&
+        windowCv <= config.warmupCvThreshold) {
+      return _WarmupStats(
+        passes: passThroughputs.length,
+        converged: true,
+        finalCv: windowCv,
+      );
+    }
+  }
+  return _WarmupStats(
+    passes: passThroughputs.length,
+    converged: false,
+    finalCv: windowCv,
+  );
+}
+
+double _coefficientOfVariation(List<double> values) {
+  if (values.length < 2) {
+    return 0;
+  }
+  final double mean =
+      values.fold<double>(0, (double sum, double value) => sum + value) /
+      values.length;
+  if (mean <= 0) {
+    return 0;
+  }
+  final double variance =
+      values.fold<double>(
+        0,
+        (double sum, double value) => sum + (value - mean) * (value - mean),
+      ) /
+      (values.length - 1);
+  return sqrt(variance) / mean;
+}
+
 int _tokenCountOfBestCandidate(KiwiAnalyzeResult result) {
   if (result.candidates.isEmpty) {
     return 0;
@@ -640,6 +781,23 @@ int _parseInt(String rawValue, {required int fallback, required int minimum}) {
   return parsed;
 }
 
+double _parseDouble(String rawValue, {required double fallback}) {
+  final double? parsed = double.tryParse(rawValue);
+  if (parsed == null || parsed <= 0) {
+    return fallback;
+  }
+
+  return parsed;
+}
+
+String _parseWarmupMode(String rawValue) {
+  final String normalized = rawValue.trim().toLowerCase();
+  if (normalized == _warmupModeAdaptive) {
+    return _warmupModeAdaptive;
+  }
+  return _warmupModeFixed;
+}
+
 String _parseAnalyzeImpl(String rawValue) {
   final String normalized = rawValue.trim().toLowerCase();
   if (normalized == _analyzeImplTokenCount) {
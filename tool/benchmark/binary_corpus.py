@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Compile text corpora into a pre-tokenized binary form read through mmap.
+
+Layout (little-endian):
+
+- Header: magic, version, record size, sentence count, total chars,
+  payload bytes, source file bytes, source mtime (ns), source SHA-256.
+- Record table: one `(payload offset, byte length, char length)` per
+  sentence, so any sentence is reachable in O(1).
+- Payload: the stripped, non-blank lines as concatenated UTF-8.
+
+Lines are normalized exactly like `load_sentences` (stripped, blanks
+dropped), so a compiled corpus yields the same rows as its source without
+re-decoding, re-stripping or re-measuring anything at startup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import random
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator
+
+BINARY_CORPUS_SUFFIX = '.kcorp'
+BINARY_CORPUS_MAGIC = b'KWCORPUS'
+BINARY_CORPUS_VERSION = 2
+_HEADER = struct.Struct('<8sIIQQQQq32s')
+_RECORD = struct.Struct('<QII')
+
+
+def compile_corpus(source_path: Path, output_path: Path | None = None) -> Path:
+    """Write the binary form of `source_path` and return its path.
+
+    The source is read one line at a time and hashed incrementally; records
+    and payload are spooled to temporary files, so memory stays flat for
+    multi-GB corpora.
+    """
+    if not source_path.exists():
+        raise FileNotFoundError(f'Corpus not found: {source_path}')
+    output_path = output_path or compiled_path_for(source_path)
+    source_stat = source_path.stat()
+
+    digest = hashlib.sha256()
+    source_bytes = 0
+    payload_bytes = 0
+    total_chars = 0
+    sentence_count = 0
+    records = tempfile.TemporaryFile(dir=output_path.parent)
+    payload = tempfile.TemporaryFile(dir=output_path.parent)
+    with records, payload:
+        with source_path.open('rb') as source:
+            for raw_line in source:
+                digest.update(raw_line)
+                source_bytes += len(raw_line)
+                # `str.splitlines` also breaks on `\r`, `\x0c`, U+2028 etc.,
+                # matching `load_sentences` on the whole text.
+                for part in raw_line.decode('utf-8').splitlines():
+                    line = part.strip()
+                    if not line:
+                        continue
+                    encoded = line.encode('utf-8')
+                    records.write(
+                        _RECORD.pack(payload_bytes, len(encoded), len(line))
+                    )
+                    payload.write(encoded)
+                    payload_bytes += len(encoded)
+                    total_chars += len(line)
+                    sentence_count += 1
+        if not sentence_count:
+            raise ValueError(f'Corpus is empty: {source_path}')
+
+        header = _HEADER.pack(
+            BINARY_CORPUS_MAGIC,
+            BINARY_CORPUS_VERSION,
+            _RECORD.size,
+            sentence_count,
+            total_chars,
+            payload_bytes,
+            source_bytes,
+            source_stat.st_mtime_ns,
+            digest.digest(),
+        )
+        temp_path = output_path.with_name(output_path.name + '.tmp')
+        with temp_path.open('wb') as handle:
+            handle.write(header)
+            for spool in (records, payload):
+                spool.seek(0)
+                shutil.copyfileobj(spool, handle, 1 << 20)
+    temp_path.replace(output_path)
+    return output_path
+
+
+def compiled_path_for(source_path: Path) -> Path:
+    return source_path.with_name(source_path.name + BINARY_CORPUS_SUFFIX)
+
+
+def is_binary_corpus(path: Path) -> bool:
+    try:
+        with path.open('rb') as handle:
+            return handle.read(len(BINARY_CORPUS_MAGIC)) == BINARY_CORPUS_MAGIC
+    except OSError:
+        return False
+
+
+def open_compiled_corpus(path: Path) -> BinaryCorpus | None:
+    """Open `path` itself or its fresh `.kcorp` sibling, if either exists.
+
+    A sibling is trusted only while the source size and modification time
+    both match what was recorded at compile time, so any edit to the source
+    (even one that keeps its length) falls back to reading the text.
+    Siblings from an older format version are ignored the same way.
+    """
+    if is_binary_corpus(path):
+        return BinaryCorpus(path)
+    compiled_path = compiled_path_for(path)
+    if not path.exists() or not is_binary_corpus(compiled_path):
+        return None
+    try:
+        corpus = BinaryCorpus(compiled_path)
+    except ValueError:
+        return None
+    source_stat = path.stat()
+    if (
+        corpus.source_bytes != source_stat.st_size
+        or corpus.source_mtime_ns != source_stat.st_mtime_ns
+    ):
+        return None
+    return corpus
+
+
+class BinaryCorpus:
+    """Random-access `(sentence, char_count)` view over a compiled corpus.
+
+    Sentences are decoded straight from memoryview slices of the mapping,
+    so there is no intermediate bytes copy. Views over `[start, stop)`
+    share the file; pickling drops the mapping and the receiving process
+    reopens it lazily, so shards can be handed to spawned workers.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        self.path = path
+        self._mapped: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        header = self._header()
+        (
+            magic,
+            version,
+            record_size,
+            self.sentence_count,
+            self.total_chars,
+            self.payload_bytes,
+            self.source_bytes,
+            self.source_mtime_ns,
+            source_sha256,
+        ) = header
+        if magic != BINARY_CORPUS_MAGIC:
+            raise ValueError(f'Not a compiled corpus: {path}')
+        if version != BINARY_CORPUS_VERSION or record_size != _RECORD.size:
+            raise ValueError(
+                f'Unsupported compiled corpus version {version}: {path}. '
+                'Recompile it with binary_corpus.py.'
+            )
+        self.source_sha256 = source_sha256.hex()
+        self.start = start
+        self.stop = self.sentence_count if stop is None else min(
+            stop,
+            self.sentence_count,
+        )
+        self._payload_start = _HEADER.size + self.sentence_count * _RECORD.size
+
+    def _header(self) -> tuple[Any, ...]:
+        with self.path.open('rb') as handle:
+            raw = handle.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise ValueError(f'Truncated compiled corpus: {self.path}')
+        return _HEADER.unpack(raw)
+
+    @property
+    def view(self) -> memoryview:
+        if self._view is None:
+            with self.path.open('rb') as handle:
+                self._mapped = mmap.mmap(
+                    handle.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ,
+                )
+            self._view = memoryview(self._mapped)
+        return self._view
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_mapped'] = None
+        state['_view'] = None
+        return state
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def _decode(self, offset: int, byte_length: int) -> str:
+        begin = self._payload_start + offset
+        return str(self.view[begin : begin + byte_length], 'utf-8')
+
+    def __getitem__(self, index: int) -> tuple[str, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        offset, byte_length, char_length = _RECORD.unpack_from(
+            self.view,
+            _HEADER.size + (self.start + index) * _RECORD.size,
+        )
+        return self._decode(offset, byte_length), char_length
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        table_start = _HEADER.size + self.start * _RECORD.size
+        table_stop = _HEADER.size + self.stop * _RECORD.size
+        for offset, byte_length, char_length in _RECORD.iter_unpack(
+            self.view[table_start:table_stop]
+        ):
+            yield self._decode(offset, byte_length), char_length
+
+    def to_rows(self) -> list[tuple[str, int]]:
+        return list(self)
+
+    def shard(self, shard_count: int) -> list[BinaryCorpus]:
+        """Split into `shard_count` contiguous index ranges in O(1)."""
+        bounds = [
+            self.start + (len(self) * index) // shard_count
+            for index in range(shard_count + 1)
+        ]
+        return [
+            BinaryCorpus(self.path, bounds[index], bounds[index + 1])
+            for index in range(shard_count)
+        ]
+
+    def sample(self, count: int, *, seed: int) -> list[str]:
+        """Uniform sample without replacement through random access."""
+        indices = random.Random(seed).sample(
+            range(len(self)),
+            min(count, len(self)),
+        )
+        return [self[index][0] for index in indices]
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            'Compile text corpora (one sentence per line) into the binary '
+            f'`{BINARY_CORPUS_SUFFIX}` form that kiwipiepy_benchmark.py and '
+            'gold_corpus_compare.py mmap instead of re-parsing.'
+        )
+    )
+    parser.add_argument('sources', type=Path, nargs='+', help='Text corpora.')
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help=(
+            'Output path for a single source (default: '
+            f'`<source>{BINARY_CORPUS_SUFFIX}` next to each source).'
+        ),
+    )
+    args = parser.parse_args()
+    if args.output is not None and len(args.sources) != 1:
+        parser.error('--output requires exactly one source')
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    for source_path in args.sources:
+        output_path = compile_corpus(source_path, args.output)
+        corpus = BinaryCorpus(output_path)
+        print(
+            f'{source_path} -> {output_path} '
+            f'({corpus.sentence_count} sentences, {corpus.total_chars} chars, '
+            f'{output_path.stat().st_size} bytes)'
+        )
+        corpus.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,28 @@
+"""Percentile bootstrap confidence intervals shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import math
+import random
+
+
+def bootstrap_mean_ci(
+    values: list[float],
+    *,
+    resamples: int = 2000,
+    seed: int = 0,
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """Percentile bootstrap confidence interval for the mean of `values`."""
+    if len(values) < 2:
+        mean = values[0] if values else 0.0
+        return mean, mean
+    rng = random.Random(seed)
+    count = len(values)
+    means = sorted(
+        sum(rng.choices(values, k=count)) / count for _ in range(resamples)
+    )
+    tail = (1.0 - confidence) / 2.0
+    low_index = int(tail * (resamples - 1))
+    high_index = int(math.ceil((1.0 - tail) * (resamples - 1)))
+    return means[low_index], means[high_index]
@@ -10,6 +10,8 @@ import statistics
 from pathlib import Path
 from typing import Any
 
+from bootstrap_ci import bootstrap_mean_ci
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -178,6 +180,176 @@ def has_numeric_metric(trials: list[dict[str, Any]], key: str) -> bool:
     return any(isinstance(trial.get(key), (int, float)) for trial in trials)
 
 
+def format_optional_mean_std(
+    trials: list[dict[str, Any]],
+    key: str,
+    decimals: int = 2,
+) -> str:
+    if not has_numeric_metric(trials, key):
+        return '-'
+    mean, stddev = summarize_metric(trials, key)
+    return format_mean_std(mean, stddev, decimals=decimals)
+
+
+def format_bootstrap_ci(
+    trials: list[dict[str, Any]],
+    key: str,
+    *,
+    resamples: int = 2000,
+) -> str:
+    """Render a percentile-bootstrap 95% CI for the mean across trials."""
+    values = [
+        safe_float(trial, key)
+        for trial in trials
+        if isinstance(trial.get(key), (int, float))
+    ]
+    if len(values) < 2:
+        return '-'
+    low, high = bootstrap_mean_ci(values, resamples=resamples)
+    mean = statistics.fmean(values)
+    half_width_percent = safe_divide((high - low) / 2.0, mean) * 100.0
+    return f'{low:.2f} – {high:.2f} (±{half_width_percent:.2f}%)'
+
+
+def format_int_range(trials: list[dict[str, Any]], key: str) -> str:
+    values = [
+        int(trial[key])
+        for trial in trials
+        if isinstance(trial.get(key), (int, float))
+    ]
+    if not values:
+        return '-'
+    if min(values) == max(values):
+        return str(values[0])
+    return f'{min(values)}-{max(values)}'
+
+
+def format_mib(value: object) -> str:
+    if not isinstance(value, (int, float)):
+        return '-'
+    return f'{value / (1024 * 1024):.2f}'
+
+
+def format_optional_mib(trials: list[dict[str, Any]], key: str) -> str:
+    if not has_numeric_metric(trials, key):
+        return '-'
+    values = [
+        float(trial[key]) / (1024 * 1024)
+        for trial in trials
+        if isinstance(trial.get(key), (int, float))
+    ]
+    mean = statistics.fmean(values)
+    stddev = statistics.stdev(values) if len(values) > 1 else 0.0
+    return format_mean_std(mean, stddev)
+
+
+def first_memory_breakdown(trials: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    for trial in trials:
+        raw = trial.get('memory_breakdown')
+        if isinstance(raw, list) and raw:
+            return [item for item in raw if isinstance(item, dict)]
+    return []
+
+
+def summarize_length_buckets(
+    trials: list[dict[str, Any]],
+    dimension: str,
+) -> dict[str, dict[str, float]]:
+    """Average per-bucket metrics across trials, keeping bucket order."""
+    collected: dict[str, list[dict[str, Any]]] = {}
+    for trial in trials:
+        raw = trial.get('length_buckets')
+        if not isinstance(raw, dict):
+            continue
+        rows = raw.get(dimension)
+        if not isinstance(rows, list):
+            continue
+        for row in rows:
+            if isinstance(row, dict) and 'bucket' in row:
+                collected.setdefault(str(row['bucket']), []).append(row)
+
+    metrics = (
+        'count',
+        'chars_per_sec',
+        'tokens_per_sec',
+        'latency_p50_ms',
+        'latency_p95_ms',
+        'latency_p99_ms',
+    )
+    return {
+        label: {
+            metric: statistics.fmean(safe_float(row, metric) for row in rows)
+            for metric in metrics
+        }
+        for label, rows in collected.items()
+    }
+
+
+def collect_cold_start_values(
+    trials: list[dict[str, Any]],
+) -> dict[str, dict[str, list[float]]]:
+    """Pool raw cold-start phase samples per page-cache state."""
+    pooled: dict[str, dict[str, list[float]]] = {}
+    for trial in trials:
+        series = trial.get('cold_start')
+        if not isinstance(series, dict):
+            continue
+        for cache_state, phases in series.items():
+            if not isinstance(phases, dict):
+                continue
+            target = pooled.setdefault(str(cache_state), {})
+            for phase, summary in phases.items():
+                if not isinstance(summary, dict):
+                    continue
+                values = summary.get('values')
+                if isinstance(values, list):
+                    target.setdefault(phase, []).extend(
+                        float(value)
+                        for value in values
+                        if isinstance(value, (int, float))
+                    )
+    return pooled
+
+
+def collect_api_series(
+    trials: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Group `--analyze-impl-sweep` rows by API path across trials."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for trial in trials:
+        series = trial.get('api_series')
+        if not isinstance(series, list):
+            continue
+        for row in series:
+            if isinstance(row, dict) and row.get('analyze_impl'):
+                grouped.setdefault(str(row['analyze_impl']), []).append(row)
+    return grouped
+
+
+def collect_document_levels(
+    trials: list[dict[str, Any]],
+) -> dict[float, list[dict[str, Any]]]:
+    """Group document-mode levels by target size across trials."""
+    grouped: dict[float, list[dict[str, Any]]] = {}
+    for trial in trials:
+        levels = trial.get('document_levels')
+        if not isinstance(levels, list):
+            continue
+        for level in levels:
+            if isinstance(level, dict) and 'target_kb' in level:
+                grouped.setdefault(safe_float(level, 'target_kb'), []).append(
+                    level
+                )
+    return dict(sorted(grouped.items()))
+
+
+def format_noise_score(trial: dict[str, Any]) -> str:
+    score = trial.get('noise_score')
+    if not isinstance(score, (int, float)):
+        return '-'
+    return f"{score:.2f}{' (flagged)' if trial.get('noise_flagged') else ''}"
+
+
 def md_escape(value: object) -> str:
     return str(value).replace('|', '\\|').replace('\n', ' ')
 
@@ -243,6 +415,14 @@ def build_report(
         f"| warmup_runs | {first_or_mixed(flutter_trials, 'warmup_runs')}"
         f" | {first_or_mixed(kiwi_trials, 'warmup_runs')} |"
     )
+    lines.append(
+        f"| warmup_mode | {first_or_mixed(flutter_trials, 'warmup_mode')}"
+        f" | {first_or_mixed(kiwi_trials, 'warmup_mode')} |"
+    )
+    lines.append(
+        f"| warmup passes (min-max) | {format_int_range(flutter_trials, 'warmup_passes')}"
+        f" | {format_int_range(kiwi_trials, 'warmup_passes')} |"
+    )
     lines.append(
         f"| measure_runs | {first_or_mixed(flutter_trials, 'measure_runs')}"
         f" | {first_or_mixed(kiwi_trials, 'measure_runs')} |"
@@ -269,12 +449,26 @@ def build_report(
     )
     lines.append(
         f"| execution_mode | {first_or_mixed(flutter_trials, 'execution_mode')}"
-        " | - |"
+        f" | {first_or_mixed(kiwi_trials, 'execution_mode')} |"
     )
     lines.append(
         f"| num_threads / num_workers | {first_or_mixed(flutter_trials, 'num_threads')}"
         f" | {first_or_mixed(kiwi_trials, 'num_workers')} |"
     )
+    if any('backend' in trial for trial in kiwi_trials):
+        lines.append(f"| backend | - | {first_or_mixed(kiwi_trials, 'backend')} |")
+    if any('corpus_format' in trial for trial in kiwi_trials):
+        load_ms = format_optional_mean_std(kiwi_trials, 'corpus_load_ms')
+        lines.append(
+            '| corpus_format / load_ms | - '
+            f"| {first_or_mixed(kiwi_trials, 'corpus_format')} / {load_ms} |"
+        )
+    if any('cpu_affinity' in trial for trial in kiwi_trials):
+        lines.append(
+            '| cpu_affinity / isolate | - '
+            f"| {first_or_mixed(kiwi_trials, 'cpu_affinity')}"
+            f" / {first_or_mixed(kiwi_trials, 'isolate')} |"
+        )
     lines.append('')
     flutter_impl = first_or_mixed(flutter_trials, 'analyze_impl')
     kiwi_impl = first_or_mixed(kiwi_trials, 'analyze_impl')
@@ -284,6 +478,67 @@ def build_report(
             'table is not a strict apples-to-apples API-path comparison.'
         )
         lines.append('')
+    flutter_mode = first_or_mixed(flutter_trials, 'execution_mode')
+    kiwi_mode = first_or_mixed(kiwi_trials, 'execution_mode')
+    if flutter_mode != '-' and kiwi_mode != '-' and flutter_mode != kiwi_mode:
+        lines.append(
+            '> Caution: `execution_mode` differs between runtimes (Flutter '
+            f'`{flutter_mode}`, kiwipiepy `{kiwi_mode}`), so throughput mixes '
+            'per-call and batched dispatch costs.'
+        )
+        lines.append('')
+    unconverged = [
+        runtime
+        for runtime, trials in (
+            ('Flutter', flutter_trials),
+            ('kiwipiepy', kiwi_trials),
+        )
+        if any(trial.get('warmup_converged') is False for trial in trials)
+    ]
+    if unconverged:
+        lines.append(
+            '> Caution: adaptive warm-up hit its pass cap before throughput '
+            f"settled for {' and '.join(unconverged)}, so measured passes may "
+            'still include warm-up drift.'
+        )
+        lines.append('')
+    if any(trial.get('backend') == 'fake' for trial in kiwi_trials):
+        lines.append(
+            '> Caution: kiwipiepy trials ran on the deterministic fake backend '
+            'with synthetic cost, so its columns validate the pipeline and '
+            'harness overhead, not kiwipiepy performance.'
+        )
+        lines.append('')
+    noisy_trials = [
+        (index + 1, trial)
+        for index, trial in enumerate(kiwi_trials)
+        if trial.get('noise_flagged')
+    ]
+    if noisy_trials:
+        reasons = sorted(
+            {
+                str(reason)
+                for _, trial in noisy_trials
+                for reason in trial.get('noise_reasons') or []
+            }
+        )
+        lines.append(
+            f'> Caution: {len(noisy_trials)} of {len(kiwi_trials)} kiwipiepy '
+            'trials started on a noisy host (trial '
+            f"{', '.join(str(index) for index, _ in noisy_trials)}"
+            f"{': ' + '; '.join(reasons) if reasons else ''}). Treat their "
+            'throughput as untrustworthy; rerun with `--cpu-affinity`/'
+            '`--isolate` on a quiet machine.'
+        )
+        lines.append('')
+    kiwi_profile = first_or_mixed(kiwi_trials, 'profile_mode')
+    if kiwi_profile != '-':
+        lines.append(
+            f'> Caution: kiwipiepy ran under `--profile {kiwi_profile}`, so its '
+            'measured phase includes profiler overhead. Use the profile '
+            'artifacts for hot spots, not for throughput comparison.'
+        )
+        lines.append('')
     flutter_platform = first_or_mixed(flutter_trials, 'platform').lower()
     kiwi_platform = first_or_mixed(kiwi_trials, 'platform').lower()
     if (
@@ -343,8 +598,19 @@ def build_report(
         ),
     ]
 
+    # `--document-sizes-kb` runs report per-level rows only, so kiwipiepy
+    # has no closed-loop throughput to put next to Flutter's.
+    kiwi_closed_loop = has_numeric_metric(kiwi_trials, 'analyses_per_sec')
+
     lines.append('## Warm Path Comparison (Primary, Init Excluded)')
     lines.append('')
+    if not kiwi_closed_loop:
+        lines.append(
+            '> Note: kiwipiepy ran the document-scaling task, which has no '
+            'closed-loop throughput; its columns here are `-`. See '
+            '"kiwipiepy Document Scaling" below.'
+        )
+        lines.append('')
     lines.append(
         '| Metric | flutter_kiwi_nlp (mean ± std) '
         '| kiwipiepy (mean ± std) | Ratio (Flutter mean / Kiwi mean) |'
@@ -353,13 +619,102 @@ def build_report(
 
     for key, label, inverse in warm_metric_specs:
         flutter_mean, flutter_std = summarize_metric(flutter_trials, key)
-        kiwi_mean, kiwi_std = summarize_metric(kiwi_trials, key)
+        kiwi_mean, _ = summarize_metric(kiwi_trials, key)
         lines.append(
             f'| {label} | {format_mean_std(flutter_mean, flutter_std)} '
-            f'| {format_mean_std(kiwi_mean, kiwi_std)} '
+            f'| {format_optional_mean_std(kiwi_trials, key)} '
             f'| {format_ratio(flutter_mean, kiwi_mean, inverse=inverse)} |'
         )
 
+    lines.append('')
+    lines.append('## Measurement Precision')
+    lines.append('')
+    lines.append('| Metric | flutter_kiwi_nlp | kiwipiepy |')
+    lines.append('| --- | ---: | ---: |')
+    lines.append(
+        '| Trial throughput 95% CI (analyses/s) '
+        f"| {format_bootstrap_ci(flutter_trials, 'analyses_per_sec')} "
+        f"| {format_bootstrap_ci(kiwi_trials, 'analyses_per_sec')} |"
+    )
+    if has_numeric_metric(kiwi_trials, 'ci_half_width_percent'):
+        half_width_mean, _ = summarize_metric(kiwi_trials, 'ci_half_width_percent')
+        passes_mean, _ = summarize_metric(kiwi_trials, 'measured_passes')
+        lines.append(
+            f'| Per-pass CI half-width within trial | - '
+            f'| ±{half_width_mean:.2f}% |'
+        )
+        lines.append(f'| Measured passes per trial (mean) | - | {passes_mean:.1f} |')
+        lines.append(
+            '| Pass stopping rule '
+            f"| - | {first_or_mixed(kiwi_trials, 'ci_stop_reason')} |"
+        )
+    if has_numeric_metric(kiwi_trials, 'gc_time_share'):
+        share_mean, share_std = summarize_metric(kiwi_trials, 'gc_time_share')
+        lines.append(f"| GC mode | - | {first_or_mixed(kiwi_trials, 'gc_mode')} |")
+        lines.append(
+            '| GC pause share of measured time | - '
+            f'| {share_mean * 100.0:.2f}% ± {share_std * 100.0:.2f}% |'
+        )
+        lines.append(
+            '| GC collections per trial (gen0/gen1/gen2) | - '
+            f"| {format_optional_mean_std(kiwi_trials, 'gc_gen0_collections', 1)}"
+            f" / {format_optional_mean_std(kiwi_trials, 'gc_gen1_collections', 1)}"
+            f" / {format_optional_mean_std(kiwi_trials, 'gc_gen2_collections', 1)} |"
+        )
+        lines.append(
+            '| Max GC pause (ms) | - '
+            f"| {format_optional_mean_std(kiwi_trials, 'gc_pause_max_ms', 3)} |"
+        )
+    lines.append('')
+    lines.append(
+        '> Percentile bootstrap over trial means. Ratios whose CIs overlap '
+        'heavily are within measurement noise.'
+    )
+
+    tail_latency_specs: list[tuple[str, str]] = [
+        ('latency_p50_ms', 'p50 warm latency (ms)'),
+        ('latency_p95_ms', 'p95 warm latency (ms)'),
+        ('latency_p99_ms', 'p99 warm latency (ms)'),
+        ('latency_p999_ms', 'p99.9 warm latency (ms)'),
+        ('latency_max_ms', 'Max warm latency (ms)'),
+    ]
+    if any(
+        has_numeric_metric(flutter_trials, key)
+        or has_numeric_metric(kiwi_trials, key)
+        for key, _ in tail_latency_specs
+    ):
+        lines.append('')
+        lines.append('## Warm Latency Tail (Per Analysis)')
+        lines.append('')
+        lines.append(
+            '| Metric | flutter_kiwi_nlp (mean ± std) '
+            '| kiwipiepy (mean ± std) |'
+        )
+        lines.append('| --- | ---: | ---: |')
+        lines.append(
+            '| Avg warm latency (ms) '
+            f"| {format_optional_mean_std(flutter_trials, 'avg_latency_ms', 4)} "
+            f"| {format_optional_mean_std(kiwi_trials, 'avg_latency_ms', 4)} |"
+        )
+        for key, label in tail_latency_specs:
+            lines.append(
+                f'| {label} '
+                f'| {format_optional_mean_std(flutter_trials, key, 4)} '
+                f'| {format_optional_mean_std(kiwi_trials, key, 4)} |'
+            )
+        lines.append('')
+        if first_or_mixed(kiwi_trials, 'latency_scope') == 'batch':
+            lines.append(
+                '> kiwipiepy ran in batch mode, so its percentiles are per '
+                'iterable API call (one chunk), not per sentence.'
+            )
+            lines.append('')
+        lines.append(
+            '> Percentiles come from a log-bucketed per-analysis histogram '
+            '(bucket upper bound, ~5% relative error). `-` means the runtime '
+            'did not report per-analysis latency.'
+        )
+
     if has_numeric_metric(flutter_trials, 'pure_analyses_per_sec'):
         flutter_pure_mean, flutter_pure_std = summarize_metric(
             flutter_trials,
@@ -369,10 +724,7 @@ def build_report(
             flutter_trials,
             'full_analyses_per_sec',
         )
-        kiwi_api_mean, kiwi_api_std = summarize_metric(
-            kiwi_trials,
-            'analyses_per_sec',
-        )
+        kiwi_api_mean, _ = summarize_metric(kiwi_trials, 'analyses_per_sec')
         boundary_loss_percent = max(
             0.0,
             1.0 - safe_divide(flutter_full_mean, flutter_pure_mean)
@@ -393,8 +745,30 @@ def build_report(
         )
         lines.append(
             f'| kiwipiepy current API path (`{kiwi_impl}`) '
-            f'| {format_mean_std(kiwi_api_mean, kiwi_api_std)} |'
+            f"| {format_optional_mean_std(kiwi_trials, 'analyses_per_sec')} |"
         )
+        has_kiwi_layers = has_numeric_metric(kiwi_trials, 'pure_analyses_per_sec')
+        if has_kiwi_layers:
+            kiwi_pure_mean, kiwi_pure_std = summarize_metric(
+                kiwi_trials,
+                'pure_analyses_per_sec',
+            )
+            kiwi_full_mean, kiwi_full_std = summarize_metric(
+                kiwi_trials,
+                'full_analyses_per_sec',
+            )
+            kiwi_overhead_mean, _ = summarize_metric(
+                kiwi_trials,
+                'python_overhead_percent',
+            )
+            lines.append(
+                f'| kiwipiepy pure (native `{kiwi_impl}` call) '
+                f'| {format_mean_std(kiwi_pure_mean, kiwi_pure_std)} |'
+            )
+            lines.append(
+                '| kiwipiepy full (+ extraction and `form/tag` formatting) '
+                f'| {format_mean_std(kiwi_full_mean, kiwi_full_std)} |'
+            )
         lines.append('')
         lines.append('| Derived ratio | Value |')
         lines.append('| --- | ---: |')
@@ -410,6 +784,19 @@ def build_report(
             '| Flutter boundary loss (full vs pure) '
             f'| {boundary_loss_percent:.2f}% |'
         )
+        if has_kiwi_layers:
+            lines.append(
+                '| Flutter pure / kiwi pure '
+                f'| {format_ratio(flutter_pure_mean, kiwi_pure_mean)} |'
+            )
+            lines.append(
+                '| Flutter full / kiwi full '
+                f'| {format_ratio(flutter_full_mean, kiwi_full_mean)} |'
+            )
+            lines.append(
+                '| kiwipiepy Python-side overhead (full vs pure) '
+                f'| {kiwi_overhead_mean:.2f}% |'
+            )
         lines.append('')
 
         if (
@@ -444,6 +831,346 @@ def build_report(
         f'| {format_ratio(flutter_init_median, kiwi_init_median, inverse=True)} |'
     )
 
+    for dimension, title in (
+        ('chars', 'Character Length'),
+        ('eojeols', 'Eojeol Count'),
+    ):
+        flutter_buckets = summarize_length_buckets(flutter_trials, dimension)
+        kiwi_buckets = summarize_length_buckets(kiwi_trials, dimension)
+        if not flutter_buckets and not kiwi_buckets:
+            continue
+        labels = list(flutter_buckets)
+        labels.extend(label for label in kiwi_buckets if label not in labels)
+        lines.append('')
+        lines.append(f'## Length-Bucketed Breakdown ({title})')
+        lines.append('')
+        if not flutter_buckets:
+            lines.append(
+                '> Note: flutter_kiwi_nlp has no rows here because '
+                '`benchmark_main.dart` times whole passes, not single '
+                'analyses; only kiwipiepy is bucketed.'
+            )
+            lines.append('')
+        lines.append(
+            '| Bucket | Runtime | Analyses | chars/s | tokens/s '
+            '| p50 (ms) | p95 (ms) | p99 (ms) |'
+        )
+        lines.append('| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |')
+        for label in labels:
+            for runtime, buckets in (
+                ('flutter_kiwi_nlp', flutter_buckets),
+                ('kiwipiepy', kiwi_buckets),
+            ):
+                bucket = buckets.get(label)
+                if bucket is None:
+                    continue
+                lines.append(
+                    f'| {label} | {runtime} '
+                    f"| {bucket['count']:.0f} "
+                    f"| {bucket['chars_per_sec']:.2f} "
+                    f"| {bucket['tokens_per_sec']:.2f} "
+                    f"| {bucket['latency_p50_ms']:.4f} "
+                    f"| {bucket['latency_p95_ms']:.4f} "
+                    f"| {bucket['latency_p99_ms']:.4f} |"
+                )
+
+    if has_numeric_metric(
+        flutter_trials,
+        'cost_per_char_us',
+    ) or has_numeric_metric(kiwi_trials, 'cost_per_char_us'):
+        lines.append('')
+        lines.append('### Fitted Cost vs Length')
+        lines.append('')
+        lines.append(
+            '| Fit | flutter_kiwi_nlp (mean ± std) | kiwipiepy (mean ± std) |'
+        )
+        lines.append('| --- | ---: | ---: |')
+        for key, label, decimals in (
+            ('cost_per_char_us', 'Slope (us per char)', 4),
+            ('cost_intercept_us', 'Intercept (us per analysis)', 2),
+            ('cost_fit_r2', 'Linear fit R²', 3),
+            ('cost_length_exponent', 'Log-log exponent (>1 superlinear)', 3),
+        ):
+            lines.append(
+                f'| {label} '
+                f'| {format_optional_mean_std(flutter_trials, key, decimals)} '
+                f'| {format_optional_mean_std(kiwi_trials, key, decimals)} |'
+            )
+
+    if has_numeric_metric(kiwi_trials, 'cache_hit_rate'):
+        uncached_values = [
+            safe_float(
+                trial.get('cache_comparison') or {},
+                'uncached_analyses_per_sec',
+            )
+            for trial in kiwi_trials
+        ]
+        uncached_mean = statistics.fmean(uncached_values)
+        uncached_std = (
+            statistics.stdev(uncached_values) if len(uncached_values) > 1 else 0.0
+        )
+        cached_mean, cached_std = summarize_metric(kiwi_trials, 'analyses_per_sec')
+        hit_rate_mean, _ = summarize_metric(kiwi_trials, 'cache_hit_rate')
+        lines.append('')
+        lines.append('## kiwipiepy Analysis Cache')
+        lines.append('')
+        lines.append('| Metric | Value |')
+        lines.append('| --- | ---: |')
+        lines.append(
+            f"| Cache size / TTL (s) | {first_or_mixed(kiwi_trials, 'cache_size')}"
+            f" / {first_or_mixed(kiwi_trials, 'cache_ttl_seconds')} |"
+        )
+        lines.append(
+            '| Replay duplicate rate '
+            f"| {first_or_mixed(kiwi_trials, 'replay_duplicate_rate')} |"
+        )
+        lines.append(f'| Hit rate | {hit_rate_mean * 100.0:.2f}% |')
+        lines.append(
+            '| Uncached throughput (analyses/s) '
+            f'| {format_mean_std(uncached_mean, uncached_std)} |'
+        )
+        lines.append(
+            '| Cached throughput (analyses/s) '
+            f'| {format_mean_std(cached_mean, cached_std)} |'
+        )
+        lines.append(
+            '| Cache speedup '
+            f'| {format_ratio(cached_mean, uncached_mean)} |'
+        )
+
+    api_series = collect_api_series(kiwi_trials)
+    if api_series:
+        lines.append('')
+        lines.append('## kiwipiepy API Coverage')
+        lines.append('')
+        lines.append(
+            '> Each API path ran on one shared `Kiwi` over the same corpus. '
+            '`Units/s` counts the row\'s output unit, so compare it only '
+            'between rows with the same unit.'
+        )
+        lines.append('')
+        lines.append(
+            '| API | Output unit | Calls/s (mean ± std) | Units/s (mean ± std) '
+            '| Latency p50 (ms) | Latency p95 (ms) | Latency p99 (ms) |'
+        )
+        lines.append('| --- | --- | ---: | ---: | ---: | ---: | ---: |')
+        for analyze_impl, rows in api_series.items():
+            calls_mean, calls_std = summarize_metric(rows, 'analyses_per_sec')
+            units_mean, units_std = summarize_metric(rows, 'tokens_per_sec')
+            lines.append(
+                f'| `{md_escape(analyze_impl)}` '
+                f"| {first_or_mixed(rows, 'output_unit')} "
+                f'| {format_mean_std(calls_mean, calls_std)} '
+                f'| {format_mean_std(units_mean, units_std)} '
+                f"| {format_optional_mean_std(rows, 'latency_p50_ms', 3)} "
+                f"| {format_optional_mean_std(rows, 'latency_p95_ms', 3)} "
+                f"| {format_optional_mean_std(rows, 'latency_p99_ms', 3)} |"
+            )
+
+    document_levels = collect_document_levels(kiwi_trials)
+    if document_levels:
+        lines.append('')
+        lines.append('## kiwipiepy Document Scaling')
+        lines.append('')
+        lines.append(
+            f"> Source: {first_or_mixed(kiwi_trials, 'document_source')}. "
+            '`whole` analyzes each document in one call; `split` runs '
+            '`split_into_sents` and analyzes each sentence, with the split '
+            'inside the timed region.'
+        )
+        lines.append('')
+        lines.append(
+            '| Target (KiB) | Mean bytes | Whole latency (ms) '
+            '| Split latency (ms) | Whole p99 (ms) | Split p99 (ms) '
+            '| Whole ms/KiB | Split ms/KiB | Whole speedup vs split (x) '
+            '| Whole peak RSS delta (MiB) | Split peak RSS delta (MiB) |'
+        )
+        lines.append(
+            '| ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: '
+            '| ---: | ---: |'
+        )
+        for target_kb, levels in document_levels.items():
+            bytes_mean, _ = summarize_metric(levels, 'mean_document_bytes')
+            lines.append(
+                f'| {target_kb:g} '
+                f'| {bytes_mean:.0f} '
+                f"| {format_optional_mean_std(levels, 'whole_avg_latency_ms', 3)} "
+                f"| {format_optional_mean_std(levels, 'split_avg_latency_ms', 3)} "
+                f"| {format_optional_mean_std(levels, 'whole_latency_p99_ms', 3)} "
+                f"| {format_optional_mean_std(levels, 'split_latency_p99_ms', 3)} "
+                f"| {format_optional_mean_std(levels, 'whole_ms_per_kb', 3)} "
+                f"| {format_optional_mean_std(levels, 'split_ms_per_kb', 3)} "
+                f"| {format_optional_mean_std(levels, 'whole_vs_split_speedup')} "
+                f"| {format_optional_mib(levels, 'whole_peak_rss_delta_bytes')} "
+                f"| {format_optional_mib(levels, 'split_peak_rss_delta_bytes')} |"
+            )
+        lines.append('')
+        lines.append(
+            '- Latency-vs-size exponent (whole / split): '
+            f"{format_optional_mean_std(kiwi_trials, 'whole_latency_exponent')} / "
+            f"{format_optional_mean_std(kiwi_trials, 'split_latency_exponent')}"
+        )
+        lines.append(
+            '- Largest whole-document size within '
+            f"{first_or_mixed(kiwi_trials, 'document_cost_growth_limit')}x of "
+            'the cheapest per-KiB cost: '
+            f"{first_or_mixed(kiwi_trials, 'max_whole_document_kb')} KiB"
+        )
+
+    if has_numeric_metric(kiwi_trials, 'harness_floor_per_analysis_us'):
+        gross_mean, gross_std = summarize_metric(kiwi_trials, 'analyses_per_sec')
+        floor_us = format_optional_mean_std(
+            kiwi_trials,
+            'harness_floor_per_analysis_us',
+            3,
+        )
+        floor_share, _ = summarize_metric(kiwi_trials, 'harness_floor_share')
+        lines.append('')
+        lines.append('## kiwipiepy Harness Overhead')
+        lines.append('')
+        lines.append('| Metric | kiwipiepy (mean ± std) |')
+        lines.append('| --- | ---: |')
+        lines.append(f'| Harness floor per analysis (us) | {floor_us} |')
+        lines.append(
+            f'| Harness share of measured time | {floor_share * 100.0:.2f}% |'
+        )
+        lines.append(
+            '| Gross throughput (analyses/s) '
+            f'| {format_mean_std(gross_mean, gross_std)} |'
+        )
+        lines.append(
+            '| Net throughput, floor subtracted (analyses/s) '
+            f"| {format_optional_mean_std(kiwi_trials, 'net_analyses_per_sec')} |"
+        )
+        lines.append(
+            '| Net avg latency (ms) '
+            f"| {format_optional_mean_std(kiwi_trials, 'net_avg_latency_ms', 4)} |"
+        )
+        lines.append('')
+        lines.append(
+            '> The floor replays the measured loop against a no-op analyzer '
+            'that returns empty results. Headline tables stay gross; net '
+            'figures estimate analyzer-only cost.'
+        )
+
+    cpu_specs: list[tuple[str, str, int]] = [
+        ('cpu_user_seconds', 'User CPU (s)', 3),
+        ('cpu_system_seconds', 'System CPU (s)', 3),
+        ('cpu_seconds_per_1k_analyses', 'CPU-seconds per 1k analyses', 4),
+        ('cpu_seconds_per_mb', 'CPU-seconds per MB of text', 3),
+        ('avg_cores_busy', 'Average cores busy', 2),
+        ('cpu_main_thread_seconds', 'Main thread CPU (s)', 3),
+        ('cpu_other_threads_seconds', 'Other threads CPU (s)', 3),
+        ('cpu_threads_busy', 'Threads with CPU time', 1),
+    ]
+    if has_numeric_metric(kiwi_trials, 'cpu_seconds'):
+        lines.append('')
+        lines.append('## kiwipiepy CPU Cost (Measured Phase)')
+        lines.append('')
+        lines.append('| Metric | kiwipiepy (mean ± std) |')
+        lines.append('| --- | ---: |')
+        for key, label, decimals in cpu_specs:
+            if has_numeric_metric(kiwi_trials, key):
+                lines.append(
+                    f'| {label} '
+                    f'| {format_optional_mean_std(kiwi_trials, key, decimals)} |'
+                )
+        lines.append('')
+        lines.append(
+            '> `Average cores busy` is CPU-seconds over wall-clock seconds. '
+            'A throughput gain that raises it proportionally comes from '
+            'parallelism, not efficiency.'
+        )
+
+    memory_specs: list[tuple[str, str]] = [
+        ('rss_before_init_bytes', 'RSS before init (MiB)'),
+        ('rss_after_init_bytes', 'RSS after init (MiB)'),
+        ('init_rss_delta_bytes', 'Model load RSS delta (MiB)'),
+        ('peak_rss_measure_bytes', 'Peak RSS during measurement (MiB)'),
+        ('peak_rss_process_bytes', 'Process peak RSS (MiB)'),
+    ]
+    if any(
+        has_numeric_metric(flutter_trials, key)
+        or has_numeric_metric(kiwi_trials, key)
+        for key, _ in memory_specs
+    ):
+        lines.append('')
+        lines.append('## Memory')
+        lines.append('')
+        lines.append(
+            '| Metric | flutter_kiwi_nlp (mean ± std) '
+            '| kiwipiepy (mean ± std) |'
+        )
+        lines.append('| --- | ---: | ---: |')
+        for key, label in memory_specs:
+            lines.append(
+                f'| {label} '
+                f'| {format_optional_mib(flutter_trials, key)} '
+                f'| {format_optional_mib(kiwi_trials, key)} |'
+            )
+        alloc_key = 'py_alloc_peak_per_analysis_bytes_mean'
+        if has_numeric_metric(kiwi_trials, alloc_key):
+            lines.append(
+                '| Python alloc peak per analysis (bytes) | - '
+                f'| {format_optional_mean_std(kiwi_trials, alloc_key, 0)} |'
+            )
+
+    breakdown = first_memory_breakdown(kiwi_trials)
+    if breakdown:
+        lines.append('')
+        lines.append('### kiwipiepy Model Load Memory by Build Option')
+        lines.append('')
+        lines.append(
+            '| Variant | build_options | model_type | default | typo | multi '
+            '| Init (ms) | RSS delta (MiB) | vs model only (MiB) |'
+        )
+        lines.append('| --- | ---: | --- | --- | --- | --- | ---: | ---: | ---: |')
+        for row in breakdown:
+            lines.append(
+                f"| {md_escape(row.get('label', ''))} "
+                f"| {row.get('build_options', '-')} "
+                f"| {row.get('model_type', '-')} "
+                f"| {row.get('load_default_dict', '-')} "
+                f"| {row.get('load_typo_dict', '-')} "
+                f"| {row.get('load_multi_dict', '-')} "
+                f"| {safe_float(row, 'init_ms'):.2f} "
+                f"| {format_mib(row.get('init_rss_delta_bytes'))} "
+                f"| {format_mib(row.get('rss_delta_vs_model_only_bytes'))} |"
+            )
+
+    cold_start_series = collect_cold_start_values(kiwi_trials)
+    if cold_start_series:
+        lines.append('')
+        lines.append('### kiwipiepy Cold-Start Decomposition (Fresh Interpreters)')
+        lines.append('')
+        lines.append(
+            '| Phase | Page cache | Runs | median (ms) | p95 (ms) |'
+        )
+        lines.append('| --- | --- | ---: | ---: | ---: |')
+        for phase, label in (
+            ('interpreter_start_ms', 'Interpreter start'),
+            ('import_ms', '`from kiwipiepy import Kiwi`'),
+            ('construct_ms', '`Kiwi(...)` construction'),
+            ('first_analyze_ms', 'First analysis'),
+            ('total_ms', 'Total (launch to exit)'),
+        ):
+            for cache_state, phases in cold_start_series.items():
+                values = phases.get(phase, [])
+                if not values:
+                    continue
+                lines.append(
+                    f'| {label} | {cache_state} | {len(values)} '
+                    f'| {statistics.median(values):.2f} '
+                    f'| {percentile(values, 0.95):.2f} |'
+                )
+        drop_status = first_or_mixed(kiwi_trials, 'cold_start_page_cache_drop')
+        if drop_status not in ('dropped', 'not_requested', '-'):
+            lines.append('')
+            lines.append(
+                f'> Page cache drop status: `{drop_status}`; dropped-cache '
+                'rows may be missing or incomplete.'
+            )
+
     session_lengths = [1, 10, 100, 1000]
     lines.append('')
     lines.append('## Session-Length Effective Throughput (Init Included)')
@@ -468,10 +1195,15 @@ def build_report(
                 analysis_count=session_analyses,
             )
         )
+        kiwi_effective = (
+            format_mean_std(kiwi_effective_mean, kiwi_effective_std)
+            if kiwi_closed_loop
+            else '-'
+        )
         lines.append(
             f'| {session_analyses} '
             f'| {format_mean_std(flutter_effective_mean, flutter_effective_std)} '
-            f'| {format_mean_std(kiwi_effective_mean, kiwi_effective_std)} '
+            f'| {kiwi_effective} '
             f'| {format_ratio(flutter_effective_mean, kiwi_effective_mean)} |'
         )
 
@@ -480,19 +1212,25 @@ def build_report(
     lines.append('')
     lines.append(
         '| Trial | Flutter init (ms) | Kiwi init (ms) '
-        '| Flutter warm analyses/s | Kiwi warm analyses/s |'
+        '| Flutter warm analyses/s | Kiwi warm analyses/s | Kiwi noise score |'
     )
-    lines.append('| ---: | ---: | ---: | ---: | ---: |')
+    lines.append('| ---: | ---: | ---: | ---: | ---: | ---: |')
 
     min_trials = min(len(flutter_trials), len(kiwi_trials))
     for index in range(min_trials):
         flutter_trial = flutter_trials[index]
         kiwi_trial = kiwi_trials[index]
+        kiwi_warm = (
+            f"{safe_float(kiwi_trial, 'analyses_per_sec'):.2f}"
+            if kiwi_closed_loop
+            else '-'
+        )
         lines.append(
             f"| {index + 1} | {safe_float(flutter_trial, 'init_ms'):.2f}"
             f" | {safe_float(kiwi_trial, 'init_ms'):.2f}"
             f" | {safe_float(flutter_trial, 'analyses_per_sec'):.2f}"
-            f" | {safe_float(kiwi_trial, 'analyses_per_sec'):.2f} |"
+            f' | {kiwi_warm}'
+            f' | {format_noise_score(kiwi_trial)} |'
         )
 
     flutter_samples = first_non_empty_sample_outputs(flutter_trials)
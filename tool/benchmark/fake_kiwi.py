@@ -0,0 +1,176 @@
+"""Deterministic stand-in for `kiwipiepy.Kiwi` with synthetic cost.
+
+It exposes the subset of the `Kiwi` API that the benchmark scripts call
+(`analyze`, `tokenize`, `split_into_sents`, `space`, `join`), so harness
+overhead can be measured and the pipelines can run without the native
+library. Outputs are a pure function of the input text; every call
+busy-waits for `call_cost_us + char_cost_us * len(text)` to model analyzer
+work on the calling thread.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from collections import namedtuple
+from typing import Any, Iterable
+
+Token = namedtuple('Token', 'form tag start len')
+Sentence = namedtuple('Sentence', 'text start end')
+
+# Tags handed out by form hash, so the same form always gets the same tag.
+_STEM_TAGS = ('NNG', 'NNP', 'VV', 'VA', 'MAG')
+_SUFFIX_TAGS = ('JKS', 'JKO', 'JX', 'EC', 'EF', 'ETM')
+_PUNCTUATION = frozenset('.,!?;:')
+_SENTENCE_ENDINGS = frozenset('.!?')
+
+
+def _tag_for(form: str, tags: tuple[str, ...]) -> str:
+    return tags[zlib.crc32(form.encode('utf-8')) % len(tags)]
+
+
+def _spin(duration_ns: int) -> None:
+    if duration_ns <= 0:
+        return
+    deadline = time.perf_counter_ns() + duration_ns
+    while time.perf_counter_ns() < deadline:
+        pass
+
+
+class FakeKiwi:
+    """`Kiwi`-compatible analyzer that never loads a model.
+
+    Constructor arguments mirror `Kiwi.__init__` so `filter_kiwi_kwargs`
+    and the pool key behave as they do for the real class; they do not
+    change the output. Tokens are rebuilt on every call, so memory stays
+    flat on streaming corpora and every pass does the same work.
+    """
+
+    call_cost_us = 0.0
+    char_cost_us = 0.0
+
+    def __init__(
+        self,
+        num_workers: int = -1,
+        model_path: str | None = None,
+        integrate_allomorph: bool = True,
+        load_default_dict: bool = True,
+        load_typo_dict: bool = True,
+        load_multi_dict: bool = True,
+        model_type: str | None = None,
+    ) -> None:
+        self.num_workers = num_workers
+        self.model_path = model_path
+        self.model_type = model_type
+
+    def _charge(self, text: str) -> None:
+        _spin(
+            round((self.call_cost_us + self.char_cost_us * len(text)) * 1000.0)
+        )
+
+    def _tokenize(self, text: str) -> list[Token]:
+        tokens: list[Token] = []
+        offset = 0
+        for eojeol in text.split():
+            start = text.index(eojeol, offset)
+            offset = start + len(eojeol)
+            body = eojeol.rstrip(''.join(_PUNCTUATION))
+            if len(body) > 1:
+                stem = body[:-1]
+                tokens.append(
+                    Token(stem, _tag_for(stem, _STEM_TAGS), start, len(stem))
+                )
+                tokens.append(
+                    Token(
+                        body[-1],
+                        _tag_for(body[-1], _SUFFIX_TAGS),
+                        start + len(stem),
+                        1,
+                    )
+                )
+            elif body:
+                tokens.append(Token(body, _tag_for(body, _STEM_TAGS), start, 1))
+            for index in range(len(body), len(eojeol)):
+                tokens.append(Token(eojeol[index], 'SF', start + index, 1))
+        return tokens
+
+    def tokenize(
+        self,
+        text: str | Iterable[str],
+        match_options: int = 0,
+        **_: Any,
+    ) -> Any:
+        if not isinstance(text, str):
+            return (self.tokenize(item, match_options) for item in text)
+        self._charge(text)
+        return self._tokenize(text)
+
+    def analyze(
+        self,
+        text: str | Iterable[str],
+        top_n: int = 1,
+        match_options: int = 0,
+        **_: Any,
+    ) -> Any:
+        if not isinstance(text, str):
+            return (self.analyze(item, top_n, match_options) for item in text)
+        self._charge(text)
+        return [(self._tokenize(text), -float(len(text)))]
+
+    def split_into_sents(
+        self,
+        text: str | Iterable[str],
+        match_options: int = 0,
+        **_: Any,
+    ) -> Any:
+        if not isinstance(text, str):
+            return (self.split_into_sents(item, match_options) for item in text)
+        self._charge(text)
+        sentences: list[Sentence] = []
+        start = 0
+        for index, char in enumerate(text):
+            if char in _SENTENCE_ENDINGS:
+                chunk = text[start : index + 1].strip()
+                if chunk:
+                    begin = text.index(chunk, start)
+                    sentences.append(Sentence(chunk, begin, begin + len(chunk)))
+                start = index + 1
+        tail = text[start:].strip()
+        if tail:
+            begin = text.index(tail, start)
+            sentences.append(Sentence(tail, begin, begin + len(tail)))
+        return sentences
+
+    def space(self, text: str | Iterable[str], **_: Any) -> Any:
+        if not isinstance(text, str):
+            return (self.space(item) for item in text)
+        self._charge(text)
+        return ' '.join(text.split())
+
+    def join(self, morphs: Iterable[Any], **_: Any) -> str:
+        """Concatenate forms, opening a new eojeol before every stem tag."""
+        parts: list[str] = []
+        for morph in morphs:
+            if isinstance(morph, tuple):
+                form, tag = str(morph[0]), str(morph[1])
+            else:
+                form, tag = str(morph.form), str(morph.tag)
+            if parts and tag in _STEM_TAGS:
+                parts.append(' ')
+            parts.append(form)
+        text = ''.join(parts)
+        self._charge(text)
+        return text
+
+
+def make_fake_kiwi_class(
+    *,
+    call_cost_us: float = 0.0,
+    char_cost_us: float = 0.0,
+) -> type[FakeKiwi]:
+    """Return a `FakeKiwi` subclass bound to one synthetic cost profile."""
+    return type(
+        'FakeKiwi',
+        (FakeKiwi,),
+        {'call_cost_us': call_cost_us, 'char_cost_us': char_cost_us},
+    )
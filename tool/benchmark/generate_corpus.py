@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Generate scaled synthetic benchmark corpora from the bundled Korean assets."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+DEFAULT_SOURCES = (
+    'example/assets/benchmark_corpus_ko.txt',
+    'example/assets/gold_eval_web_ko.txt',
+    'example/assets/gold_eval_written_ko.txt',
+)
+DEFAULT_LENGTH_HISTOGRAM = '3-6:0.3,7-12:0.45,13-24:0.2,25-60:0.05'
+# Bounded pool of emitted sentences that planned duplicates draw from.
+DUPLICATE_POOL_SIZE = 10000
+# Splice attempts per novel slot before falling back to a source eojeol.
+SPLICE_ATTEMPTS = 8
+
+
+@dataclass(frozen=True)
+class LengthBucket:
+    min_eojeols: int
+    max_eojeols: int
+    weight: float
+
+    @property
+    def label(self) -> str:
+        return f'{self.min_eojeols}-{self.max_eojeols}'
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    source_paths: tuple[Path, ...]
+    output_path: Path
+    sentence_count: int
+    length_buckets: tuple[LengthBucket, ...]
+    duplicate_ratio: float
+    novelty_rate: float
+    seed: int
+
+
+def parse_length_histogram(raw: str) -> tuple[LengthBucket, ...]:
+    """Parse `min-max:weight,...` eojeol-count buckets."""
+    buckets: list[LengthBucket] = []
+    for part in raw.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        range_text, _, weight_text = part.partition(':')
+        min_text, _, max_text = range_text.partition('-')
+        min_eojeols = int(min_text)
+        max_eojeols = int(max_text) if max_text else min_eojeols
+        weight = float(weight_text) if weight_text else 1.0
+        if min_eojeols < 1 or max_eojeols < min_eojeols or weight < 0:
+            raise ValueError(f'Invalid length bucket: {part}')
+        buckets.append(LengthBucket(min_eojeols, max_eojeols, weight))
+    if not buckets or sum(bucket.weight for bucket in buckets) <= 0:
+        raise ValueError('Length histogram needs at least one weighted bucket')
+    return tuple(buckets)
+
+
+def parse_args() -> GeneratorConfig:
+    parser = argparse.ArgumentParser(
+        description=(
+            'Recombine eojeols from the benchmark and gold corpora into a '
+            'synthetic corpus with a controlled length distribution, '
+            'duplicate rate and vocabulary novelty. Writes a manifest with '
+            'the content hash next to the corpus.'
+        )
+    )
+    parser.add_argument(
+        '--source',
+        dest='sources',
+        action='append',
+        type=Path,
+        default=None,
+        help=(
+            'Source corpus file (repeatable). Gold files use the sentence '
+            'column before the tab. Defaults to the bundled example assets.'
+        ),
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        required=True,
+        help='Output corpus path (one sentence per line).',
+    )
+    parser.add_argument(
+        '--sentences',
+        type=int,
+        default=10000,
+        help='Number of sentences to generate.',
+    )
+    parser.add_argument(
+        '--length-histogram',
+        default=DEFAULT_LENGTH_HISTOGRAM,
+        help=(
+            'Target eojeol-count distribution as `min-max:weight` buckets, '
+            f'e.g. `{DEFAULT_LENGTH_HISTOGRAM}`.'
+        ),
+    )
+    parser.add_argument(
+        '--duplicate-ratio',
+        type=float,
+        default=0.0,
+        help='Fraction of lines that repeat an earlier generated sentence.',
+    )
+    parser.add_argument(
+        '--novelty-rate',
+        type=float,
+        default=0.0,
+        help=(
+            'Fraction of eojeols replaced by unseen forms spliced from two '
+            'source eojeols.'
+        ),
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed; the same seed and sources give identical output.',
+    )
+    args = parser.parse_args()
+
+    if args.sentences < 1:
+        parser.error('--sentences must be >= 1')
+    if not 0.0 <= args.duplicate_ratio < 1.0:
+        parser.error('--duplicate-ratio must be in [0, 1)')
+    if not 0.0 <= args.novelty_rate <= 1.0:
+        parser.error('--novelty-rate must be in [0, 1]')
+    try:
+        length_buckets = parse_length_histogram(args.length_histogram)
+    except ValueError as error:
+        parser.error(f'--length-histogram: {error}')
+
+    repo_root = Path(__file__).resolve().parents[2]
+    sources = args.sources or [repo_root / path for path in DEFAULT_SOURCES]
+    return GeneratorConfig(
+        source_paths=tuple(sources),
+        output_path=args.output,
+        sentence_count=args.sentences,
+        length_buckets=length_buckets,
+        duplicate_ratio=args.duplicate_ratio,
+        novelty_rate=args.novelty_rate,
+        seed=args.seed,
+    )
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def display_path(path: Path) -> str:
+    """Render repo files relative to the root so manifests are portable."""
+    repo_root = Path(__file__).resolve().parents[2]
+    try:
+        return path.resolve().relative_to(repo_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def manifest_path_for(corpus_path: Path) -> Path:
+    return corpus_path.with_name(corpus_path.name + MANIFEST_SUFFIX)
+
+
+def load_source_eojeols(paths: tuple[Path, ...]) -> list[str]:
+    """Collect eojeols with their natural frequency from all sources."""
+    eojeols: list[str] = []
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f'Source corpus not found: {path}')
+        for raw_line in path.read_text(encoding='utf-8').splitlines():
+            sentence = raw_line.split('\t', 1)[0].strip()
+            eojeols.extend(sentence.split())
+    if not eojeols:
+        raise ValueError('Source corpora contain no eojeols')
+    return eojeols
+
+
+def splice_novel_eojeol(
+    rng: random.Random,
+    eojeols: list[str],
+    seen: set[str],
+) -> str | None:
+    """Join the head of one eojeol with the tail of another.
+
+    Returns None when every attempt produced a form already in `seen`.
+    """
+    for _ in range(SPLICE_ATTEMPTS):
+        head = rng.choice(eojeols)
+        tail = rng.choice(eojeols)
+        if len(head) < 2 or len(tail) < 2 or head == tail:
+            continue
+        candidate = head[: rng.randint(1, len(head) - 1)] + tail[
+            rng.randint(1, len(tail) - 1) :
+        ]
+        if candidate not in seen:
+            return candidate
+    candidate = rng.choice(eojeols) + rng.choice(eojeols)
+    return None if candidate in seen else candidate
+
+
+def generate_corpus(config: GeneratorConfig) -> dict[str, Any]:
+    """Stream the corpus to disk and return its manifest."""
+    rng = random.Random(config.seed)
+    eojeols = load_source_eojeols(config.source_paths)
+    # Source vocabulary plus every novel form already emitted, so a novel
+    # eojeol counts only the first time it appears in the corpus.
+    seen_eojeols = set(eojeols)
+    source_vocabulary_size = len(seen_eojeols)
+    bucket_weights = [bucket.weight for bucket in config.length_buckets]
+    bucket_counts = {bucket.label: 0 for bucket in config.length_buckets}
+
+    duplicate_pool: list[str] = []
+    duplicate_count = 0
+    novel_eojeol_count = 0
+    novel_slot_count = 0
+    total_eojeols = 0
+    total_chars = 0
+    digest = hashlib.sha256()
+    byte_count = 0
+
+    config.output_path.parent.mkdir(parents=True, exist_ok=True)
+    with config.output_path.open('wb') as handle:
+        for _ in range(config.sentence_count):
+            if duplicate_pool and rng.random() < config.duplicate_ratio:
+                sentence = rng.choice(duplicate_pool)
+                duplicate_count += 1
+            else:
+                bucket = rng.choices(config.length_buckets, bucket_weights)[0]
+                length = rng.randint(bucket.min_eojeols, bucket.max_eojeols)
+                words: list[str] = []
+                for _ in range(length):
+                    novel = None
+                    if rng.random() < config.novelty_rate:
+                        novel_slot_count += 1
+                        novel = splice_novel_eojeol(rng, eojeols, seen_eojeols)
+                    if novel is not None:
+                        seen_eojeols.add(novel)
+                        words.append(novel)
+                        novel_eojeol_count += 1
+                    else:
+                        words.append(rng.choice(eojeols))
+                sentence = ' '.join(words)
+                bucket_counts[bucket.label] += 1
+                total_eojeols += length
+                if len(duplicate_pool) < DUPLICATE_POOL_SIZE:
+                    duplicate_pool.append(sentence)
+                else:
+                    duplicate_pool[rng.randrange(DUPLICATE_POOL_SIZE)] = sentence
+
+            encoded = (sentence + '\n').encode('utf-8')
+            handle.write(encoded)
+            digest.update(encoded)
+            byte_count += len(encoded)
+            total_chars += len(sentence)
+
+    unique_count = config.sentence_count - duplicate_count
+    return {
+        'manifest_version': MANIFEST_VERSION,
+        'generator': 'tool/benchmark/generate_corpus.py',
+        'generated_at_utc': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'corpus_file': config.output_path.name,
+        'corpus_sha256': digest.hexdigest(),
+        'corpus_bytes': byte_count,
+        'sentence_count': config.sentence_count,
+        'total_chars': total_chars,
+        'seed': config.seed,
+        'target': {
+            'length_histogram': [
+                {
+                    'eojeols': bucket.label,
+                    'weight': bucket.weight,
+                }
+                for bucket in config.length_buckets
+            ],
+            'duplicate_ratio': config.duplicate_ratio,
+            'novelty_rate': config.novelty_rate,
+        },
+        'achieved': {
+            'length_histogram': bucket_counts,
+            'duplicate_ratio': duplicate_count / config.sentence_count,
+            # Only eojeols absent from the sources and from earlier lines.
+            'novelty_rate': (
+                novel_eojeol_count / total_eojeols if total_eojeols else 0.0
+            ),
+            'novel_eojeol_count': novel_eojeol_count,
+            'novel_slot_fallbacks': novel_slot_count - novel_eojeol_count,
+            'avg_eojeols_per_unique_sentence': (
+                total_eojeols / unique_count if unique_count else 0.0
+            ),
+        },
+        'sources': [
+            {
+                'path': display_path(path),
+                'sha256': file_sha256(path),
+            }
+            for path in config.source_paths
+        ],
+        'source_eojeol_count': len(eojeols),
+        'source_vocabulary_size': source_vocabulary_size,
+    }
+
+
+def main() -> int:
+    config = parse_args()
+    manifest = generate_corpus(config)
+    manifest_path = manifest_path_for(config.output_path)
+    manifest_path.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2),
+        encoding='utf-8',
+    )
+    print(
+        f'Corpus written: {config.output_path} '
+        f"({manifest['sentence_count']} sentences, "
+        f"sha256 {manifest['corpus_sha256'][:12]})"
+    )
+    print(f'Manifest written: {manifest_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
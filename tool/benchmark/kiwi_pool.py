@@ -0,0 +1,135 @@
+"""Keyed, size-bounded LRU pool of `kiwipiepy.Kiwi` instances.
+
+Shared by `kiwipiepy_benchmark.py` and `gold_corpus_compare.py` so that a
+model is loaded once per distinct constructor configuration per process.
+"""
+
+from __future__ import annotations
+
+import gc
+import inspect
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_POOL_SIZE = 2
+BACKEND_KIWIPIEPY = 'kiwipiepy'
+BACKEND_FAKE = 'fake'
+BACKENDS: tuple[str, ...] = (BACKEND_KIWIPIEPY, BACKEND_FAKE)
+
+
+@dataclass(frozen=True)
+class KiwiLease:
+    kiwi: Any
+    # Build time of this instance, even when it was served from the pool.
+    init_ms: float
+    pool_hit: bool
+
+
+def load_kiwi_class() -> Any:
+    try:
+        from kiwipiepy import Kiwi
+    except ImportError as error:
+        raise RuntimeError(
+            'kiwipiepy is not installed. Install it with '
+            '`python3 -m pip install kiwipiepy`.'
+        ) from error
+    return Kiwi
+
+
+def load_backend_class(
+    backend: str = BACKEND_KIWIPIEPY,
+    *,
+    call_cost_us: float = 0.0,
+    char_cost_us: float = 0.0,
+) -> Any:
+    """Resolve the analyzer class for `backend`.
+
+    `fake` is the deterministic `fake_kiwi.FakeKiwi` with the given
+    synthetic per-call and per-char cost; it needs no native library.
+    """
+    if backend == BACKEND_KIWIPIEPY:
+        return load_kiwi_class()
+    if backend == BACKEND_FAKE:
+        from fake_kiwi import make_fake_kiwi_class
+
+        return make_fake_kiwi_class(
+            call_cost_us=call_cost_us,
+            char_cost_us=char_cost_us,
+        )
+    raise ValueError(f'Unknown analyzer backend: {backend}')
+
+
+def filter_kiwi_kwargs(kiwi_class: Any, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Drop kwargs the installed `Kiwi.__init__` does not accept."""
+    supported = set(inspect.signature(kiwi_class.__init__).parameters)
+    supported.discard('self')
+    return {key: value for key, value in kwargs.items() if key in supported}
+
+
+class KiwiPool:
+    """LRU pool keyed by the filtered `Kiwi(...)` constructor kwargs.
+
+    A full pool evicts its least recently used instance before building a
+    new one, so at most `max_size` models are resident at once. A size of 0
+    disables pooling and builds a fresh instance on every acquire.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        *,
+        kiwi_class: Any = None,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError('Kiwi pool size must be >= 0')
+        self.max_size = max_size
+        self._kiwi_class = kiwi_class
+        self._entries: OrderedDict[tuple[Any, ...], KiwiLease] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_init_ms = 0.0
+
+    def acquire(self, kwargs: dict[str, Any]) -> KiwiLease:
+        kiwi_class = self._kiwi_class or load_kiwi_class()
+        filtered_kwargs = filter_kiwi_kwargs(kiwi_class, kwargs)
+        key = tuple(sorted(filtered_kwargs.items()))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.saved_init_ms += entry.init_ms
+            return KiwiLease(entry.kiwi, entry.init_ms, pool_hit=True)
+
+        self.misses += 1
+        if self._entries and len(self._entries) >= self.max_size:
+            while self._entries and len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            # Release the evicted model before the next one loads.
+            gc.collect()
+
+        init_started = time.perf_counter()
+        kiwi = kiwi_class(**filtered_kwargs)
+        init_ms = (time.perf_counter() - init_started) * 1000.0
+        lease = KiwiLease(kiwi, init_ms, pool_hit=False)
+        if self.max_size > 0:
+            self._entries[key] = lease
+        return lease
+
+    def clear(self) -> None:
+        self._entries.clear()
+        gc.collect()
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            'kiwi_pool_max_size': self.max_size,
+            'kiwi_pool_size': len(self._entries),
+            'kiwi_pool_hits': self.hits,
+            'kiwi_pool_misses': self.misses,
+            'kiwi_pool_evictions': self.evictions,
+            'kiwi_pool_saved_init_ms': self.saved_init_ms,
+        }
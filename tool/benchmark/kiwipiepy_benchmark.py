@@ -4,14 +4,52 @@
 from __future__ import annotations
 
 import argparse
-import inspect
+import array
+import asyncio
+import cProfile
+import gc
+import hashlib
+import itertools
 import json
+import math
+import mmap
+import multiprocessing
+import os
 import platform
+import pstats
+import random
+import statistics
+import shutil
+import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+import tracemalloc
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, Iterable, Iterator, TextIO
+
+from binary_corpus import BinaryCorpus, open_compiled_corpus
+from bootstrap_ci import bootstrap_mean_ci
+from kiwi_pool import (
+    BACKEND_FAKE,
+    BACKEND_KIWIPIEPY,
+    BACKENDS,
+    DEFAULT_POOL_SIZE,
+    KiwiLease,
+    KiwiPool,
+    filter_kiwi_kwargs,
+    load_backend_class,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no `resource` module.
+    resource = None  # type: ignore[assignment]
 
 
 @dataclass(frozen=True)
@@ -19,26 +57,65 @@ class BenchmarkConfig:
     corpus_path: Path
     output_path: Path | None
     warmup_runs: int
+    adaptive_warmup: bool
+    warmup_cv_threshold: float
+    warmup_window: int
+    warmup_max_runs: int
+    target_ci_percent: float
+    time_budget_seconds: float
+    max_measure_runs: int
+    bootstrap_resamples: int
     measure_runs: int
     top_n: int
     num_workers: int
+    num_workers_sweep: tuple[int, ...]
+    processes: int
+    cpu_affinity: tuple[int, ...]
+    isolate: bool
+    track_allocations: bool
+    memory_breakdown: bool
+    layers: bool
+    cold_start_runs: int
+    cold_start_drop_caches: bool
+    cache_size: int
+    cache_ttl_seconds: float
+    replay_duplicate_rate: float | None
+    open_loop_qps: tuple[float, ...]
+    open_loop_arrival: str
+    open_loop_duration_seconds: float
+    open_loop_concurrency: int
+    async_concurrency_sweep: tuple[int, ...]
+    analyze_impl_sweep: tuple[str, ...]
+    document_sizes_kb: tuple[float, ...]
+    document_file: Path | None
+    documents_per_size: int
+    kiwi_pool_size: int
+    backend: str
+    fake_call_cost_us: float
+    fake_char_cost_us: float
+    harness_baseline: bool
+    matrix_build_options: tuple[int, ...]
+    matrix_model_types: tuple[str, ...]
+    matrix_top_n: tuple[int, ...]
+    matrix_analyze_match_options: tuple[int, ...]
+    gc_mode: str
+    profile_mode: str | None
+    profile_interval_ms: float
+    profile_top_n: int
     build_options: int
     create_match_options: int
     analyze_match_options: int
     analyze_impl: str
+    stream_corpus: bool
+    execution_mode: str
+    batch_size: int
     sample_count: int
+    sample_reservoir: bool
+    sample_seed: int
     trial_id: int
     model_path: str
 
 
-@dataclass(frozen=True)
-class RunStats:
-    elapsed_ms: float
-    total_analyses: int
-    total_chars: int
-    total_tokens: int
-
-
 INTEGRATE_ALLOMORPH = 1
 LOAD_DEFAULT_DICT = 2
 LOAD_TYPO_DICT = 4
@@ -46,6 +123,67 @@ LOAD_MULTI_DICT = 8
 MODEL_TYPE_MASK = 0x0F00
 _ANALYZE_IMPL_ANALYZE = 'analyze'
 _ANALYZE_IMPL_TOKENIZE = 'tokenize'
+_ANALYZE_IMPL_SPLIT = 'split_into_sents'
+_ANALYZE_IMPL_SPACE = 'space'
+_ANALYZE_IMPL_JOIN = 'join'
+ANALYZE_IMPLS: tuple[str, ...] = (
+    _ANALYZE_IMPL_ANALYZE,
+    _ANALYZE_IMPL_TOKENIZE,
+    _ANALYZE_IMPL_SPLIT,
+    _ANALYZE_IMPL_SPACE,
+    _ANALYZE_IMPL_JOIN,
+)
+_GC_MODE_ENABLED = 'enabled'
+_GC_MODE_FREEZE = 'freeze'
+_GC_MODE_DISABLED = 'disabled'
+GC_GENERATIONS = 3
+# Background busy share of the pinned cores is sampled over this window
+# while the benchmark itself sleeps.
+NOISE_PROBE_SECONDS = 0.25
+# Trials at or above this noise score are flagged as untrustworthy.
+NOISE_SCORE_THRESHOLD = 0.25
+_DOCUMENT_WHOLE = 'whole'
+_DOCUMENT_SPLIT = 'split'
+# Document sizes up to this multiple of the cheapest per-KB whole-document
+# cost are treated as safe to analyze without chunking.
+DOCUMENT_COST_GROWTH_LIMIT = 1.25
+# Passes timed by `--harness-baseline`, after one untimed warm-up pass.
+HARNESS_FLOOR_RUNS = 3
+# What `tokens_per_sec` counts for each API path.
+ANALYZE_IMPL_OUTPUT_UNITS: dict[str, str] = {
+    _ANALYZE_IMPL_ANALYZE: 'tokens',
+    _ANALYZE_IMPL_TOKENIZE: 'tokens',
+    _ANALYZE_IMPL_SPLIT: 'sentences',
+    _ANALYZE_IMPL_SPACE: 'eojeols',
+    _ANALYZE_IMPL_JOIN: 'eojeols',
+}
+_EXECUTION_MODE_SINGLE = 'single'
+_EXECUTION_MODE_BATCH = 'batch'
+_ARRIVAL_POISSON = 'poisson'
+_ARRIVAL_FIXED = 'fixed'
+# A load level is saturated when it completes below this share of the
+# offered rate, or when its p99 exceeds the lightest level's p99 by this
+# factor.
+OPEN_LOOP_THROUGHPUT_FLOOR = 0.95
+OPEN_LOOP_P99_BLOWUP = 3.0
+_PROFILE_CPROFILE = 'cprofile'
+_PROFILE_SAMPLE = 'sample'
+PROFILE_PSTATS_SUFFIX = '.pstats'
+PROFILE_COLLAPSED_SUFFIX = '.collapsed.txt'
+# Period of the event-loop lag probe in the asyncio driver.
+LOOP_LAG_PROBE_INTERVAL_S = 0.005
+LATENCY_BUCKET_GROWTH = 1.05
+LATENCY_PERCENTILES: tuple[tuple[str, float], ...] = (
+    ('p50', 0.50),
+    ('p95', 0.95),
+    ('p99', 0.99),
+    ('p999', 0.999),
+)
+
+CORPUS_MANIFEST_SUFFIX = '.manifest.json'
+# Upper bounds (exclusive) of the length buckets; the last bucket is open.
+CHAR_LENGTH_BUCKETS: tuple[int, ...] = (10, 20, 40, 80, 160, 320, 640)
+EOJEOL_COUNT_BUCKETS: tuple[int, ...] = (3, 5, 9, 17, 33, 65)
 
 MODEL_TYPE_MAP: dict[int, str | None] = {
     0x0000: None,
@@ -57,6 +195,386 @@ MODEL_TYPE_MAP: dict[int, str | None] = {
 }
 
 
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error.
+
+    Each bucket covers `[growth**i, growth**(i + 1))` nanoseconds, so a
+    percentile read from the bucket upper bound is at most `growth - 1` above
+    the true value. Recording is one `log` call and one dict update.
+    """
+
+    def __init__(self, growth: float = LATENCY_BUCKET_GROWTH) -> None:
+        if growth <= 1.0:
+            raise ValueError('Histogram bucket growth must be > 1.0')
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < 1:
+            value_ns = 1
+        index = int(math.log(value_ns) / self._log_growth)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def bucket_upper_ns(self, index: int) -> float:
+        return self.growth ** (index + 1)
+
+    def percentile_ns(self, quantile: float) -> float:
+        if self.count == 0:
+            return 0.0
+        if quantile >= 1.0:
+            return float(self.max_ns)
+
+        target = max(1, math.ceil(self.count * quantile))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                upper = self.bucket_upper_ns(index)
+                return float(min(max(upper, self.min_ns), self.max_ns))
+        return float(self.max_ns)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.growth != self.growth:
+            raise ValueError('Cannot merge histograms with different growth')
+        if other.count == 0:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if self.count == 0 or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            'unit': 'us',
+            'bucket_growth': self.growth,
+            'count': self.count,
+            'buckets': [
+                {
+                    'upper_us': self.bucket_upper_ns(index) / 1000.0,
+                    'count': self.counts[index],
+                }
+                for index in sorted(self.counts)
+            ],
+        }
+
+
+class LengthBucketStats:
+    """Per-bucket accumulator for length-bucketed throughput and latency."""
+
+    def __init__(self, lower: int, upper: int | None) -> None:
+        self.lower = lower
+        self.upper = upper
+        self.count = 0
+        self.total_chars = 0
+        self.total_tokens = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def label(self) -> str:
+        if self.upper is None:
+            return f'{self.lower}+'
+        return f'{self.lower}-{self.upper - 1}'
+
+    def merge(self, other: LengthBucketStats) -> None:
+        self.count += other.count
+        self.total_chars += other.total_chars
+        self.total_tokens += other.total_tokens
+        self.latency.merge(other.latency)
+
+    def to_payload(self) -> dict[str, Any]:
+        elapsed_seconds = self.latency.total_ns / 1e9
+        return {
+            'bucket': self.label,
+            'count': self.count,
+            'total_chars': self.total_chars,
+            'total_tokens': self.total_tokens,
+            'elapsed_ms': self.latency.total_ns / 1e6,
+            'chars_per_sec': safe_divide(self.total_chars, elapsed_seconds),
+            'tokens_per_sec': safe_divide(self.total_tokens, elapsed_seconds),
+            'avg_latency_ms': safe_divide(
+                self.latency.total_ns / 1e6,
+                self.count,
+            ),
+            **{
+                f'latency_{label}_ms': self.latency.percentile_ns(quantile) / 1e6
+                for label, quantile in LATENCY_PERCENTILES
+            },
+        }
+
+
+class LengthBreakdown:
+    """Bucket analyses by char length and eojeol count, and fit cost.
+
+    The linear fit (latency = intercept + slope * chars) and the log-log
+    exponent are kept as running sums, so memory does not grow with the
+    number of analyses. An exponent above 1 means superlinear cost.
+    """
+
+    def __init__(self) -> None:
+        self.char_buckets = self._make_buckets(CHAR_LENGTH_BUCKETS)
+        self.eojeol_buckets = self._make_buckets(EOJEOL_COUNT_BUCKETS)
+        self.n = 0
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xx = 0.0
+        self.sum_xy = 0.0
+        self.sum_yy = 0.0
+        self.log_n = 0
+        self.sum_log_x = 0.0
+        self.sum_log_y = 0.0
+        self.sum_log_xx = 0.0
+        self.sum_log_xy = 0.0
+
+    @staticmethod
+    def _make_buckets(bounds: tuple[int, ...]) -> list[LengthBucketStats]:
+        lowers = (0,) + bounds
+        uppers: tuple[int | None, ...] = bounds + (None,)
+        return [
+            LengthBucketStats(lower, upper)
+            for lower, upper in zip(lowers, uppers)
+        ]
+
+    @staticmethod
+    def _bucket_index(bounds: tuple[int, ...], value: int) -> int:
+        for index, upper in enumerate(bounds):
+            if value < upper:
+                return index
+        return len(bounds)
+
+    @classmethod
+    def iter_bucket_keys(
+        cls,
+        sentence_rows: Iterable[tuple[str, int]],
+    ) -> Iterator[tuple[int, int, int, int]]:
+        """Yield `(chars, eojeols, char_bucket, eojeol_bucket)` per row."""
+        for sentence, chars in sentence_rows:
+            eojeols = sentence.count(' ') + 1
+            yield (
+                chars,
+                eojeols,
+                cls._bucket_index(CHAR_LENGTH_BUCKETS, chars),
+                cls._bucket_index(EOJEOL_COUNT_BUCKETS, eojeols),
+            )
+
+    def record(
+        self,
+        key: tuple[int, int, int, int],
+        tokens: int,
+        latency_ns: int,
+    ) -> None:
+        chars, _, char_index, eojeol_index = key
+        for bucket in (
+            self.char_buckets[char_index],
+            self.eojeol_buckets[eojeol_index],
+        ):
+            bucket.count += 1
+            bucket.total_chars += chars
+            bucket.total_tokens += tokens
+            bucket.latency.record(latency_ns)
+
+        x = float(chars)
+        y = latency_ns / 1000.0
+        self.n += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xx += x * x
+        self.sum_xy += x * y
+        self.sum_yy += y * y
+        if chars > 0 and y > 0:
+            log_x = math.log(x)
+            log_y = math.log(y)
+            self.log_n += 1
+            self.sum_log_x += log_x
+            self.sum_log_y += log_y
+            self.sum_log_xx += log_x * log_x
+            self.sum_log_xy += log_x * log_y
+
+    def merge(self, other: LengthBreakdown) -> None:
+        for mine, theirs in zip(self.char_buckets, other.char_buckets):
+            mine.merge(theirs)
+        for mine, theirs in zip(self.eojeol_buckets, other.eojeol_buckets):
+            mine.merge(theirs)
+        for name in (
+            'n',
+            'sum_x',
+            'sum_y',
+            'sum_xx',
+            'sum_xy',
+            'sum_yy',
+            'log_n',
+            'sum_log_x',
+            'sum_log_y',
+            'sum_log_xx',
+            'sum_log_xy',
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def cost_fit(self) -> dict[str, float | None]:
+        denominator = self.n * self.sum_xx - self.sum_x**2
+        if self.n < 2 or denominator <= 0:
+            return {
+                'cost_per_char_us': None,
+                'cost_intercept_us': None,
+                'cost_fit_r2': None,
+                'cost_length_exponent': None,
+            }
+
+        slope = (self.n * self.sum_xy - self.sum_x * self.sum_y) / denominator
+        intercept = (self.sum_y - slope * self.sum_x) / self.n
+        y_variance = self.n * self.sum_yy - self.sum_y**2
+        r2 = None
+        if y_variance > 0:
+            covariance = self.n * self.sum_xy - self.sum_x * self.sum_y
+            r2 = (covariance * covariance) / (denominator * y_variance)
+
+        exponent = None
+        log_denominator = self.log_n * self.sum_log_xx - self.sum_log_x**2
+        if self.log_n >= 2 and log_denominator > 0:
+            exponent = (
+                self.log_n * self.sum_log_xy - self.sum_log_x * self.sum_log_y
+            ) / log_denominator
+
+        return {
+            'cost_per_char_us': slope,
+            'cost_intercept_us': intercept,
+            'cost_fit_r2': r2,
+            'cost_length_exponent': exponent,
+        }
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            'length_buckets': {
+                'chars': [
+                    bucket.to_payload()
+                    for bucket in self.char_buckets
+                    if bucket.count
+                ],
+                'eojeols': [
+                    bucket.to_payload()
+                    for bucket in self.eojeol_buckets
+                    if bucket.count
+                ],
+            },
+            **self.cost_fit(),
+        }
+
+
+class AnalysisCache:
+    """Bounded memo of first-candidate tokens with LRU and TTL eviction.
+
+    Keys combine the whitespace/NFC-normalized sentence with every option
+    that changes the result, including a caller-provided namespace for
+    build-time options, so one cache can be shared safely across analyzers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        *,
+        ttl_seconds: float = 0.0,
+        namespace: tuple[Any, ...] = (),
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError('Cache size must be >= 1')
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, list[Any]]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def normalize(sentence: str) -> str:
+        return unicodedata.normalize('NFC', ' '.join(sentence.split()))
+
+    def make_key(
+        self,
+        sentence: str,
+        *,
+        top_n: int,
+        match_options: int,
+        analyze_impl: str,
+    ) -> tuple[Any, ...]:
+        return (
+            self.normalize(sentence),
+            top_n,
+            match_options,
+            analyze_impl,
+            self.namespace,
+        )
+
+    def get(self, key: tuple[Any, ...]) -> list[Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, tokens = entry
+        if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return tokens
+
+    def put(self, key: tuple[Any, ...], tokens: list[Any]) -> None:
+        self._entries[key] = (time.monotonic(), tokens)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop entries but keep counters cumulative."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_payload(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'cache_size': self.max_entries,
+            'cache_ttl_seconds': self.ttl_seconds,
+            'cache_entries': len(self._entries),
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_evictions': self.evictions,
+            'cache_expirations': self.expirations,
+            'cache_hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+@dataclass(frozen=True)
+class RunStats:
+    elapsed_ms: float
+    total_analyses: int
+    total_chars: int
+    total_tokens: int
+    latency: LatencyHistogram
+    # Only single mode sees per-sentence latency, so batch runs leave this None.
+    length_breakdown: LengthBreakdown | None = None
+
+
 def safe_print_line(line: str, *, stream: TextIO = sys.stdout) -> None:
     """Print a line without failing on Windows console encodings."""
     encoding = stream.encoding or 'utf-8'
@@ -76,6 +594,13 @@ def resolve_model_type(build_options: int) -> str | None:
     return MODEL_TYPE_MAP.get(build_options & MODEL_TYPE_MASK)
 
 
+def with_model_type(build_options: int, model_type: str) -> int:
+    for bits, name in MODEL_TYPE_MAP.items():
+        if name == model_type:
+            return (build_options & ~MODEL_TYPE_MASK) | bits
+    raise ValueError(f'Unknown model type: {model_type}')
+
+
 def parse_args() -> BenchmarkConfig:
     parser = argparse.ArgumentParser(
         description=(
@@ -87,7 +612,11 @@ def parse_args() -> BenchmarkConfig:
         '--corpus',
         type=Path,
         default=Path('example/assets/benchmark_corpus_ko.txt'),
-        help='Sentence corpus file path (one sentence per line).',
+        help=(
+            'Sentence corpus file path (one sentence per line). A compiled '
+            '`.kcorp` file, or a fresh `<corpus>.kcorp` sibling written by '
+            '`binary_corpus.py`, is memory-mapped instead of parsed.'
+        ),
     )
     parser.add_argument(
         '--output',
@@ -99,13 +628,74 @@ def parse_args() -> BenchmarkConfig:
         '--warmup-runs',
         type=int,
         default=3,
-        help='Number of warm-up passes before timed measurement.',
+        help=(
+            'Number of warm-up passes before timed measurement '
+            '(the minimum pass count with --adaptive-warmup).'
+        ),
+    )
+    parser.add_argument(
+        '--adaptive-warmup',
+        action='store_true',
+        help=(
+            'Keep warming up until the coefficient of variation of per-pass '
+            'throughput over the last --warmup-window passes drops below '
+            '--warmup-cv-threshold, or --warmup-max-runs is reached.'
+        ),
+    )
+    parser.add_argument(
+        '--warmup-cv-threshold',
+        type=float,
+        default=0.05,
+        help='Steady-state CV threshold for --adaptive-warmup.',
+    )
+    parser.add_argument(
+        '--warmup-window',
+        type=int,
+        default=3,
+        help='Sliding window of warm-up passes used for the CV check.',
+    )
+    parser.add_argument(
+        '--warmup-max-runs',
+        type=int,
+        default=50,
+        help='Upper bound on adaptive warm-up passes.',
     )
     parser.add_argument(
         '--measure-runs',
         type=int,
         default=15,
-        help='Number of timed measurement passes.',
+        help=(
+            'Number of timed measurement passes (the minimum with '
+            '--target-ci-percent).'
+        ),
+    )
+    parser.add_argument(
+        '--target-ci-percent',
+        type=float,
+        default=0.0,
+        help=(
+            'Keep adding measured passes until the bootstrap 95%% CI '
+            'half-width of per-pass throughput is below this percentage of '
+            'the mean (0 = fixed --measure-runs).'
+        ),
+    )
+    parser.add_argument(
+        '--time-budget-seconds',
+        type=float,
+        default=120.0,
+        help='Wall-clock cap on measured passes with --target-ci-percent.',
+    )
+    parser.add_argument(
+        '--max-measure-runs',
+        type=int,
+        default=500,
+        help='Upper bound on measured passes with --target-ci-percent.',
+    )
+    parser.add_argument(
+        '--bootstrap-resamples',
+        type=int,
+        default=2000,
+        help='Bootstrap resamples for the throughput confidence interval.',
     )
     parser.add_argument(
         '--top-n',
@@ -119,6 +709,270 @@ def parse_args() -> BenchmarkConfig:
         default=-1,
         help='`num_workers` for `Kiwi` (-1 lets kiwi choose available cores).',
     )
+    parser.add_argument(
+        '--num-workers-sweep',
+        default='',
+        help=(
+            'Comma-separated `num_workers` values (e.g. `1,2,4,8,-1`). Builds '
+            'one `Kiwi` per value and emits a combined scaling payload. '
+            'Combine with `--execution-mode batch`; single-sentence calls do '
+            'not fan out across workers.'
+        ),
+    )
+    parser.add_argument(
+        '--cpu-affinity',
+        default='',
+        help=(
+            'Pin the benchmark (and the native Kiwi threads it spawns) to a '
+            'CPU list such as `0,2-3` through `os.sched_setaffinity`.'
+        ),
+    )
+    parser.add_argument(
+        '--isolate',
+        action='store_true',
+        help=(
+            'Give the measured work dedicated cores from the affinity mask: '
+            'one core per `--processes` worker, or as many cores as '
+            '`num_workers` resolves to for a single process.'
+        ),
+    )
+    parser.add_argument(
+        '--processes',
+        type=int,
+        default=0,
+        help=(
+            'Run N worker processes, each with its own `Kiwi` and a shard of '
+            'the corpus, released together by a start barrier (0 disables).'
+        ),
+    )
+    parser.add_argument(
+        '--track-allocations',
+        action='store_true',
+        help=(
+            'Run one extra untimed pass under tracemalloc and report '
+            'Python-side allocation per analysis.'
+        ),
+    )
+    parser.add_argument(
+        '--memory-breakdown',
+        action='store_true',
+        help=(
+            'Load `Kiwi` once per dictionary option in fresh processes and '
+            'report the RSS each option adds.'
+        ),
+    )
+    parser.add_argument(
+        '--layers',
+        action='store_true',
+        help=(
+            'Add a separate pass that splits per-analysis cost into native '
+            'call, token extraction and `form/tag` formatting (pure/full).'
+        ),
+    )
+    parser.add_argument(
+        '--cold-start-runs',
+        type=int,
+        default=0,
+        help=(
+            'Launch K fresh interpreters and time interpreter start, '
+            'kiwipiepy import, Kiwi() construction and the first analysis '
+            'separately (0 disables).'
+        ),
+    )
+    parser.add_argument(
+        '--cold-start-drop-caches',
+        action='store_true',
+        help=(
+            'Also run the cold-start probes after dropping the OS page cache '
+            '(Linux drop_caches or macOS purge; needs privileges).'
+        ),
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=0,
+        help=(
+            'Enable an LRU analysis cache with this many entries and compare '
+            'against an uncached pass (0 disables). Single mode only.'
+        ),
+    )
+    parser.add_argument(
+        '--cache-ttl-seconds',
+        type=float,
+        default=0.0,
+        help='Expire cache entries older than this (0 keeps them until evicted).',
+    )
+    parser.add_argument(
+        '--replay-duplicate-rate',
+        type=float,
+        default=None,
+        help=(
+            'Replay the corpus so this fraction of analyses repeats an '
+            'earlier sentence of the same pass (e.g. 0.5).'
+        ),
+    )
+    parser.add_argument(
+        '--open-loop-qps',
+        default='',
+        help=(
+            'Comma-separated offered loads (requests/s) for open-loop mode, '
+            'e.g. `50,100,200,400`. Latency is measured from the scheduled '
+            'send time, so queueing delay is not omitted.'
+        ),
+    )
+    parser.add_argument(
+        '--open-loop-arrival',
+        choices=(_ARRIVAL_POISSON, _ARRIVAL_FIXED),
+        default=_ARRIVAL_POISSON,
+        help='Inter-arrival distribution for open-loop mode.',
+    )
+    parser.add_argument(
+        '--open-loop-duration-seconds',
+        type=float,
+        default=10.0,
+        help='Scheduled duration of each open-loop load level.',
+    )
+    parser.add_argument(
+        '--open-loop-concurrency',
+        type=int,
+        default=0,
+        help='Worker threads serving open-loop requests (0 = CPU count).',
+    )
+    parser.add_argument(
+        '--kiwi-pool-size',
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=(
+            'Kiwi instances kept in the keyed LRU pool so repeated runs with '
+            'the same constructor kwargs skip model load (0 = always rebuild).'
+        ),
+    )
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default=BACKEND_KIWIPIEPY,
+        help=(
+            'Analyzer backend. fake: deterministic `fake_kiwi.FakeKiwi` with '
+            'synthetic cost, for offline runs and harness validation.'
+        ),
+    )
+    parser.add_argument(
+        '--fake-call-cost-us',
+        type=float,
+        default=0.0,
+        help='Synthetic busy-wait per call for `--backend fake` (microseconds).',
+    )
+    parser.add_argument(
+        '--fake-char-cost-us',
+        type=float,
+        default=0.0,
+        help='Synthetic busy-wait per input char for `--backend fake`.',
+    )
+    parser.add_argument(
+        '--harness-baseline',
+        action='store_true',
+        help=(
+            'Also time the measured loop against a no-op analyzer to report '
+            'the harness per-call floor (looping, clock reads, accounting) '
+            'and net throughput with it subtracted.'
+        ),
+    )
+    parser.add_argument(
+        '--gc-mode',
+        choices=(_GC_MODE_ENABLED, _GC_MODE_FREEZE, _GC_MODE_DISABLED),
+        default=_GC_MODE_ENABLED,
+        help=(
+            'Cyclic GC during the measured phase. freeze: collect, then '
+            '`gc.freeze()` so warm-up objects are never rescanned. disabled: '
+            '`gc.disable()` until measurement ends. Collector pauses are '
+            'recorded in every mode.'
+        ),
+    )
+    parser.add_argument(
+        '--document-sizes-kb',
+        default='',
+        help=(
+            'Document mode: comma-separated target document sizes in UTF-8 '
+            'KiB (e.g. `1,4,16,50`). Corpus lines are concatenated into '
+            'documents and analyzed whole and split-then-per-sentence.'
+        ),
+    )
+    parser.add_argument(
+        '--document-file',
+        type=Path,
+        default=None,
+        help=(
+            'Document mode source with blank-line-delimited paragraphs. '
+            'Whole paragraphs are grouped up to each target size instead of '
+            'corpus lines.'
+        ),
+    )
+    parser.add_argument(
+        '--documents-per-size',
+        type=int,
+        default=8,
+        help='Documents built for each `--document-sizes-kb` entry.',
+    )
+    parser.add_argument(
+        '--matrix-build-options',
+        default='',
+        help=(
+            'Config matrix axis: comma-separated build option bitmasks. '
+            'Any matrix axis enables matrix mode; unset axes use the single '
+            'value from the regular option.'
+        ),
+    )
+    parser.add_argument(
+        '--matrix-model-types',
+        default='',
+        help=(
+            'Config matrix axis: comma-separated model types '
+            f"({', '.join(name for name in MODEL_TYPE_MAP.values() if name)}) "
+            'that replace the model bits of each build option.'
+        ),
+    )
+    parser.add_argument(
+        '--matrix-top-n',
+        default='',
+        help='Config matrix axis: comma-separated top_n values.',
+    )
+    parser.add_argument(
+        '--matrix-analyze-match-options',
+        default='',
+        help='Config matrix axis: comma-separated analyze match option bitmasks.',
+    )
+    parser.add_argument(
+        '--async-concurrency-sweep',
+        default='',
+        help=(
+            'Comma-separated coroutine counts, e.g. `1,2,4,8,16`. Each count '
+            'drives one shared Kiwi through run_in_executor and reports '
+            'throughput, request latency and event-loop lag.'
+        ),
+    )
+    parser.add_argument(
+        '--profile',
+        dest='profile_mode',
+        choices=(_PROFILE_CPROFILE, _PROFILE_SAMPLE),
+        default=None,
+        help=(
+            'Profile only the measured phase. Writes `.pstats` (cprofile) and '
+            '`.collapsed.txt` flamegraph input next to --output and records '
+            'the top self-time functions in the payload.'
+        ),
+    )
+    parser.add_argument(
+        '--profile-interval-ms',
+        type=float,
+        default=1.0,
+        help='Stack sampling period for `--profile sample`.',
+    )
+    parser.add_argument(
+        '--profile-top-n',
+        type=int,
+        default=20,
+        help='Number of self-time hot spots recorded in the payload.',
+    )
     parser.add_argument(
         '--build-options',
         type=int,
@@ -145,9 +999,41 @@ def parse_args() -> BenchmarkConfig:
     )
     parser.add_argument(
         '--analyze-impl',
-        choices=(_ANALYZE_IMPL_ANALYZE, _ANALYZE_IMPL_TOKENIZE),
+        choices=ANALYZE_IMPLS,
         default=_ANALYZE_IMPL_ANALYZE,
-        help='kiwipiepy benchmark API path: analyze(top_n) or tokenize().',
+        help=(
+            'kiwipiepy benchmark API path: analyze(top_n), tokenize(), '
+            'split_into_sents(), space(), or join() over morphemes that are '
+            'pre-tokenized outside the timed loop.'
+        ),
+    )
+    parser.add_argument(
+        '--analyze-impl-sweep',
+        default='',
+        help=(
+            'Comma-separated API paths (e.g. '
+            f"`{','.join(ANALYZE_IMPLS)}`). Runs each against one shared "
+            '`Kiwi` and the same corpus and emits a combined payload.'
+        ),
+    )
+    parser.add_argument(
+        '--execution-mode',
+        choices=(_EXECUTION_MODE_SINGLE, _EXECUTION_MODE_BATCH),
+        default=_EXECUTION_MODE_SINGLE,
+        help=(
+            'single: one API call per sentence. batch: pass sentence chunks '
+            'through the iterable API so kiwipiepy spreads work across '
+            '`num_workers`.'
+        ),
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=0,
+        help=(
+            'Sentences per iterable API call in batch mode '
+            '(0 sends the whole corpus per pass).'
+        ),
     )
     parser.add_argument(
         '--trial-id',
@@ -162,15 +1048,114 @@ def parse_args() -> BenchmarkConfig:
         help='Number of sample sentences to include with POS outputs.',
     )
     parser.add_argument(
-        '--model-path',
-        default='',
-        help='Optional model path passed to `Kiwi(model_path=...)`.',
+        '--sample-reservoir',
+        action='store_true',
+        help=(
+            'Reservoir-sample `--sample-count` sentences across the corpus '
+            'instead of taking the first lines.'
+        ),
+    )
+    parser.add_argument(
+        '--sample-seed',
+        type=int,
+        default=0,
+        help='Random seed for `--sample-reservoir` and `--replay-duplicate-rate`.',
+    )
+    parser.add_argument(
+        '--stream-corpus',
+        action='store_true',
+        help=(
+            'Read the corpus lazily through mmap on every pass instead of '
+            'loading it into memory. Worker processes get byte-offset shards, '
+            'or sentence-index shards for a compiled corpus.'
+        ),
+    )
+    parser.add_argument(
+        '--model-path',
+        default='',
+        help='Optional model path passed to `Kiwi(model_path=...)`.',
     )
 
     args = parser.parse_args()
 
+    try:
+        num_workers_sweep = parse_int_list(args.num_workers_sweep)
+    except ValueError:
+        parser.error('--num-workers-sweep must be a comma-separated int list')
+    try:
+        async_concurrency_sweep = parse_int_list(args.async_concurrency_sweep)
+    except ValueError:
+        parser.error('--async-concurrency-sweep must be a comma-separated int list')
+    try:
+        matrix_build_options = parse_int_list(args.matrix_build_options)
+        matrix_top_n = parse_int_list(args.matrix_top_n)
+        matrix_analyze_match_options = parse_int_list(
+            args.matrix_analyze_match_options
+        )
+    except ValueError:
+        parser.error('--matrix-* numeric axes must be comma-separated int lists')
+    matrix_model_types = tuple(
+        part.strip() for part in args.matrix_model_types.split(',') if part.strip()
+    )
+    try:
+        open_loop_qps = tuple(
+            float(part) for part in args.open_loop_qps.split(',') if part.strip()
+        )
+    except ValueError:
+        parser.error('--open-loop-qps must be a comma-separated number list')
+
+    try:
+        cpu_affinity = parse_cpu_list(args.cpu_affinity)
+    except ValueError:
+        parser.error('--cpu-affinity must be a CPU list such as `0,2-3`')
+    if (cpu_affinity or args.isolate) and not hasattr(os, 'sched_setaffinity'):
+        parser.error('--cpu-affinity/--isolate need os.sched_setaffinity (Linux)')
+    if cpu_affinity:
+        available_cpus = os.sched_getaffinity(0)
+        unknown_cpus = sorted(set(cpu_affinity) - available_cpus)
+        if unknown_cpus:
+            parser.error(f'--cpu-affinity: CPUs {unknown_cpus} are not available')
+    try:
+        document_sizes_kb = tuple(
+            float(part)
+            for part in args.document_sizes_kb.split(',')
+            if part.strip()
+        )
+    except ValueError:
+        parser.error('--document-sizes-kb must be a comma-separated number list')
+    analyze_impl_sweep = tuple(
+        dict.fromkeys(
+            part.strip() for part in args.analyze_impl_sweep.split(',')
+            if part.strip()
+        )
+    )
+    for analyze_impl in analyze_impl_sweep:
+        if analyze_impl not in ANALYZE_IMPLS:
+            parser.error(f'--analyze-impl-sweep: unknown API path {analyze_impl}')
+
+    if args.warmup_cv_threshold <= 0:
+        parser.error('--warmup-cv-threshold must be > 0')
+    if args.warmup_window < 2:
+        parser.error('--warmup-window must be >= 2')
+    if args.adaptive_warmup and args.warmup_max_runs < max(
+        args.warmup_runs,
+        args.warmup_window,
+    ):
+        parser.error(
+            '--warmup-max-runs must be >= --warmup-runs and --warmup-window'
+        )
     if args.warmup_runs < 0:
         parser.error('--warmup-runs must be >= 0')
+    if args.target_ci_percent < 0:
+        parser.error('--target-ci-percent must be >= 0')
+    if args.time_budget_seconds <= 0:
+        parser.error('--time-budget-seconds must be > 0')
+    if args.target_ci_percent and args.max_measure_runs < args.measure_runs:
+        parser.error('--max-measure-runs must be >= --measure-runs')
+    if args.bootstrap_resamples < 100:
+        parser.error('--bootstrap-resamples must be >= 100')
+    if args.target_ci_percent and args.measure_runs < 2:
+        parser.error('--target-ci-percent needs --measure-runs >= 2')
     if args.measure_runs < 1:
         parser.error('--measure-runs must be >= 1')
     if args.top_n < 1:
@@ -185,24 +1170,247 @@ def parse_args() -> BenchmarkConfig:
         parser.error('--trial-id must be >= 0')
     if args.sample_count < 0:
         parser.error('--sample-count must be >= 0')
+    if args.batch_size < 0:
+        parser.error('--batch-size must be >= 0')
+    if any(value == 0 or value < -1 for value in num_workers_sweep):
+        parser.error('--num-workers-sweep values must be >= 1 or -1')
+    if args.processes < 0:
+        parser.error('--processes must be >= 0')
+    if args.isolate and args.processes > len(
+        cpu_affinity or os.sched_getaffinity(0)
+    ):
+        parser.error('--isolate needs one pinned CPU per --processes worker')
+    if args.cold_start_runs < 0:
+        parser.error('--cold-start-runs must be >= 0')
+    if args.fake_call_cost_us < 0 or args.fake_char_cost_us < 0:
+        parser.error('--fake-call-cost-us/--fake-char-cost-us must be >= 0')
+    if args.backend != BACKEND_KIWIPIEPY and args.cold_start_runs:
+        parser.error('--cold-start-runs requires --backend kiwipiepy')
+    if args.cache_size < 0:
+        parser.error('--cache-size must be >= 0')
+    if args.cache_ttl_seconds < 0:
+        parser.error('--cache-ttl-seconds must be >= 0')
+    if args.cache_size and args.execution_mode == _EXECUTION_MODE_BATCH:
+        parser.error('--cache-size requires --execution-mode single')
+    if args.cache_size and args.processes:
+        parser.error('--cache-size cannot be combined with --processes')
+    if any(qps <= 0 for qps in open_loop_qps):
+        parser.error('--open-loop-qps values must be > 0')
+    if args.open_loop_duration_seconds <= 0:
+        parser.error('--open-loop-duration-seconds must be > 0')
+    if args.open_loop_concurrency < 0:
+        parser.error('--open-loop-concurrency must be >= 0')
+    if open_loop_qps and (num_workers_sweep or args.processes):
+        parser.error(
+            '--open-loop-qps cannot be combined with --num-workers-sweep '
+            'or --processes'
+        )
+    if any(value < 1 for value in async_concurrency_sweep):
+        parser.error('--async-concurrency-sweep values must be >= 1')
+    if async_concurrency_sweep and (
+        num_workers_sweep or args.processes or open_loop_qps
+    ):
+        parser.error(
+            '--async-concurrency-sweep cannot be combined with '
+            '--num-workers-sweep, --processes or --open-loop-qps'
+        )
+    if async_concurrency_sweep and args.execution_mode != _EXECUTION_MODE_SINGLE:
+        parser.error('--async-concurrency-sweep requires --execution-mode single')
+    if args.kiwi_pool_size < 0:
+        parser.error('--kiwi-pool-size must be >= 0')
+    if args.execution_mode == _EXECUTION_MODE_BATCH and (
+        _ANALYZE_IMPL_JOIN in (args.analyze_impl, *analyze_impl_sweep)
+    ):
+        parser.error('--analyze-impl join requires --execution-mode single')
+    if any(size <= 0 for size in document_sizes_kb):
+        parser.error('--document-sizes-kb values must be > 0')
+    if args.documents_per_size < 1:
+        parser.error('--documents-per-size must be >= 1')
+    if args.document_file is not None and not document_sizes_kb:
+        parser.error('--document-file requires --document-sizes-kb')
+    if document_sizes_kb and args.analyze_impl not in (
+        _ANALYZE_IMPL_ANALYZE,
+        _ANALYZE_IMPL_TOKENIZE,
+    ):
+        parser.error('--document-sizes-kb requires --analyze-impl analyze or tokenize')
+    if document_sizes_kb and (
+        num_workers_sweep
+        or args.processes
+        or open_loop_qps
+        or async_concurrency_sweep
+        or analyze_impl_sweep
+        or args.cache_size
+        or args.execution_mode != _EXECUTION_MODE_SINGLE
+    ):
+        parser.error(
+            '--document-sizes-kb cannot be combined with other sweep modes, '
+            '--processes, --cache-size or --execution-mode batch'
+        )
+    if analyze_impl_sweep and (
+        num_workers_sweep
+        or args.processes
+        or open_loop_qps
+        or async_concurrency_sweep
+    ):
+        parser.error(
+            '--analyze-impl-sweep cannot be combined with other sweep modes '
+            'or --processes'
+        )
+    known_model_types = {name for name in MODEL_TYPE_MAP.values() if name}
+    for model_type in matrix_model_types:
+        if model_type not in known_model_types:
+            parser.error(f'--matrix-model-types: unknown model type {model_type}')
+    if any(value < 0 for value in matrix_build_options):
+        parser.error('--matrix-build-options values must be >= 0')
+    if any(value < 1 for value in matrix_top_n):
+        parser.error('--matrix-top-n values must be >= 1')
+    if any(value < 0 for value in matrix_analyze_match_options):
+        parser.error('--matrix-analyze-match-options values must be >= 0')
+    matrix_mode = bool(
+        matrix_build_options
+        or matrix_model_types
+        or matrix_top_n
+        or matrix_analyze_match_options
+    )
+    if matrix_mode and (
+        num_workers_sweep
+        or args.processes
+        or open_loop_qps
+        or async_concurrency_sweep
+        or document_sizes_kb
+        or analyze_impl_sweep
+        or args.profile_mode
+        or args.cache_size
+    ):
+        parser.error(
+            '--matrix-* axes cannot be combined with other sweep modes, '
+            '--processes, --profile or --cache-size'
+        )
+    if args.target_ci_percent and (
+        num_workers_sweep
+        or args.processes
+        or open_loop_qps
+        or async_concurrency_sweep
+        or analyze_impl_sweep
+        or document_sizes_kb
+        or matrix_mode
+    ):
+        parser.error(
+            '--target-ci-percent only supports the single benchmark run, not '
+            'sweeps, --processes, --open-loop-qps, --document-sizes-kb or '
+            '--matrix-* axes'
+        )
+    if args.profile_mode is not None:
+        if args.output is None:
+            parser.error('--profile requires --output for its artifacts')
+        if (
+            num_workers_sweep
+            or args.processes
+            or open_loop_qps
+            or async_concurrency_sweep
+            or analyze_impl_sweep
+            or document_sizes_kb
+        ):
+            parser.error(
+                '--profile only supports the single benchmark run, not '
+                'sweeps, --processes, --open-loop-qps or --document-sizes-kb'
+            )
+    if args.profile_interval_ms <= 0:
+        parser.error('--profile-interval-ms must be > 0')
+    if args.profile_top_n < 1:
+        parser.error('--profile-top-n must be >= 1')
+    if args.replay_duplicate_rate is not None:
+        if not 0.0 <= args.replay_duplicate_rate < 1.0:
+            parser.error('--replay-duplicate-rate must be in [0, 1)')
+        if args.stream_corpus:
+            parser.error('--replay-duplicate-rate cannot use --stream-corpus')
+    if args.processes and num_workers_sweep:
+        parser.error('--processes cannot be combined with --num-workers-sweep')
 
     return BenchmarkConfig(
         corpus_path=args.corpus,
         output_path=args.output,
         warmup_runs=args.warmup_runs,
+        adaptive_warmup=args.adaptive_warmup,
+        warmup_cv_threshold=args.warmup_cv_threshold,
+        warmup_window=args.warmup_window,
+        warmup_max_runs=args.warmup_max_runs,
+        target_ci_percent=args.target_ci_percent,
+        time_budget_seconds=args.time_budget_seconds,
+        max_measure_runs=args.max_measure_runs,
+        bootstrap_resamples=args.bootstrap_resamples,
         measure_runs=args.measure_runs,
         top_n=args.top_n,
         num_workers=args.num_workers,
+        num_workers_sweep=num_workers_sweep,
+        processes=args.processes,
+        cpu_affinity=cpu_affinity,
+        isolate=args.isolate,
+        track_allocations=args.track_allocations,
+        memory_breakdown=args.memory_breakdown,
+        layers=args.layers,
+        cold_start_runs=args.cold_start_runs,
+        cold_start_drop_caches=args.cold_start_drop_caches,
+        cache_size=args.cache_size,
+        cache_ttl_seconds=args.cache_ttl_seconds,
+        replay_duplicate_rate=args.replay_duplicate_rate,
+        open_loop_qps=open_loop_qps,
+        open_loop_arrival=args.open_loop_arrival,
+        open_loop_duration_seconds=args.open_loop_duration_seconds,
+        open_loop_concurrency=args.open_loop_concurrency,
+        async_concurrency_sweep=async_concurrency_sweep,
+        analyze_impl_sweep=analyze_impl_sweep,
+        document_sizes_kb=document_sizes_kb,
+        document_file=args.document_file,
+        documents_per_size=args.documents_per_size,
+        kiwi_pool_size=args.kiwi_pool_size,
+        backend=args.backend,
+        fake_call_cost_us=args.fake_call_cost_us,
+        fake_char_cost_us=args.fake_char_cost_us,
+        harness_baseline=args.harness_baseline,
+        matrix_build_options=matrix_build_options,
+        matrix_model_types=matrix_model_types,
+        matrix_top_n=matrix_top_n,
+        matrix_analyze_match_options=matrix_analyze_match_options,
+        gc_mode=args.gc_mode,
+        profile_mode=args.profile_mode,
+        profile_interval_ms=args.profile_interval_ms,
+        profile_top_n=args.profile_top_n,
         build_options=args.build_options,
         create_match_options=args.create_match_options,
         analyze_match_options=args.analyze_match_options,
         analyze_impl=args.analyze_impl,
+        stream_corpus=args.stream_corpus,
+        execution_mode=args.execution_mode,
+        batch_size=args.batch_size,
         sample_count=args.sample_count,
+        sample_reservoir=args.sample_reservoir,
+        sample_seed=args.sample_seed,
         trial_id=args.trial_id,
         model_path=args.model_path,
     )
 
 
+def parse_int_list(raw: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in raw.split(',') if part.strip())
+
+
+def parse_cpu_list(raw: str) -> tuple[int, ...]:
+    """Parse a Linux-style CPU list (`0,2-3`) into sorted unique ids."""
+    cpus: set[int] = set()
+    for part in raw.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        lower = int(first)
+        upper = int(last) if last else lower
+        if lower < 0 or upper < lower:
+            raise ValueError(f'Invalid CPU range: {part}')
+        cpus.update(range(lower, upper + 1))
+    return tuple(sorted(cpus))
+
+
 def load_sentences(path: Path) -> list[str]:
     if not path.exists():
         raise FileNotFoundError(f'Corpus not found: {path}')
@@ -218,15 +1426,253 @@ def load_sentences(path: Path) -> list[str]:
     return sentences
 
 
-def create_kiwi(config: BenchmarkConfig) -> Any:
-    try:
-        from kiwipiepy import Kiwi
-    except ImportError as error:
-        raise RuntimeError(
-            'kiwipiepy is not installed. Install it with '
-            '`python3 -m pip install kiwipiepy`.'
-        ) from error
+def load_paragraphs(path: Path) -> list[str]:
+    """Split a file on blank lines, keeping line breaks inside paragraphs."""
+    if not path.exists():
+        raise FileNotFoundError(f'Document file not found: {path}')
+
+    paragraphs: list[str] = []
+    current: list[str] = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        stripped = line.strip()
+        if stripped:
+            current.append(stripped)
+        elif current:
+            paragraphs.append('\n'.join(current))
+            current = []
+    if current:
+        paragraphs.append('\n'.join(current))
+
+    if not paragraphs:
+        raise ValueError(f'Document file is empty: {path}')
+    return paragraphs
+
+
+def build_documents(
+    units: list[str],
+    *,
+    target_bytes: int,
+    count: int,
+    separator: str,
+) -> list[str]:
+    """Concatenate units until each document reaches `target_bytes`.
+
+    Units are consumed cyclically and every document starts where the
+    previous one stopped, so documents of one size do not repeat each other
+    until the source runs out.
+    """
+    separator_bytes = len(separator.encode('utf-8'))
+    unit_bytes = [len(unit.encode('utf-8')) for unit in units]
+    documents: list[str] = []
+    cursor = 0
+    for _ in range(count):
+        parts: list[str] = []
+        size = 0
+        while size < target_bytes:
+            index = cursor % len(units)
+            size += unit_bytes[index] + (separator_bytes if parts else 0)
+            parts.append(units[index])
+            cursor += 1
+        documents.append(separator.join(parts))
+    return documents
+
+
+class StreamingCorpus:
+    """Re-iterable corpus view that decodes lines lazily from an mmap.
+
+    Each iteration maps `[start_byte, end_byte)` of the file and yields
+    `(sentence, char_count)` rows one line at a time, so memory stays
+    constant regardless of corpus size. Blank lines are skipped, matching
+    `load_sentences`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        start_byte: int = 0,
+        end_byte: int | None = None,
+    ) -> None:
+        if not path.exists():
+            raise FileNotFoundError(f'Corpus not found: {path}')
+        size = path.stat().st_size
+        if size == 0:
+            raise ValueError(f'Corpus is empty: {path}')
+        self.path = path
+        self.start_byte = start_byte
+        self.end_byte = size if end_byte is None else min(end_byte, size)
+        self._row_count: int | None = None
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        with self.path.open('rb') as handle, mmap.mmap(
+            handle.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            position = self.start_byte
+            end = self.end_byte
+            while position < end:
+                newline = mapped.find(b'\n', position, end)
+                if newline == -1:
+                    newline = end
+                line = mapped[position:newline].decode('utf-8').strip()
+                position = newline + 1
+                if line:
+                    yield line, len(line)
+
+    def __len__(self) -> int:
+        if self._row_count is None:
+            self._row_count = sum(1 for _ in self)
+        return self._row_count
+
+    def shard(self, shard_count: int) -> list[StreamingCorpus]:
+        """Split the byte range into `shard_count` line-aligned ranges."""
+        boundaries = [self.start_byte]
+        with self.path.open('rb') as handle, mmap.mmap(
+            handle.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            span = self.end_byte - self.start_byte
+            for index in range(1, shard_count):
+                nominal = self.start_byte + (span * index) // shard_count
+                nominal = max(nominal, boundaries[-1])
+                newline = mapped.find(b'\n', nominal, self.end_byte)
+                boundaries.append(
+                    self.end_byte if newline == -1 else newline + 1
+                )
+        boundaries.append(self.end_byte)
+        return [
+            StreamingCorpus(self.path, boundaries[index], boundaries[index + 1])
+            for index in range(shard_count)
+        ]
+
+
+def shard_rows(
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    shard_count: int,
+) -> list[Any]:
+    if isinstance(sentence_rows, (StreamingCorpus, BinaryCorpus)):
+        return sentence_rows.shard(shard_count)
+    return [sentence_rows[index::shard_count] for index in range(shard_count)]
+
+
+def build_replay_rows(
+    sentence_rows: list[tuple[str, int]],
+    duplicate_rate: float,
+    *,
+    seed: int,
+) -> list[tuple[str, int]]:
+    """Reorder the corpus into a pass with a controlled duplicate rate.
 
+    The pass keeps the corpus length. Each slot repeats an earlier row of
+    the pass with probability `duplicate_rate`, otherwise it takes the next
+    unused row.
+    """
+    rng = random.Random(seed)
+    replay: list[tuple[str, int]] = []
+    fresh_index = 0
+    for _ in range(len(sentence_rows)):
+        if replay and (
+            rng.random() < duplicate_rate or fresh_index >= len(sentence_rows)
+        ):
+            replay.append(rng.choice(replay))
+        else:
+            replay.append(sentence_rows[fresh_index])
+            fresh_index += 1
+    return replay
+
+
+def select_sample_sentences(
+    sentence_rows: Iterable[tuple[str, int]],
+    *,
+    sample_count: int,
+    reservoir: bool,
+    seed: int,
+) -> list[str]:
+    """Pick sample sentences in one pass (first N or reservoir sample)."""
+    if sample_count <= 0:
+        return []
+
+    if reservoir and isinstance(sentence_rows, BinaryCorpus):
+        # Compiled corpora know their length, so sample by random access.
+        return sentence_rows.sample(sample_count, seed=seed)
+
+    selected: list[str] = []
+    if not reservoir:
+        for sentence, _ in sentence_rows:
+            selected.append(sentence)
+            if len(selected) >= sample_count:
+                break
+        return selected
+
+    # Algorithm R keeps a uniform sample without knowing the corpus size.
+    rng = random.Random(seed)
+    for index, (sentence, _) in enumerate(sentence_rows):
+        if index < sample_count:
+            selected.append(sentence)
+            continue
+        slot = rng.randint(0, index)
+        if slot < sample_count:
+            selected[slot] = sentence
+    return selected
+
+
+def describe_corpus(path: Path) -> dict[str, Any]:
+    """Identify the measured corpus by content hash.
+
+    Corpora from `generate_corpus.py` carry a manifest with a precomputed
+    hash, which avoids rehashing multi-GB files on every run. The manifest
+    hash is trusted only while the file size still matches. Compiled
+    corpora report the hash of their text source from the binary header, so
+    text and compiled runs of the same corpus compare as the same input.
+    """
+    compiled = open_compiled_corpus(path)
+    if compiled is not None:
+        return {
+            'corpus_file': path.name,
+            'corpus_bytes': compiled.source_bytes,
+            'corpus_sha256': compiled.source_sha256,
+            'corpus_hash_source': 'binary_header',
+            'corpus_format': 'binary',
+            'corpus_compiled_file': compiled.path.name,
+        }
+
+    corpus_bytes = path.stat().st_size
+    manifest_path = path.with_name(path.name + CORPUS_MANIFEST_SUFFIX)
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if (
+            isinstance(manifest, dict)
+            and manifest.get('corpus_bytes') == corpus_bytes
+            and isinstance(manifest.get('corpus_sha256'), str)
+        ):
+            return {
+                'corpus_file': path.name,
+                'corpus_bytes': corpus_bytes,
+                'corpus_sha256': manifest['corpus_sha256'],
+                'corpus_hash_source': 'manifest',
+                'corpus_format': 'text',
+                'corpus_manifest': {
+                    key: manifest.get(key)
+                    for key in ('seed', 'sentence_count', 'target', 'achieved')
+                },
+            }
+
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return {
+        'corpus_file': path.name,
+        'corpus_bytes': corpus_bytes,
+        'corpus_sha256': digest.hexdigest(),
+        'corpus_hash_source': 'computed',
+        'corpus_format': 'text',
+    }
+
+
+def build_kiwi_kwargs(config: BenchmarkConfig) -> dict[str, Any]:
+    """Map benchmark options to `Kiwi(...)` kwargs before signature filtering."""
     kwargs: dict[str, Any] = {
         'num_workers': config.num_workers,
         'integrate_allomorph': (config.build_options & INTEGRATE_ALLOMORPH)
@@ -240,42 +1686,316 @@ def create_kiwi(config: BenchmarkConfig) -> Any:
         kwargs['model_type'] = model_type
     if config.model_path:
         kwargs['model_path'] = config.model_path
+    return kwargs
 
-    supported = set(inspect.signature(Kiwi.__init__).parameters)
-    supported.discard('self')
-    filtered_kwargs = {
-        key: value for key, value in kwargs.items() if key in supported
-    }
-    return Kiwi(**filtered_kwargs)
+
+def backend_class(config: BenchmarkConfig) -> Any:
+    return load_backend_class(
+        config.backend,
+        call_cost_us=config.fake_call_cost_us,
+        char_cost_us=config.fake_char_cost_us,
+    )
+
+
+def create_kiwi(config: BenchmarkConfig) -> Any:
+    """Build a fresh `Kiwi`, bypassing the pool (memory and cold probes)."""
+    kiwi_class = backend_class(config)
+    return kiwi_class(**filter_kiwi_kwargs(kiwi_class, build_kiwi_kwargs(config)))
+
+
+def acquire_kiwi(
+    config: BenchmarkConfig,
+    kiwi_pool: KiwiPool | None = None,
+) -> KiwiLease:
+    pool = (
+        kiwi_pool
+        if kiwi_pool is not None
+        else KiwiPool(0, kiwi_class=backend_class(config))
+    )
+    return pool.acquire(build_kiwi_kwargs(config))
+
+
+class JoinInputKiwi:
+    """`Kiwi` proxy whose `join_sentence` times only `Kiwi.join`.
+
+    `join` consumes morphemes rather than text, so each corpus sentence is
+    tokenized once and memoized; `prime` fills the memo before warm-up so
+    no tokenize call lands inside a timed pass.
+    """
+
+    def __init__(self, kiwi: Any) -> None:
+        self._kiwi = kiwi
+        self._morphs: dict[str, list[tuple[str, str]]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._kiwi, name)
+
+    def morphs(self, sentence: str) -> list[tuple[str, str]]:
+        morphs = self._morphs.get(sentence)
+        if morphs is None:
+            morphs = [
+                (token.form, token.tag) for token in self._kiwi.tokenize(sentence)
+            ]
+            self._morphs[sentence] = morphs
+        return morphs
+
+    def prime(self, sentences: Iterable[str]) -> None:
+        for sentence in sentences:
+            self.morphs(sentence)
+
+    def join_sentence(self, sentence: str) -> str:
+        return self._kiwi.join(self.morphs(sentence))
+
+
+def bind_analyze_impl(
+    kiwi: Any,
+    sentence_rows: Iterable[tuple[str, int]],
+    analyze_impl: str,
+) -> Any:
+    """Wrap `kiwi` with whatever untimed inputs the API path needs."""
+    if analyze_impl != _ANALYZE_IMPL_JOIN:
+        return kiwi
+    join_kiwi = JoinInputKiwi(kiwi)
+    # Streaming corpora are not held in memory, so they memoize lazily and
+    # rely on warm-up to absorb the tokenize calls.
+    if isinstance(sentence_rows, list):
+        join_kiwi.prime(sentence for sentence, _ in sentence_rows)
+    return join_kiwi
 
 
 def run_measurement(
     kiwi: Any,
-    sentence_rows: list[tuple[str, int]],
+    sentence_rows: Iterable[tuple[str, int]],
     *,
     runs: int,
     top_n: int,
     match_options: int,
     analyze_impl: str,
+    execution_mode: str = _EXECUTION_MODE_SINGLE,
+    batch_size: int = 0,
+    cache: AnalysisCache | None = None,
 ) -> RunStats:
+    """Time `runs` passes over the corpus.
+
+    With a cache, entries are cleared at the start of every pass so the hit
+    rate reflects repetition within one pass rather than replayed passes.
+    The timed loop only appends raw per-call samples; the latency histogram
+    and length buckets are filled between passes, off the clock.
+    """
+    if execution_mode == _EXECUTION_MODE_BATCH:
+        return run_batch_measurement(
+            kiwi,
+            sentence_rows,
+            runs=runs,
+            top_n=top_n,
+            match_options=match_options,
+            analyze_impl=analyze_impl,
+            batch_size=batch_size,
+        )
+
     total_analyses = 0
     total_chars = 0
     total_tokens = 0
-
-    started = time.perf_counter()
+    latency = LatencyHistogram()
+    length_breakdown = LengthBreakdown()
+    clock_ns = time.perf_counter_ns
+    elapsed_ns = 0
+    # In-memory corpora resolve their bucket keys once; streaming corpora
+    # re-read the stream after each pass instead of holding the keys.
+    bucket_keys: list[tuple[int, int, int, int]] | None = None
+    if isinstance(sentence_rows, list):
+        bucket_keys = list(LengthBreakdown.iter_bucket_keys(sentence_rows))
 
     for _ in range(runs):
-        for sentence, sentence_chars in sentence_rows:
+        if cache is not None:
+            cache.clear()
+        call_ns_samples = array.array('q')
+        token_samples = array.array('q')
+        append_call_ns = call_ns_samples.append
+        append_tokens = token_samples.append
+        pass_started_ns = clock_ns()
+        for sentence, _ in sentence_rows:
+            call_started_ns = clock_ns()
             tokens = analyze_sentence_tokens(
                 kiwi,
                 sentence,
                 top_n=top_n,
                 match_options=match_options,
                 analyze_impl=analyze_impl,
+                cache=cache,
+            )
+            append_call_ns(clock_ns() - call_started_ns)
+            append_tokens(len(tokens))
+        elapsed_ns += clock_ns() - pass_started_ns
+
+        keys = (
+            bucket_keys
+            if bucket_keys is not None
+            else LengthBreakdown.iter_bucket_keys(sentence_rows)
+        )
+        for key, call_ns, token_count in zip(
+            keys,
+            call_ns_samples,
+            token_samples,
+        ):
+            latency.record(call_ns)
+            length_breakdown.record(key, token_count, call_ns)
+            total_chars += key[0]
+        total_analyses += len(call_ns_samples)
+        total_tokens += sum(token_samples)
+
+    elapsed_ms = elapsed_ns / 1e6
+    return RunStats(
+        elapsed_ms=elapsed_ms,
+        total_analyses=total_analyses,
+        total_chars=total_chars,
+        total_tokens=total_tokens,
+        latency=latency,
+        length_breakdown=length_breakdown,
+    )
+
+
+def run_layer_measurement(
+    kiwi: Any,
+    sentence_rows: Iterable[tuple[str, int]],
+    *,
+    runs: int,
+    top_n: int,
+    match_options: int,
+    analyze_impl: str,
+) -> dict[str, Any]:
+    """Split per-analysis cost into native call, extraction and formatting.
+
+    `pure` covers only the native `analyze`/`tokenize` call, mirroring the
+    Flutter `token_count` path. `full` adds best-candidate extraction and
+    materialising `form/tag` text, mirroring the Flutter `json` path.
+    """
+    clock_ns = time.perf_counter_ns
+    native_ns = 0
+    extract_ns = 0
+    format_ns = 0
+    total_analyses = 0
+
+    started_ns = clock_ns()
+    for _ in range(runs):
+        for sentence, _ in sentence_rows:
+            call_started_ns = clock_ns()
+            result = call_native_analyze(
+                kiwi,
+                sentence,
+                top_n=top_n,
+                match_options=match_options,
+                analyze_impl=analyze_impl,
             )
+            extract_started_ns = clock_ns()
+            tokens = extract_tokens(result, analyze_impl=analyze_impl)
+            format_started_ns = clock_ns()
+            build_top1_text(tokens)
+            format_ended_ns = clock_ns()
+
+            native_ns += extract_started_ns - call_started_ns
+            extract_ns += format_started_ns - extract_started_ns
+            format_ns += format_ended_ns - format_started_ns
             total_analyses += 1
-            total_chars += sentence_chars
-            total_tokens += len(tokens)
+    full_ns = clock_ns() - started_ns
+
+    pure_elapsed_ms = native_ns / 1e6
+    full_elapsed_ms = full_ns / 1e6
+    python_overhead_ms = max(0.0, full_elapsed_ms - pure_elapsed_ms)
+    return {
+        'pure_elapsed_ms': pure_elapsed_ms,
+        'extract_elapsed_ms': extract_ns / 1e6,
+        'format_elapsed_ms': format_ns / 1e6,
+        'full_elapsed_ms': full_elapsed_ms,
+        'pure_analyses_per_sec': safe_divide(
+            total_analyses,
+            pure_elapsed_ms / 1000.0,
+        ),
+        'full_analyses_per_sec': safe_divide(
+            total_analyses,
+            full_elapsed_ms / 1000.0,
+        ),
+        'python_overhead_ms': python_overhead_ms,
+        'python_overhead_percent': (
+            safe_divide(python_overhead_ms, full_elapsed_ms) * 100.0
+        ),
+        'python_overhead_per_analysis_us': safe_divide(
+            python_overhead_ms * 1000.0,
+            total_analyses,
+        ),
+    }
+
+
+def iter_batches(
+    sentence_rows: Iterable[tuple[str, int]],
+    batch_size: int,
+) -> Iterator[tuple[list[str], int]]:
+    """Yield `(sentences, char_count)` chunks for batch mode.
+
+    `batch_size <= 0` yields the whole corpus as one chunk.
+    """
+    batch: list[str] = []
+    batch_chars = 0
+    for sentence, sentence_chars in sentence_rows:
+        batch.append(sentence)
+        batch_chars += sentence_chars
+        if 0 < batch_size <= len(batch):
+            yield batch, batch_chars
+            batch = []
+            batch_chars = 0
+    if batch:
+        yield batch, batch_chars
+
+
+def run_batch_measurement(
+    kiwi: Any,
+    sentence_rows: Iterable[tuple[str, int]],
+    *,
+    runs: int,
+    top_n: int,
+    match_options: int,
+    analyze_impl: str,
+    batch_size: int,
+) -> RunStats:
+    total_analyses = 0
+    total_chars = 0
+    total_tokens = 0
+    # Batch mode has no per-sentence boundary, so the histogram holds
+    # per-chunk latency instead (`latency_scope: batch` in the payload).
+    latency = LatencyHistogram()
+    clock_ns = time.perf_counter_ns
+    # Pre-split in-memory corpora so chunking stays outside the timed loop;
+    # streaming corpora are chunked lazily to keep memory flat.
+    batches: list[tuple[list[str], int]] | None = None
+    if isinstance(sentence_rows, list):
+        batches = list(iter_batches(sentence_rows, batch_size))
+
+    started = time.perf_counter()
+
+    for _ in range(runs):
+        run_batches = (
+            batches
+            if batches is not None
+            else iter_batches(sentence_rows, batch_size)
+        )
+        for batch_sentences, batch_chars in run_batches:
+            call_started_ns = clock_ns()
+            token_lists = analyze_batch_tokens(
+                kiwi,
+                batch_sentences,
+                top_n=top_n,
+                match_options=match_options,
+                analyze_impl=analyze_impl,
+            )
+            latency.record(clock_ns() - call_started_ns)
+            if len(token_lists) != len(batch_sentences):
+                raise RuntimeError(
+                    'Unexpected analyze batch size: '
+                    f'expected {len(batch_sentences)}, got {len(token_lists)}.'
+                )
+            total_analyses += len(batch_sentences)
+            total_chars += batch_chars
+            total_tokens += sum(len(tokens) for tokens in token_lists)
 
     elapsed_ms = (time.perf_counter() - started) * 1000.0
     return RunStats(
@@ -283,9 +2003,50 @@ def run_measurement(
         total_analyses=total_analyses,
         total_chars=total_chars,
         total_tokens=total_tokens,
+        latency=latency,
     )
 
 
+def analyze_batch_tokens(
+    kiwi: Any,
+    sentences: list[str],
+    *,
+    top_n: int,
+    match_options: int,
+    analyze_impl: str,
+) -> list[list[Any]]:
+    """Run kiwipiepy's iterable API and keep first-candidate tokens."""
+    if analyze_impl == _ANALYZE_IMPL_SPLIT:
+        return [
+            extract_tokens(result, analyze_impl=analyze_impl)
+            for result in kiwi.split_into_sents(
+                sentences,
+                match_options=match_options,
+            )
+        ]
+    if analyze_impl == _ANALYZE_IMPL_SPACE:
+        return [
+            extract_tokens(result, analyze_impl=analyze_impl)
+            for result in kiwi.space(sentences)
+        ]
+    if analyze_impl == _ANALYZE_IMPL_TOKENIZE:
+        return [
+            list(tokens)
+            for tokens in kiwi.tokenize(
+                sentences,
+                match_options=match_options,
+            )
+        ]
+    return [
+        extract_best_candidate_tokens(result)
+        for result in kiwi.analyze(
+            sentences,
+            top_n=top_n,
+            match_options=match_options,
+        )
+    ]
+
+
 def analyze_sentence_tokens(
     kiwi: Any,
     sentence: str,
@@ -293,23 +2054,83 @@ def analyze_sentence_tokens(
     top_n: int,
     match_options: int,
     analyze_impl: str,
+    cache: AnalysisCache | None = None,
 ) -> list[Any]:
-    if analyze_impl == _ANALYZE_IMPL_TOKENIZE:
-        return extract_tokenize_tokens(
-            kiwi.tokenize(
-                sentence,
+    if cache is not None:
+        # Analyze the same normalized text the key is built from, so every
+        # sentence sharing a key gets tokens (and offsets) for that text.
+        normalized = cache.normalize(sentence)
+        key = cache.make_key(
+            normalized,
+            top_n=top_n,
+            match_options=match_options,
+            analyze_impl=analyze_impl,
+        )
+        tokens = cache.get(key)
+        if tokens is None:
+            tokens = analyze_sentence_tokens(
+                kiwi,
+                normalized,
+                top_n=top_n,
                 match_options=match_options,
+                analyze_impl=analyze_impl,
             )
-        )
-    return extract_best_candidate_tokens(
-        kiwi.analyze(
+            cache.put(key, tokens)
+        return tokens
+
+    return extract_tokens(
+        call_native_analyze(
+            kiwi,
             sentence,
             top_n=top_n,
             match_options=match_options,
+            analyze_impl=analyze_impl,
+        ),
+        analyze_impl=analyze_impl,
+    )
+
+
+def call_native_analyze(
+    kiwi: Any,
+    sentence: str,
+    *,
+    top_n: int,
+    match_options: int,
+    analyze_impl: str,
+) -> Any:
+    """Invoke the native API and return its raw result untouched."""
+    if analyze_impl == _ANALYZE_IMPL_TOKENIZE:
+        return kiwi.tokenize(
+            sentence,
+            match_options=match_options,
+        )
+    if analyze_impl == _ANALYZE_IMPL_SPLIT:
+        return kiwi.split_into_sents(
+            sentence,
+            match_options=match_options,
         )
+    if analyze_impl == _ANALYZE_IMPL_SPACE:
+        return kiwi.space(sentence)
+    if analyze_impl == _ANALYZE_IMPL_JOIN:
+        return kiwi.join_sentence(sentence)
+    return kiwi.analyze(
+        sentence,
+        top_n=top_n,
+        match_options=match_options,
     )
 
 
+def extract_tokens(result: Any, *, analyze_impl: str) -> list[Any]:
+    """Normalize an API result into the units counted as output tokens."""
+    if analyze_impl == _ANALYZE_IMPL_TOKENIZE:
+        return extract_tokenize_tokens(result)
+    if analyze_impl == _ANALYZE_IMPL_SPLIT:
+        return [getattr(sentence, 'text', sentence) for sentence in result]
+    if analyze_impl in (_ANALYZE_IMPL_SPACE, _ANALYZE_IMPL_JOIN):
+        return str(result).split()
+    return extract_best_candidate_tokens(result)
+
+
 def extract_best_candidate_tokens(result: Any) -> list[Any]:
     if not result:
         return []
@@ -413,37 +2234,685 @@ def safe_divide(numerator: float, denominator: float) -> float:
     return numerator / denominator
 
 
-def to_payload(
-    *,
-    config: BenchmarkConfig,
-    sentence_count: int,
-    init_ms: float,
-    stats: RunStats,
-    sample_outputs: list[dict[str, Any]],
-) -> dict[str, Any]:
-    elapsed_seconds = stats.elapsed_ms / 1000.0
-    return {
-        'runtime': 'kiwipiepy',
-        'platform': platform.platform(),
-        'generated_at_utc': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
-        'warmup_runs': config.warmup_runs,
-        'measure_runs': config.measure_runs,
-        'top_n': config.top_n,
-        'num_workers': config.num_workers,
-        'build_options': config.build_options,
-        'create_match_options': config.create_match_options,
-        'analyze_match_options': config.analyze_match_options,
-        'analyze_impl': config.analyze_impl,
-        'trial_id': config.trial_id,
-        'model_type': resolve_model_type(config.build_options) or 'none',
-        'sentence_count': sentence_count,
-        'sample_count': len(sample_outputs),
-        'init_ms': init_ms,
-        'elapsed_ms': stats.elapsed_ms,
-        'total_analyses': stats.total_analyses,
-        'total_chars': stats.total_chars,
-        'total_tokens': stats.total_tokens,
-        'analyses_per_sec': safe_divide(stats.total_analyses, elapsed_seconds),
+def read_rss_bytes() -> int | None:
+    """Return the current resident set size, or None when unavailable.
+
+    `getrusage` is deliberately not a fallback: it only reports the
+    high-water mark, which is exposed separately as `peak_rss_*`.
+    """
+    try:
+        with open('/proc/self/statm', encoding='ascii') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return int(psutil.Process().memory_info().rss)
+
+
+def read_peak_rss_bytes() -> int | None:
+    """Return the process high-water RSS from `getrusage`, if supported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    if sys.platform == 'darwin':
+        return int(peak)
+    return int(peak) * 1024
+
+
+class RssSampler:
+    """Poll RSS on a background thread to find the peak of one phase.
+
+    `getrusage` only exposes the process-lifetime high-water mark, which
+    model loading already dominates, so the measured phase is sampled
+    directly instead.
+    """
+
+    def __init__(self, interval_seconds: float = 0.01) -> None:
+        self.interval_seconds = interval_seconds
+        self.peak_bytes: int | None = None
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        rss = read_rss_bytes()
+        if rss is None:
+            return
+        self.sample_count += 1
+        if self.peak_bytes is None or rss > self.peak_bytes:
+            self.peak_bytes = rss
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def __enter__(self) -> RssSampler:
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+
+class GcMonitor:
+    """Record cyclic GC pauses per generation through `gc.callbacks`.
+
+    On entry it also applies the requested GC mode, and restores the
+    collector state on exit. `gc.freeze` moves every live object into the
+    permanent generation, so the Kiwi instance and warm-up garbage are not
+    rescanned by collections triggered during measurement.
+    """
+
+    def __init__(self, mode: str = _GC_MODE_ENABLED) -> None:
+        self.mode = mode
+        self.collections = [0] * GC_GENERATIONS
+        self.pause_ns = [0] * GC_GENERATIONS
+        self.max_pause_ns = 0
+        self.collected_objects = 0
+        self._started_ns: int | None = None
+        self._was_enabled = True
+
+    def _callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == 'start':
+            self._started_ns = time.perf_counter_ns()
+            return
+        if self._started_ns is None:
+            return
+        pause_ns = time.perf_counter_ns() - self._started_ns
+        self._started_ns = None
+        generation = min(int(info.get('generation', 0)), GC_GENERATIONS - 1)
+        self.collections[generation] += 1
+        self.pause_ns[generation] += pause_ns
+        self.max_pause_ns = max(self.max_pause_ns, pause_ns)
+        self.collected_objects += int(info.get('collected', 0))
+
+    def __enter__(self) -> GcMonitor:
+        self._was_enabled = gc.isenabled()
+        if self.mode == _GC_MODE_FREEZE:
+            gc.collect()
+            gc.freeze()
+        elif self.mode == _GC_MODE_DISABLED:
+            gc.disable()
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        gc.callbacks.remove(self._callback)
+        if self.mode == _GC_MODE_FREEZE:
+            gc.unfreeze()
+        elif self.mode == _GC_MODE_DISABLED and self._was_enabled:
+            gc.enable()
+
+    def to_payload(self, elapsed_ms: float) -> dict[str, Any]:
+        pause_ms = sum(self.pause_ns) / 1e6
+        payload: dict[str, Any] = {
+            'gc_mode': self.mode,
+            'gc_collections': sum(self.collections),
+            'gc_pause_ms': pause_ms,
+            'gc_pause_max_ms': self.max_pause_ns / 1e6,
+            'gc_time_share': safe_divide(pause_ms, elapsed_ms),
+            'gc_collected_objects': self.collected_objects,
+        }
+        for generation in range(GC_GENERATIONS):
+            payload[f'gc_gen{generation}_collections'] = (
+                self.collections[generation]
+            )
+            payload[f'gc_gen{generation}_pause_ms'] = (
+                self.pause_ns[generation] / 1e6
+            )
+        return payload
+
+
+def read_process_cpu_seconds() -> tuple[float, float]:
+    """Return (user, system) CPU seconds of this process, all threads."""
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime, usage.ru_stime
+    times = os.times()
+    return times.user, times.system
+
+
+def read_thread_cpu_seconds() -> dict[int, float] | None:
+    """Per-thread user+system CPU seconds from `/proc`, or None elsewhere."""
+    try:
+        ticks_per_second = os.sysconf('SC_CLK_TCK')
+        task_ids = os.listdir('/proc/self/task')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    thread_seconds: dict[int, float] = {}
+    for task_id in task_ids:
+        try:
+            with open(f'/proc/self/task/{task_id}/stat', encoding='ascii') as stat:
+                # Fields after the parenthesized comm start at field 3 (state);
+                # utime and stime are fields 14 and 15.
+                fields = stat.read().rsplit(')', 1)[1].split()
+            thread_seconds[int(task_id)] = (
+                int(fields[11]) + int(fields[12])
+            ) / ticks_per_second
+        except (OSError, ValueError, IndexError):
+            continue
+    return thread_seconds
+
+
+def cpu_cost_payload(
+    *,
+    user_seconds: float,
+    system_seconds: float,
+    elapsed_ms: float,
+    total_analyses: int,
+    text_bytes: float,
+) -> dict[str, Any]:
+    cpu_seconds = user_seconds + system_seconds
+    return {
+        'cpu_user_seconds': user_seconds,
+        'cpu_system_seconds': system_seconds,
+        'cpu_seconds': cpu_seconds,
+        'cpu_seconds_per_1k_analyses': safe_divide(
+            cpu_seconds * 1000.0,
+            total_analyses,
+        ),
+        'cpu_seconds_per_mb': safe_divide(cpu_seconds, text_bytes / 1e6),
+        'avg_cores_busy': safe_divide(cpu_seconds, elapsed_ms / 1000.0),
+    }
+
+
+class CpuTimer:
+    """Account process CPU time, split by thread, across one phase.
+
+    Wall-clock throughput alone cannot tell efficiency from parallelism:
+    `avg_cores_busy` shows how many cores a configuration burned to reach
+    its rate. Thread counts include the RSS sampler and profiler threads,
+    which stay idle most of the time.
+    """
+
+    def __init__(self) -> None:
+        self.user_seconds = 0.0
+        self.system_seconds = 0.0
+        self.main_thread_seconds = 0.0
+        self.thread_seconds: dict[int, float] | None = None
+        self._started: tuple[float, float] = (0.0, 0.0)
+        self._thread_started = 0.0
+        self._threads_before: dict[int, float] | None = None
+
+    def __enter__(self) -> CpuTimer:
+        self._threads_before = read_thread_cpu_seconds()
+        self._thread_started = time.thread_time()
+        self._started = read_process_cpu_seconds()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        user_seconds, system_seconds = read_process_cpu_seconds()
+        self.main_thread_seconds = time.thread_time() - self._thread_started
+        self.user_seconds = user_seconds - self._started[0]
+        self.system_seconds = system_seconds - self._started[1]
+        threads_after = read_thread_cpu_seconds()
+        if self._threads_before is not None and threads_after is not None:
+            self.thread_seconds = {
+                task_id: seconds - self._threads_before.get(task_id, 0.0)
+                for task_id, seconds in threads_after.items()
+            }
+
+    def to_payload(
+        self,
+        *,
+        elapsed_ms: float,
+        total_analyses: int,
+        text_bytes: float,
+    ) -> dict[str, Any]:
+        payload = cpu_cost_payload(
+            user_seconds=self.user_seconds,
+            system_seconds=self.system_seconds,
+            elapsed_ms=elapsed_ms,
+            total_analyses=total_analyses,
+            text_bytes=text_bytes,
+        )
+        payload['cpu_main_thread_seconds'] = self.main_thread_seconds
+        payload['cpu_other_threads_seconds'] = max(
+            0.0,
+            payload['cpu_seconds'] - self.main_thread_seconds,
+        )
+        if self.thread_seconds is not None:
+            busy = [seconds for seconds in self.thread_seconds.values() if seconds > 0]
+            payload['cpu_threads_busy'] = len(busy)
+            payload['cpu_thread_seconds_max'] = max(busy, default=0.0)
+        return payload
+
+
+def measured_text_bytes(
+    sentence_rows: Iterable[tuple[str, int]],
+    total_analyses: int,
+) -> float:
+    """UTF-8 bytes analyzed, scaling one corpus pass to `total_analyses`."""
+    row_count = 0
+    corpus_bytes = 0
+    for sentence, _ in sentence_rows:
+        row_count += 1
+        corpus_bytes += len(sentence.encode('utf-8'))
+    return corpus_bytes * safe_divide(total_analyses, row_count)
+
+
+def apply_cpu_affinity(config: BenchmarkConfig) -> tuple[int, ...] | None:
+    """Pin this process per `--cpu-affinity`/`--isolate`; return the mask.
+
+    Under `--isolate` without `--processes`, the process keeps only as many
+    cores as Kiwi will run worker threads on. Process-pool workers are
+    pinned separately by `pin_process_worker`.
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return None
+    if config.cpu_affinity:
+        os.sched_setaffinity(0, config.cpu_affinity)
+    cpus = tuple(sorted(os.sched_getaffinity(0)))
+    if config.isolate and not config.processes:
+        core_count = min(len(cpus), resolve_effective_workers(config.num_workers))
+        cpus = cpus[:core_count]
+        os.sched_setaffinity(0, cpus)
+    return cpus
+
+
+def pin_process_worker(process_index: int) -> tuple[int, ...] | None:
+    """Pin a pool worker to one core of the inherited mask, round-robin."""
+    if not hasattr(os, 'sched_getaffinity'):
+        return None
+    cpus = sorted(os.sched_getaffinity(0))
+    cpu = cpus[process_index % len(cpus)]
+    os.sched_setaffinity(0, (cpu,))
+    return (cpu,)
+
+
+def read_cpu_busy_ticks() -> dict[int, tuple[int, int]] | None:
+    """Per-CPU (busy, total) jiffies from `/proc/stat`, or None elsewhere."""
+    try:
+        with open('/proc/stat', encoding='ascii') as stat:
+            lines = stat.read().splitlines()
+    except OSError:
+        return None
+
+    ticks: dict[int, tuple[int, int]] = {}
+    for line in lines:
+        fields = line.split()
+        if not fields or not fields[0].startswith('cpu') or fields[0] == 'cpu':
+            continue
+        try:
+            values = [int(value) for value in fields[1:]]
+            cpu = int(fields[0][3:])
+        except ValueError:
+            continue
+        # idle and iowait are the 4th and 5th counters.
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        total = sum(values[:8])
+        ticks[cpu] = (total - idle, total)
+    return ticks
+
+
+def read_cpufreq_value(cpu: int, name: str) -> str | None:
+    try:
+        return (
+            Path(f'/sys/devices/system/cpu/cpu{cpu}/cpufreq/{name}')
+            .read_text(encoding='ascii')
+            .strip()
+        )
+    except OSError:
+        return None
+
+
+def read_cpu_boost_enabled() -> bool | None:
+    """Whether turbo/boost clocks are on, when the kernel exposes it."""
+    for path, enabled_value in (
+        ('/sys/devices/system/cpu/cpufreq/boost', '1'),
+        ('/sys/devices/system/cpu/intel_pstate/no_turbo', '0'),
+    ):
+        try:
+            value = Path(path).read_text(encoding='ascii').strip()
+        except OSError:
+            continue
+        return value == enabled_value
+    return None
+
+
+def probe_system_noise(cpus: tuple[int, ...] | None) -> dict[str, Any]:
+    """Check frequency scaling and background load before measuring.
+
+    The noise score is a weighted sum in [0, 1]: 0.6 x the busy share of
+    the pinned cores while this process sleeps, 0.2 x the 1-minute load
+    average per online CPU (capped at 1), and 0.2 when any pinned core
+    runs a non-`performance` governor or boost clocks are on.
+    """
+    probe_cpus = cpus or tuple(range(os.cpu_count() or 1))
+    before = read_cpu_busy_ticks()
+    time.sleep(NOISE_PROBE_SECONDS)
+    after = read_cpu_busy_ticks()
+
+    background_busy_share: float | None = None
+    if before is not None and after is not None:
+        busy_ticks = 0
+        total_ticks = 0
+        for cpu in probe_cpus:
+            if cpu in before and cpu in after:
+                busy_ticks += after[cpu][0] - before[cpu][0]
+                total_ticks += after[cpu][1] - before[cpu][1]
+        if total_ticks > 0:
+            background_busy_share = busy_ticks / total_ticks
+
+    load_per_cpu: float | None = None
+    try:
+        load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        pass
+
+    governors = sorted(
+        {
+            governor
+            for governor in (
+                read_cpufreq_value(cpu, 'scaling_governor') for cpu in probe_cpus
+            )
+            if governor is not None
+        }
+    )
+    boost_enabled = read_cpu_boost_enabled()
+    frequency_scaling = (
+        any(governor != 'performance' for governor in governors)
+        or boost_enabled is True
+    )
+
+    reasons: list[str] = []
+    if background_busy_share is not None and background_busy_share > 0.1:
+        reasons.append(
+            f'pinned cores {background_busy_share * 100.0:.0f}% busy before start'
+        )
+    if load_per_cpu is not None and load_per_cpu > 0.5:
+        reasons.append(f'load average {load_per_cpu:.2f} per CPU')
+    if frequency_scaling:
+        reasons.append(
+            'frequency scaling active '
+            f"(governor {'/'.join(governors) or 'unknown'}, boost {boost_enabled})"
+        )
+    noise_score = min(
+        1.0,
+        0.6 * (background_busy_share or 0.0)
+        + 0.2 * min(1.0, load_per_cpu or 0.0)
+        + (0.2 if frequency_scaling else 0.0),
+    )
+    return {
+        'cpu_affinity': list(cpus) if cpus is not None else None,
+        'cpu_governors': governors,
+        'cpu_boost_enabled': boost_enabled,
+        'background_busy_share': background_busy_share,
+        'load_avg_per_cpu': load_per_cpu,
+        'noise_score': noise_score,
+        'noise_reasons': reasons,
+        'noise_flagged': noise_score >= NOISE_SCORE_THRESHOLD,
+    }
+
+
+def format_profile_frame(filename: str, line: int, name: str) -> str:
+    return f'{Path(filename).name}:{line}({name})'
+
+
+class MeasurementProfiler:
+    """Profile one phase with cProfile or a wall-clock stack sampler.
+
+    The sampler walks the calling thread's Python stack from a background
+    thread, so it sees time spent inside native calls as the frame that
+    issued them and adds far less overhead than deterministic tracing.
+    """
+
+    def __init__(self, mode: str, *, interval_ms: float) -> None:
+        self.mode = mode
+        self.interval_seconds = interval_ms / 1000.0
+        self.sample_count = 0
+        self._profile: cProfile.Profile | None = None
+        self._stacks: dict[str, int] = {}
+        self._leaves: dict[str, int] = {}
+        self._target_ident = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self._target_ident)
+        if frame is None:
+            return
+        names: list[str] = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(
+                format_profile_frame(
+                    code.co_filename,
+                    code.co_firstlineno,
+                    code.co_name,
+                )
+            )
+            frame = frame.f_back
+        names.reverse()
+        stack = ';'.join(names)
+        self._stacks[stack] = self._stacks.get(stack, 0) + 1
+        self._leaves[names[-1]] = self._leaves.get(names[-1], 0) + 1
+        self.sample_count += 1
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def __enter__(self) -> MeasurementProfiler:
+        if self.mode == _PROFILE_CPROFILE:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def write_artifacts(self, output_path: Path, *, top_n: int) -> dict[str, Any]:
+        """Write pstats/collapsed files beside `output_path`; return a summary.
+
+        cProfile keeps only caller/callee edges, so its collapsed file has
+        two-frame `caller;callee` stacks weighted by self time in
+        microseconds. Sampled stacks are complete and weighted by sample
+        count.
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        stem = output_path.with_suffix('')
+        collapsed_path = stem.with_name(stem.name + PROFILE_COLLAPSED_SUFFIX)
+        summary: dict[str, Any] = {'profile_mode': self.mode}
+
+        collapsed_lines: list[str] = []
+        if self.mode == _PROFILE_CPROFILE:
+            pstats_path = stem.with_name(stem.name + PROFILE_PSTATS_SUFFIX)
+            assert self._profile is not None
+            self._profile.dump_stats(str(pstats_path))
+            stats = pstats.Stats(self._profile).stats
+            hot_spots: list[dict[str, Any]] = []
+            for func, (_, calls, self_s, cumulative_s, callers) in stats.items():
+                callee = format_profile_frame(*func)
+                hot_spots.append(
+                    {
+                        'function': callee,
+                        'calls': calls,
+                        'self_ms': self_s * 1000.0,
+                        'cumulative_ms': cumulative_s * 1000.0,
+                    }
+                )
+                for caller, edge in callers.items():
+                    edge_self_us = round(edge[2] * 1e6)
+                    if edge_self_us > 0:
+                        collapsed_lines.append(
+                            f'{format_profile_frame(*caller)};{callee} '
+                            f'{edge_self_us}'
+                        )
+            summary['profile_pstats_path'] = pstats_path.as_posix()
+        else:
+            interval_ms = self.interval_seconds * 1000.0
+            hot_spots = [
+                {
+                    'function': leaf,
+                    'samples': samples,
+                    'self_ms': samples * interval_ms,
+                }
+                for leaf, samples in self._leaves.items()
+            ]
+            collapsed_lines = [
+                f'{stack} {samples}' for stack, samples in self._stacks.items()
+            ]
+            summary['profile_sample_count'] = self.sample_count
+            summary['profile_interval_ms'] = interval_ms
+
+        collapsed_path.write_text(
+            '\n'.join(sorted(collapsed_lines)) + '\n',
+            encoding='utf-8',
+        )
+        hot_spots.sort(key=lambda row: row['self_ms'], reverse=True)
+        summary['profile_collapsed_path'] = collapsed_path.as_posix()
+        summary['profile_top_self_time'] = hot_spots[:top_n]
+        return summary
+
+
+def measure_python_allocations(
+    kiwi: Any,
+    sentence_rows: Iterable[tuple[str, int]],
+    *,
+    top_n: int,
+    match_options: int,
+    analyze_impl: str,
+) -> dict[str, Any]:
+    """Trace Python allocations for one untimed pass over the corpus.
+
+    Native Kiwi buffers are invisible to tracemalloc; this isolates the
+    Python-side result objects and extraction lists.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        peak_values: list[int] = []
+        for sentence, _ in sentence_rows:
+            tracemalloc.reset_peak()
+            before_bytes, _ = tracemalloc.get_traced_memory()
+            analyze_sentence_tokens(
+                kiwi,
+                sentence,
+                top_n=top_n,
+                match_options=match_options,
+                analyze_impl=analyze_impl,
+            )
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            peak_values.append(max(0, peak_bytes - before_bytes))
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return {
+        'py_alloc_analyses': len(peak_values),
+        'py_alloc_peak_per_analysis_bytes_mean': safe_divide(
+            sum(peak_values),
+            len(peak_values),
+        ),
+        'py_alloc_peak_per_analysis_bytes_max': max(peak_values, default=0),
+        'py_alloc_retained_bytes': retained_bytes - baseline_bytes,
+    }
+
+
+def build_option_flags(build_options: int) -> dict[str, Any]:
+    return {
+        'integrate_allomorph': (build_options & INTEGRATE_ALLOMORPH) != 0,
+        'load_default_dict': (build_options & LOAD_DEFAULT_DICT) != 0,
+        'load_typo_dict': (build_options & LOAD_TYPO_DICT) != 0,
+        'load_multi_dict': (build_options & LOAD_MULTI_DICT) != 0,
+        'model_type': resolve_model_type(build_options) or 'none',
+    }
+
+
+def latency_payload(latency: LatencyHistogram) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        f'latency_{label}_ms': latency.percentile_ns(quantile) / 1e6
+        for label, quantile in LATENCY_PERCENTILES
+    }
+    payload['latency_min_ms'] = latency.min_ns / 1e6
+    payload['latency_max_ms'] = latency.max_ns / 1e6
+    payload['latency_histogram'] = latency.to_payload()
+    return payload
+
+
+def run_metadata(config: BenchmarkConfig) -> dict[str, Any]:
+    """Configuration fields shared by every payload shape."""
+    return {
+        'runtime': 'kiwipiepy',
+        'backend': config.backend,
+        'platform': platform.platform(),
+        'generated_at_utc': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'warmup_runs': config.warmup_runs,
+        'adaptive_warmup': config.adaptive_warmup,
+        'measure_runs': config.measure_runs,
+        'top_n': config.top_n,
+        'num_workers': config.num_workers,
+        'build_options': config.build_options,
+        'create_match_options': config.create_match_options,
+        'analyze_match_options': config.analyze_match_options,
+        'analyze_impl': config.analyze_impl,
+        'output_unit': ANALYZE_IMPL_OUTPUT_UNITS[config.analyze_impl],
+        'execution_mode': config.execution_mode,
+        'stream_corpus': config.stream_corpus,
+        'replay_duplicate_rate': config.replay_duplicate_rate,
+        'batch_size': config.batch_size,
+        'latency_scope': (
+            'batch'
+            if config.execution_mode == _EXECUTION_MODE_BATCH
+            else 'analysis'
+        ),
+        'trial_id': config.trial_id,
+        'isolate': config.isolate,
+        **(
+            {
+                'fake_call_cost_us': config.fake_call_cost_us,
+                'fake_char_cost_us': config.fake_char_cost_us,
+            }
+            if config.backend == BACKEND_FAKE
+            else {}
+        ),
+        'model_type': resolve_model_type(config.build_options) or 'none',
+        'build_option_flags': build_option_flags(config.build_options),
+    }
+
+
+def to_payload(
+    *,
+    config: BenchmarkConfig,
+    sentence_count: int,
+    init_ms: float,
+    stats: RunStats,
+    sample_outputs: list[dict[str, Any]],
+) -> dict[str, Any]:
+    elapsed_seconds = stats.elapsed_ms / 1000.0
+    return {
+        **run_metadata(config),
+        'sentence_count': sentence_count,
+        'sample_count': len(sample_outputs),
+        'init_ms': init_ms,
+        'elapsed_ms': stats.elapsed_ms,
+        'total_analyses': stats.total_analyses,
+        'total_chars': stats.total_chars,
+        'total_tokens': stats.total_tokens,
+        'analyses_per_sec': safe_divide(stats.total_analyses, elapsed_seconds),
         'chars_per_sec': safe_divide(stats.total_chars, elapsed_seconds),
         'tokens_per_sec': safe_divide(stats.total_tokens, elapsed_seconds),
         'avg_latency_ms': safe_divide(stats.elapsed_ms, stats.total_analyses),
@@ -451,64 +2920,1737 @@ def to_payload(
             stats.elapsed_ms * 1000.0,
             stats.total_tokens,
         ),
+        **latency_payload(stats.latency),
+        **(
+            stats.length_breakdown.to_payload()
+            if stats.length_breakdown is not None
+            else {}
+        ),
         'sample_outputs': sample_outputs,
     }
 
 
-def main() -> int:
-    config = parse_args()
-    sentences = load_sentences(config.corpus_path)
-    sentence_rows = [(sentence, len(sentence)) for sentence in sentences]
+def resolve_effective_workers(num_workers: int) -> int:
+    """Map `num_workers=-1` to the core count kiwipiepy would pick."""
+    if num_workers > 0:
+        return num_workers
+    return os.cpu_count() or 1
 
-    init_started = time.perf_counter()
-    kiwi = create_kiwi(config)
-    init_ms = (time.perf_counter() - init_started) * 1000.0
 
-    run_measurement(
-        kiwi,
-        sentence_rows,
-        runs=config.warmup_runs,
-        top_n=config.top_n,
-        match_options=config.analyze_match_options,
-        analyze_impl=config.analyze_impl,
+def coefficient_of_variation(values: list[float]) -> float:
+    mean = statistics.fmean(values)
+    if mean <= 0 or len(values) < 2:
+        return 0.0
+    return statistics.stdev(values) / mean
+
+
+def run_warmup(
+    kiwi: Any,
+    sentence_rows: Iterable[tuple[str, int]],
+    config: BenchmarkConfig,
+    *,
+    execution_mode: str = _EXECUTION_MODE_SINGLE,
+) -> dict[str, Any]:
+    """Warm up for a fixed pass count, or until throughput settles.
+
+    Adaptive warm-up runs one pass at a time and stops once the last
+    `warmup_window` per-pass throughputs have a coefficient of variation
+    at or below `warmup_cv_threshold`, after at least `warmup_runs` passes.
+    """
+
+    def warmup_pass(runs: int) -> RunStats:
+        return run_measurement(
+            kiwi,
+            sentence_rows,
+            runs=runs,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+            execution_mode=execution_mode,
+            batch_size=config.batch_size,
+        )
+
+    if not config.adaptive_warmup:
+        warmup_pass(config.warmup_runs)
+        return {'warmup_mode': 'fixed', 'warmup_passes': config.warmup_runs}
+
+    min_passes = max(config.warmup_runs, config.warmup_window)
+    pass_throughputs: list[float] = []
+    window_cv: float | None = None
+    converged = False
+    while len(pass_throughputs) < config.warmup_max_runs:
+        stats = warmup_pass(1)
+        pass_throughputs.append(
+            safe_divide(stats.total_analyses, stats.elapsed_ms / 1000.0)
+        )
+        if len(pass_throughputs) < config.warmup_window:
+            continue
+        window_cv = coefficient_of_variation(
+            pass_throughputs[-config.warmup_window :]
+        )
+        if (
+            len(pass_throughputs) >= min_passes
+            and window_cv <= config.warmup_cv_threshold
+        ):
+            converged = True
+            break
+
+    return {
+        'warmup_mode': 'adaptive',
+        'warmup_passes': len(pass_throughputs),
+        'warmup_converged': converged,
+        'warmup_final_cv': window_cv,
+        'warmup_cv_threshold': config.warmup_cv_threshold,
+        'warmup_window': config.warmup_window,
+        'warmup_pass_analyses_per_sec': pass_throughputs,
+    }
+
+
+def merge_run_stats(passes: list[RunStats]) -> RunStats:
+    latency = LatencyHistogram()
+    length_breakdown: LengthBreakdown | None = None
+    for stats in passes:
+        latency.merge(stats.latency)
+        if stats.length_breakdown is not None:
+            if length_breakdown is None:
+                length_breakdown = LengthBreakdown()
+            length_breakdown.merge(stats.length_breakdown)
+    return RunStats(
+        elapsed_ms=sum(stats.elapsed_ms for stats in passes),
+        total_analyses=sum(stats.total_analyses for stats in passes),
+        total_chars=sum(stats.total_chars for stats in passes),
+        total_tokens=sum(stats.total_tokens for stats in passes),
+        latency=latency,
+        length_breakdown=length_breakdown,
     )
 
-    stats = run_measurement(
-        kiwi,
+
+def run_until_precise(
+    config: BenchmarkConfig,
+    measure_pass: Any,
+) -> tuple[RunStats, dict[str, Any]]:
+    """Add measured passes until the throughput CI is tight or time runs out.
+
+    `measure_pass()` times one pass. At least `measure_runs` passes run;
+    after that the loop stops once the bootstrap 95% CI half-width of
+    per-pass throughput is within `target_ci_percent` of the mean, or when
+    the wall-clock budget or pass cap is reached.
+    """
+    deadline = time.perf_counter() + config.time_budget_seconds
+    passes: list[RunStats] = []
+    pass_throughputs: list[float] = []
+    half_width_percent = math.inf
+    ci_low = ci_high = 0.0
+    converged = False
+    stop_reason = 'max_measure_runs'
+    while len(passes) < config.max_measure_runs:
+        stats = measure_pass()
+        passes.append(stats)
+        pass_throughputs.append(
+            safe_divide(stats.total_analyses, stats.elapsed_ms / 1000.0)
+        )
+        if len(passes) < config.measure_runs:
+            continue
+        ci_low, ci_high = bootstrap_mean_ci(
+            pass_throughputs,
+            resamples=config.bootstrap_resamples,
+            seed=config.sample_seed,
+        )
+        half_width_percent = (
+            safe_divide(
+                (ci_high - ci_low) / 2.0,
+                statistics.fmean(pass_throughputs),
+            )
+            * 100.0
+        )
+        if half_width_percent <= config.target_ci_percent:
+            converged = True
+            stop_reason = 'ci_target'
+            break
+        if time.perf_counter() >= deadline:
+            stop_reason = 'time_budget'
+            break
+
+    return merge_run_stats(passes), {
+        'measured_passes': len(passes),
+        'ci_target_percent': config.target_ci_percent,
+        'ci_converged': converged,
+        'ci_stop_reason': stop_reason,
+        'ci_half_width_percent': half_width_percent,
+        'ci_low_analyses_per_sec': ci_low,
+        'ci_high_analyses_per_sec': ci_high,
+        'time_budget_seconds': config.time_budget_seconds,
+        'pass_analyses_per_sec': pass_throughputs,
+    }
+
+
+class NoOpKiwi:
+    """Analyzer whose every API call returns a prebuilt empty result.
+
+    Batch calls still yield one result per input so chunk accounting runs.
+    """
+
+    _ANALYZE_RESULT: list[tuple[list[Any], float]] = [([], 0.0)]
+
+    def analyze(self, text: Any, **_: Any) -> Any:
+        if isinstance(text, str):
+            return self._ANALYZE_RESULT
+        return (self._ANALYZE_RESULT for _ in text)
+
+    def tokenize(self, text: Any, **_: Any) -> Any:
+        if isinstance(text, str):
+            return []
+        return ([] for _ in text)
+
+    def split_into_sents(self, text: Any, **_: Any) -> Any:
+        return self.tokenize(text)
+
+    def space(self, text: Any, **_: Any) -> Any:
+        if isinstance(text, str):
+            return ''
+        return ('' for _ in text)
+
+    def join(self, morphs: Any, **_: Any) -> str:
+        return ''
+
+
+def measure_harness_floor(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    stats: RunStats,
+) -> dict[str, Any]:
+    """Replay the measured loop against `NoOpKiwi`.
+
+    What remains is the harness's own per-call floor: loop and clock reads,
+    API dispatch, result normalization and sample accounting, with no
+    analyzer work at all. It is scaled to the main run's analysis count and
+    subtracted into the `net_*` metrics.
+    """
+    floor_kiwi = bind_analyze_impl(
+        NoOpKiwi(),
         sentence_rows,
-        runs=config.measure_runs,
-        top_n=config.top_n,
-        match_options=config.analyze_match_options,
-        analyze_impl=config.analyze_impl,
+        config.analyze_impl,
     )
-    sample_outputs = collect_sample_outputs(
-        kiwi,
-        sentences,
-        sample_count=config.sample_count,
-        top_n=config.top_n,
-        match_options=config.analyze_match_options,
-        analyze_impl=config.analyze_impl,
+
+    def replay(runs: int) -> RunStats:
+        return run_measurement(
+            floor_kiwi,
+            sentence_rows,
+            runs=runs,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+            execution_mode=config.execution_mode,
+            batch_size=config.batch_size,
+        )
+
+    # The first pass warms the loop (and the join input memo).
+    replay(1)
+    floor_runs = min(config.measure_runs, HARNESS_FLOOR_RUNS)
+    floor_stats = replay(floor_runs)
+    floor_per_analysis_ms = safe_divide(
+        floor_stats.elapsed_ms,
+        floor_stats.total_analyses,
     )
+    floor_ms = floor_per_analysis_ms * stats.total_analyses
+    net_elapsed_ms = max(0.0, stats.elapsed_ms - floor_ms)
+    return {
+        'harness_floor_runs': floor_runs,
+        'harness_floor_per_analysis_us': floor_per_analysis_ms * 1000.0,
+        'harness_floor_ms': floor_ms,
+        'harness_floor_share': safe_divide(floor_ms, stats.elapsed_ms),
+        'net_elapsed_ms': net_elapsed_ms,
+        'net_analyses_per_sec': safe_divide(
+            stats.total_analyses,
+            net_elapsed_ms / 1000.0,
+        ),
+        'net_avg_latency_ms': safe_divide(net_elapsed_ms, stats.total_analyses),
+    }
 
-    payload = to_payload(
-        config=config,
-        sentence_count=len(sentences),
-        init_ms=init_ms,
-        stats=stats,
-        sample_outputs=sample_outputs,
+
+def run_benchmark(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    rss_before_init = read_rss_bytes()
+    lease = acquire_kiwi(config, kiwi_pool)
+    init_ms = lease.init_ms
+    rss_after_init = read_rss_bytes()
+    kiwi = bind_analyze_impl(lease.kiwi, sentence_rows, config.analyze_impl)
+
+    warmup = run_warmup(
+        kiwi,
+        sentence_rows,
+        config,
+        execution_mode=config.execution_mode,
     )
 
-    # Keep stdout payload ASCII-only for robust parsing on Windows runners.
-    encoded_stdout = json.dumps(payload, ensure_ascii=True)
-    safe_print_line(f'KIWI_BENCHMARK_JSON={encoded_stdout}')
+    cache: AnalysisCache | None = None
+    cache_comparison: dict[str, Any] | None = None
+    if config.cache_size:
+        cache = AnalysisCache(
+            config.cache_size,
+            ttl_seconds=config.cache_ttl_seconds,
+            namespace=(config.build_options, config.model_path),
+        )
+        with RssSampler() as uncached_rss_sampler:
+            uncached_stats = run_measurement(
+                kiwi,
+                sentence_rows,
+                runs=config.measure_runs,
+                top_n=config.top_n,
+                match_options=config.analyze_match_options,
+                analyze_impl=config.analyze_impl,
+            )
+        cache_comparison = {
+            'uncached_elapsed_ms': uncached_stats.elapsed_ms,
+            'uncached_analyses_per_sec': safe_divide(
+                uncached_stats.total_analyses,
+                uncached_stats.elapsed_ms / 1000.0,
+            ),
+            'uncached_latency_p99_ms': (
+                uncached_stats.latency.percentile_ns(0.99) / 1e6
+            ),
+            'uncached_peak_rss_measure_bytes': uncached_rss_sampler.peak_bytes,
+        }
 
-    if config.output_path is not None:
-        config.output_path.parent.mkdir(parents=True, exist_ok=True)
-        config.output_path.write_text(
+    profiler = (
+        MeasurementProfiler(
+            config.profile_mode,
+            interval_ms=config.profile_interval_ms,
+        )
+        if config.profile_mode is not None
+        else None
+    )
+
+    def measure(runs: int) -> RunStats:
+        return run_measurement(
+            kiwi,
+            sentence_rows,
+            runs=runs,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+            execution_mode=config.execution_mode,
+            batch_size=config.batch_size,
+            cache=cache,
+        )
+
+    precision: dict[str, Any] = {}
+    rss_sampler = RssSampler()
+    gc_monitor = GcMonitor(config.gc_mode)
+    cpu_timer = CpuTimer()
+    with rss_sampler, gc_monitor, cpu_timer, profiler or nullcontext():
+        if config.target_ci_percent:
+            stats, precision = run_until_precise(config, lambda: measure(1))
+        else:
+            stats = measure(config.measure_runs)
+    if cache is not None and cache_comparison is not None:
+        cached_analyses_per_sec = safe_divide(
+            stats.total_analyses,
+            stats.elapsed_ms / 1000.0,
+        )
+        cache_comparison.update(
+            {
+                'cached_analyses_per_sec': cached_analyses_per_sec,
+                'cached_peak_rss_measure_bytes': rss_sampler.peak_bytes,
+                'cache_speedup': safe_divide(
+                    cached_analyses_per_sec,
+                    cache_comparison['uncached_analyses_per_sec'],
+                ),
+            }
+        )
+
+    # Separate pass like the Flutter pure/full pair, so per-stage clock reads
+    # never perturb the primary throughput numbers.
+    layers: dict[str, Any] = {}
+    if config.layers:
+        layers = run_layer_measurement(
+            kiwi,
+            sentence_rows,
+            runs=config.measure_runs,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+        )
+
+    memory: dict[str, Any] = {
+        'rss_before_init_bytes': rss_before_init,
+        'rss_after_init_bytes': rss_after_init,
+        'init_rss_delta_bytes': (
+            rss_after_init - rss_before_init
+            if rss_before_init is not None and rss_after_init is not None
+            else None
+        ),
+        'peak_rss_measure_bytes': rss_sampler.peak_bytes,
+        'peak_rss_process_bytes': read_peak_rss_bytes(),
+    }
+    if config.track_allocations:
+        memory.update(
+            measure_python_allocations(
+                kiwi,
+                sentence_rows,
+                top_n=config.top_n,
+                match_options=config.analyze_match_options,
+                analyze_impl=config.analyze_impl,
+            )
+        )
+    if config.memory_breakdown:
+        memory['memory_breakdown'] = run_memory_breakdown(config)
+
+    sample_outputs = collect_sample_outputs(
+        kiwi,
+        select_sample_sentences(
+            sentence_rows,
+            sample_count=config.sample_count,
+            reservoir=config.sample_reservoir,
+            seed=config.sample_seed,
+        ),
+        sample_count=config.sample_count,
+        top_n=config.top_n,
+        match_options=config.analyze_match_options,
+        analyze_impl=config.analyze_impl,
+    )
+
+    payload = to_payload(
+        config=config,
+        sentence_count=len(sentence_rows),
+        init_ms=init_ms,
+        stats=stats,
+        sample_outputs=sample_outputs,
+    )
+    payload['kiwi_pool_hit'] = lease.pool_hit
+    payload.update(warmup)
+    payload.update(precision)
+    payload.update(gc_monitor.to_payload(stats.elapsed_ms))
+    if config.harness_baseline:
+        payload.update(measure_harness_floor(config, sentence_rows, stats))
+    payload.update(
+        cpu_timer.to_payload(
+            elapsed_ms=stats.elapsed_ms,
+            total_analyses=stats.total_analyses,
+            text_bytes=measured_text_bytes(sentence_rows, stats.total_analyses),
+        )
+    )
+    payload.update(layers)
+    payload.update(memory)
+    if profiler is not None and config.output_path is not None:
+        payload.update(
+            profiler.write_artifacts(
+                config.output_path,
+                top_n=config.profile_top_n,
+            )
+        )
+    if cache is not None:
+        payload.update(cache.to_payload())
+        payload['cache_comparison'] = cache_comparison
+    return payload
+
+
+def _memory_probe_worker(
+    build_options: int,
+    config: BenchmarkConfig,
+    result_queue: Any,
+) -> None:
+    try:
+        rss_before = read_rss_bytes()
+        init_started = time.perf_counter()
+        create_kiwi(replace(config, build_options=build_options))
+        init_ms = (time.perf_counter() - init_started) * 1000.0
+        rss_after = read_rss_bytes()
+        result_queue.put(
+            {
+                'init_ms': init_ms,
+                'rss_before_bytes': rss_before,
+                'rss_after_bytes': rss_after,
+            }
+        )
+    except BaseException as error:  # noqa: BLE001 - surfaced to the parent.
+        result_queue.put({'error': repr(error)})
+
+
+def memory_breakdown_variants(build_options: int) -> list[tuple[str, int]]:
+    """Return `(label, build_options)` rows adding one dictionary at a time."""
+    dict_bits = LOAD_DEFAULT_DICT | LOAD_TYPO_DICT | LOAD_MULTI_DICT
+    base = build_options & ~dict_bits
+    variants = [('model only', base)]
+    for label, bit in (
+        ('+ default dict', LOAD_DEFAULT_DICT),
+        ('+ typo dict', LOAD_TYPO_DICT),
+        ('+ multi dict', LOAD_MULTI_DICT),
+    ):
+        if build_options & bit:
+            variants.append((label, base | bit))
+    variants.append(('configured', build_options))
+    return variants
+
+
+def run_memory_breakdown(config: BenchmarkConfig) -> list[dict[str, Any]]:
+    """Measure model-load RSS per build option, one fresh process each.
+
+    A fresh process per variant keeps allocator reuse from hiding the cost
+    of later loads.
+    """
+    context = multiprocessing.get_context('spawn')
+    rows: list[dict[str, Any]] = []
+    base_delta: int | None = None
+    for label, build_options in memory_breakdown_variants(config.build_options):
+        result_queue = context.Queue()
+        worker = context.Process(
+            target=_memory_probe_worker,
+            args=(build_options, config, result_queue),
+            daemon=True,
+        )
+        worker.start()
+        result = result_queue.get()
+        worker.join()
+        if 'error' in result:
+            raise RuntimeError(
+                f'Memory probe failed for {label}: {result["error"]}'
+            )
+
+        rss_before = result['rss_before_bytes']
+        rss_after = result['rss_after_bytes']
+        rss_delta = None
+        if rss_before is not None and rss_after is not None:
+            rss_delta = rss_after - rss_before
+        if base_delta is None:
+            base_delta = rss_delta
+        rows.append(
+            {
+                'label': label,
+                'build_options': build_options,
+                **build_option_flags(build_options),
+                'init_ms': result['init_ms'],
+                'rss_after_init_bytes': rss_after,
+                'init_rss_delta_bytes': rss_delta,
+                'rss_delta_vs_model_only_bytes': (
+                    rss_delta - base_delta
+                    if rss_delta is not None and base_delta is not None
+                    else None
+                ),
+            }
+        )
+    return rows
+
+
+def run_num_workers_sweep(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    """Run one benchmark per `num_workers` value and derive scaling metrics.
+
+    Speedup is relative to the first sweep entry, and parallel efficiency
+    divides it by the worker-count ratio against that baseline. The pool is
+    emptied before each entry so its RSS and init figures never include the
+    previous entry's model.
+    """
+    runs: list[dict[str, Any]] = []
+    for index, num_workers in enumerate(config.num_workers_sweep):
+        safe_print_line(f'[sweep] num_workers={num_workers}')
+        if kiwi_pool is not None:
+            kiwi_pool.clear()
+        runs.append(
+            run_benchmark(
+                replace(
+                    config,
+                    num_workers=num_workers,
+                    # Model load cost does not depend on num_workers.
+                    memory_breakdown=config.memory_breakdown and index == 0,
+                ),
+                sentence_rows,
+                kiwi_pool=kiwi_pool,
+            )
+        )
+
+    baseline = runs[0]
+    baseline_workers = resolve_effective_workers(int(baseline['num_workers']))
+    series: list[dict[str, Any]] = []
+    for run in runs:
+        effective_workers = resolve_effective_workers(int(run['num_workers']))
+        speedup = safe_divide(
+            run['analyses_per_sec'],
+            baseline['analyses_per_sec'],
+        )
+        series.append(
+            {
+                'num_workers': run['num_workers'],
+                'effective_workers': effective_workers,
+                'init_ms': run['init_ms'],
+                'kiwi_pool_hit': run['kiwi_pool_hit'],
+                'elapsed_ms': run['elapsed_ms'],
+                'analyses_per_sec': run['analyses_per_sec'],
+                'chars_per_sec': run['chars_per_sec'],
+                'tokens_per_sec': run['tokens_per_sec'],
+                'avg_latency_ms': run['avg_latency_ms'],
+                'latency_p50_ms': run['latency_p50_ms'],
+                'latency_p99_ms': run['latency_p99_ms'],
+                'avg_cores_busy': run['avg_cores_busy'],
+                'cpu_seconds_per_1k_analyses': run['cpu_seconds_per_1k_analyses'],
+                'speedup': speedup,
+                'parallel_efficiency': safe_divide(
+                    speedup,
+                    effective_workers / baseline_workers,
+                ),
+            }
+        )
+
+    payload = {
+        key: value
+        for key, value in baseline.items()
+        if key not in ('num_workers', 'latency_histogram')
+    }
+    payload.update(
+        {
+            'task': 'num_workers_sweep',
+            'num_workers_sweep': list(config.num_workers_sweep),
+            'cpu_count': os.cpu_count(),
+            'baseline_num_workers': baseline['num_workers'],
+            'series': series,
+        }
+    )
+    return payload
+
+
+def run_analyze_impl_sweep(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    """Benchmark several API paths on one `Kiwi` and the same corpus.
+
+    Every entry after the first is served from the pool, so the series
+    isolates per-API cost. `tokens_per_sec` counts each row's
+    `output_unit`, which differs between API paths.
+    """
+    pool = (
+        kiwi_pool
+        if kiwi_pool is not None
+        else KiwiPool(1, kiwi_class=backend_class(config))
+    )
+    runs: list[dict[str, Any]] = []
+    for analyze_impl in config.analyze_impl_sweep:
+        safe_print_line(f'[api-sweep] analyze_impl={analyze_impl}')
+        runs.append(
+            run_benchmark(
+                replace(config, analyze_impl=analyze_impl),
+                sentence_rows,
+                kiwi_pool=pool,
+            )
+        )
+
+    series: list[dict[str, Any]] = []
+    for run in runs:
+        series.append(
+            {
+                'analyze_impl': run['analyze_impl'],
+                'output_unit': run['output_unit'],
+                'kiwi_pool_hit': run['kiwi_pool_hit'],
+                'elapsed_ms': run['elapsed_ms'],
+                'total_analyses': run['total_analyses'],
+                'total_tokens': run['total_tokens'],
+                'analyses_per_sec': run['analyses_per_sec'],
+                'chars_per_sec': run['chars_per_sec'],
+                'tokens_per_sec': run['tokens_per_sec'],
+                'avg_latency_ms': run['avg_latency_ms'],
+                'latency_p50_ms': run['latency_p50_ms'],
+                'latency_p95_ms': run['latency_p95_ms'],
+                'latency_p99_ms': run['latency_p99_ms'],
+                'avg_cores_busy': run['avg_cores_busy'],
+                'cpu_seconds_per_1k_analyses': run['cpu_seconds_per_1k_analyses'],
+            }
+        )
+
+    baseline = runs[0]
+    payload = {
+        key: value
+        for key, value in baseline.items()
+        if key
+        not in ('analyze_impl', 'output_unit', 'latency_histogram', 'sample_outputs')
+    }
+    payload.update(
+        {
+            'task': 'analyze_impl_sweep',
+            'analyze_impl_sweep': list(config.analyze_impl_sweep),
+            'api_series': series,
+        }
+    )
+    return payload
+
+
+def _process_worker(
+    process_index: int,
+    config: BenchmarkConfig,
+    shard: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    start_barrier: Any,
+    result_queue: Any,
+) -> None:
+    """Process-pool entry point: init, warm up, wait, measure, report."""
+    try:
+        cpu_affinity = pin_process_worker(process_index) if config.isolate else None
+        init_started = time.perf_counter()
+        kiwi = create_kiwi(config)
+        init_ms = (time.perf_counter() - init_started) * 1000.0
+        rss_after_init = read_rss_bytes()
+        kiwi = bind_analyze_impl(kiwi, shard, config.analyze_impl)
+
+        warmup = run_warmup(
+            kiwi,
+            shard,
+            config,
+            execution_mode=config.execution_mode,
+        )
+        start_barrier.wait()
+
+        with CpuTimer() as cpu_timer:
+            stats = run_measurement(
+                kiwi,
+                shard,
+                runs=config.measure_runs,
+                top_n=config.top_n,
+                match_options=config.analyze_match_options,
+                analyze_impl=config.analyze_impl,
+                execution_mode=config.execution_mode,
+                batch_size=config.batch_size,
+            )
+        result_queue.put(
+            {
+                'process_index': process_index,
+                'pid': os.getpid(),
+                'cpu_affinity': cpu_affinity,
+                'init_ms': init_ms,
+                'warmup_passes': warmup['warmup_passes'],
+                'stats': stats,
+                'cpu_user_seconds': cpu_timer.user_seconds,
+                'cpu_system_seconds': cpu_timer.system_seconds,
+                'rss_after_init_bytes': rss_after_init,
+                'rss_after_measure_bytes': read_rss_bytes(),
+                'peak_rss_bytes': read_peak_rss_bytes(),
+            }
+        )
+    except BaseException as error:  # noqa: BLE001 - surfaced to the parent.
+        start_barrier.abort()
+        result_queue.put({'process_index': process_index, 'error': repr(error)})
+
+
+def run_process_pool(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+) -> dict[str, Any]:
+    """Scale out across processes, each owning an independent `Kiwi`.
+
+    In-memory rows are sharded round-robin and streaming corpora by
+    line-aligned byte ranges. Aggregate throughput uses the parent's wall
+    clock from barrier release until the last worker reports.
+    """
+    process_count = config.processes
+    if process_count > len(sentence_rows):
+        raise ValueError(
+            f'--processes ({process_count}) exceeds corpus size '
+            f'({len(sentence_rows)}).'
+        )
+
+    context = multiprocessing.get_context('spawn')
+    start_barrier = context.Barrier(process_count + 1)
+    result_queue = context.Queue()
+    shards = shard_rows(sentence_rows, process_count)
+    workers = [
+        context.Process(
+            target=_process_worker,
+            args=(index, config, shards[index], start_barrier, result_queue),
+            daemon=True,
+        )
+        for index in range(process_count)
+    ]
+
+    startup_started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+
+    results: list[dict[str, Any]] = []
+    try:
+        try:
+            start_barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        measure_started = time.perf_counter()
+        startup_wall_ms = (measure_started - startup_started) * 1000.0
+
+        while len(results) < process_count:
+            result = result_queue.get()
+            if 'error' in result:
+                raise RuntimeError(
+                    f"Process {result['process_index']} failed: {result['error']}"
+                )
+            results.append(result)
+        wall_elapsed_ms = (time.perf_counter() - measure_started) * 1000.0
+    finally:
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+
+    results.sort(key=lambda item: item['process_index'])
+    latency = LatencyHistogram()
+    length_breakdown: LengthBreakdown | None = None
+    per_process: list[dict[str, Any]] = []
+    for result in results:
+        stats: RunStats = result['stats']
+        latency.merge(stats.latency)
+        if stats.length_breakdown is not None:
+            if length_breakdown is None:
+                length_breakdown = LengthBreakdown()
+            length_breakdown.merge(stats.length_breakdown)
+        elapsed_seconds = stats.elapsed_ms / 1000.0
+        per_process.append(
+            {
+                'process_index': result['process_index'],
+                'pid': result['pid'],
+                'cpu_affinity': result['cpu_affinity'],
+                'sentence_count': len(shards[result['process_index']]),
+                'init_ms': result['init_ms'],
+                'warmup_passes': result['warmup_passes'],
+                'elapsed_ms': stats.elapsed_ms,
+                'total_analyses': stats.total_analyses,
+                'analyses_per_sec': safe_divide(
+                    stats.total_analyses,
+                    elapsed_seconds,
+                ),
+                'chars_per_sec': safe_divide(stats.total_chars, elapsed_seconds),
+                'cpu_seconds': (
+                    result['cpu_user_seconds'] + result['cpu_system_seconds']
+                ),
+                'rss_after_init_bytes': result['rss_after_init_bytes'],
+                'rss_after_measure_bytes': result['rss_after_measure_bytes'],
+                'peak_rss_bytes': result['peak_rss_bytes'],
+            }
+        )
+
+    aggregate = RunStats(
+        elapsed_ms=wall_elapsed_ms,
+        total_analyses=sum(item['stats'].total_analyses for item in results),
+        total_chars=sum(item['stats'].total_chars for item in results),
+        total_tokens=sum(item['stats'].total_tokens for item in results),
+        latency=latency,
+        length_breakdown=length_breakdown,
+    )
+    init_values = [item['init_ms'] for item in per_process]
+    payload = to_payload(
+        config=config,
+        sentence_count=len(sentence_rows),
+        init_ms=max(init_values),
+        stats=aggregate,
+        sample_outputs=[],
+    )
+    peak_values = [
+        item['peak_rss_bytes']
+        for item in per_process
+        if item['peak_rss_bytes'] is not None
+    ]
+    payload.update(
+        {
+            'task': 'process_pool',
+            'processes': process_count,
+            'startup_wall_ms': startup_wall_ms,
+            'init_ms_total': sum(init_values),
+            'init_ms_max': max(init_values),
+            'warmup_passes_max': max(item['warmup_passes'] for item in per_process),
+            'per_process_analyses_per_sec_mean': safe_divide(
+                sum(item['analyses_per_sec'] for item in per_process),
+                len(per_process),
+            ),
+            'peak_rss_bytes_total': sum(peak_values) if peak_values else None,
+            'per_process': per_process,
+        }
+    )
+    # Summed across workers; avg_cores_busy is against the parent wall clock.
+    payload.update(
+        cpu_cost_payload(
+            user_seconds=sum(item['cpu_user_seconds'] for item in results),
+            system_seconds=sum(item['cpu_system_seconds'] for item in results),
+            elapsed_ms=wall_elapsed_ms,
+            total_analyses=aggregate.total_analyses,
+            text_bytes=measured_text_bytes(
+                sentence_rows,
+                aggregate.total_analyses,
+            ),
+        )
+    )
+    return payload
+
+
+def run_open_loop_level(
+    kiwi: Any,
+    sentences: list[str],
+    *,
+    qps: float,
+    config: BenchmarkConfig,
+    concurrency: int,
+    seed: int,
+) -> dict[str, Any]:
+    """Offer `qps` requests/s for the configured duration onto a thread pool.
+
+    The dispatcher never waits for completions, so a slow server cannot
+    delay later sends. Response latency runs from each request's scheduled
+    send time, which counts queueing that a closed loop would omit.
+    """
+    rng = random.Random(seed)
+    request_count = max(1, round(qps * config.open_loop_duration_seconds))
+    offsets_s: list[float] = []
+    offset_s = 0.0
+    for _ in range(request_count):
+        offsets_s.append(offset_s)
+        if config.open_loop_arrival == _ARRIVAL_POISSON:
+            offset_s += rng.expovariate(qps)
+        else:
+            offset_s += 1.0 / qps
+
+    clock_ns = time.perf_counter_ns
+    response_latency = LatencyHistogram()
+    service_latency = LatencyHistogram()
+    record_lock = threading.Lock()
+    max_dispatch_lag_ns = 0
+
+    def handle(sentence: str, scheduled_ns: int) -> None:
+        service_started_ns = clock_ns()
+        analyze_sentence_tokens(
+            kiwi,
+            sentence,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+        )
+        finished_ns = clock_ns()
+        with record_lock:
+            response_latency.record(finished_ns - scheduled_ns)
+            service_latency.record(finished_ns - service_started_ns)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        base_ns = clock_ns()
+        for index, request_offset_s in enumerate(offsets_s):
+            scheduled_ns = base_ns + int(request_offset_s * 1e9)
+            wait_ns = scheduled_ns - clock_ns()
+            if wait_ns > 0:
+                time.sleep(wait_ns / 1e9)
+            max_dispatch_lag_ns = max(
+                max_dispatch_lag_ns,
+                clock_ns() - scheduled_ns,
+            )
+            futures.append(
+                executor.submit(
+                    handle,
+                    sentences[index % len(sentences)],
+                    scheduled_ns,
+                )
+            )
+        for future in futures:
+            future.result()
+        finished_ns = clock_ns()
+
+    elapsed_seconds = (finished_ns - base_ns) / 1e9
+    # Poisson schedules drift from the nominal rate, so saturation is judged
+    # against the rate this particular schedule actually offered.
+    row: dict[str, Any] = {
+        'offered_qps': qps,
+        'scheduled_qps': safe_divide(request_count, offset_s),
+        'requests': request_count,
+        'achieved_qps': safe_divide(request_count, elapsed_seconds),
+        'elapsed_ms': elapsed_seconds * 1000.0,
+        'max_dispatch_lag_ms': max_dispatch_lag_ns / 1e6,
+    }
+    for label, quantile in LATENCY_PERCENTILES:
+        row[f'latency_{label}_ms'] = response_latency.percentile_ns(quantile) / 1e6
+    row['latency_max_ms'] = response_latency.max_ns / 1e6
+    row['service_p50_ms'] = service_latency.percentile_ns(0.50) / 1e6
+    row['service_p99_ms'] = service_latency.percentile_ns(0.99) / 1e6
+    return row
+
+
+def find_saturation_knee(levels: list[dict[str, Any]]) -> dict[str, Any]:
+    """Locate the highest offered load served before latency or rate breaks."""
+    ordered = sorted(levels, key=lambda row: row['offered_qps'])
+    if not ordered:
+        return {'saturation_knee_qps': None, 'saturated_at_qps': None}
+
+    baseline_p99 = ordered[0]['latency_p99_ms']
+    knee_qps: float | None = None
+    for row in ordered:
+        saturated = (
+            row['achieved_qps']
+            < row['scheduled_qps'] * OPEN_LOOP_THROUGHPUT_FLOOR
+            or row['latency_p99_ms'] > baseline_p99 * OPEN_LOOP_P99_BLOWUP
+        )
+        row['saturated'] = saturated
+        if saturated:
+            return {
+                'saturation_knee_qps': knee_qps,
+                'saturated_at_qps': row['offered_qps'],
+            }
+        knee_qps = row['offered_qps']
+    return {'saturation_knee_qps': knee_qps, 'saturated_at_qps': None}
+
+
+def run_open_loop(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    lease = acquire_kiwi(config, kiwi_pool)
+    kiwi = bind_analyze_impl(lease.kiwi, sentence_rows, config.analyze_impl)
+    init_ms = lease.init_ms
+    warmup = run_warmup(kiwi, sentence_rows, config)
+
+    sentences = [sentence for sentence, _ in sentence_rows]
+    concurrency = config.open_loop_concurrency or os.cpu_count() or 1
+    levels: list[dict[str, Any]] = []
+    for level_index, qps in enumerate(config.open_loop_qps):
+        safe_print_line(f'[open-loop] offered_qps={qps:g}')
+        levels.append(
+            run_open_loop_level(
+                kiwi,
+                sentences,
+                qps=qps,
+                config=config,
+                concurrency=concurrency,
+                seed=config.sample_seed + level_index,
+            )
+        )
+
+    return {
+        **run_metadata(config),
+        'task': 'open_loop',
+        'sentence_count': len(sentences),
+        'init_ms': init_ms,
+        **warmup,
+        'open_loop_arrival': config.open_loop_arrival,
+        'open_loop_duration_seconds': config.open_loop_duration_seconds,
+        'open_loop_concurrency': concurrency,
+        **find_saturation_knee(levels),
+        'open_loop_levels': levels,
+    }
+
+
+async def _probe_loop_lag(
+    histogram: LatencyHistogram,
+    stop: asyncio.Event,
+) -> None:
+    """Record how late each fixed-period wakeup fires on the event loop."""
+    interval_ns = int(LOOP_LAG_PROBE_INTERVAL_S * 1e9)
+    while not stop.is_set():
+        expected_ns = time.perf_counter_ns() + interval_ns
+        await asyncio.sleep(LOOP_LAG_PROBE_INTERVAL_S)
+        histogram.record(max(0, time.perf_counter_ns() - expected_ns))
+
+
+async def _drive_async_level(
+    kiwi: Any,
+    sentences: list[str],
+    *,
+    concurrency: int,
+    config: BenchmarkConfig,
+) -> dict[str, Any]:
+    """Run `concurrency` coroutines that share one Kiwi via an executor."""
+    loop = asyncio.get_running_loop()
+    request_latency = LatencyHistogram()
+    loop_lag = LatencyHistogram()
+    total_requests = len(sentences) * config.measure_runs
+    next_index = 0
+    total_tokens = 0
+
+    def analyze(sentence: str) -> int:
+        tokens = analyze_sentence_tokens(
+            kiwi,
+            sentence,
+            top_n=config.top_n,
+            match_options=config.analyze_match_options,
+            analyze_impl=config.analyze_impl,
+        )
+        return len(tokens)
+
+    async def client(executor: ThreadPoolExecutor) -> None:
+        nonlocal next_index, total_tokens
+        while next_index < total_requests:
+            sentence = sentences[next_index % len(sentences)]
+            next_index += 1
+            started_ns = time.perf_counter_ns()
+            tokens = await loop.run_in_executor(executor, analyze, sentence)
+            request_latency.record(time.perf_counter_ns() - started_ns)
+            # Read-modify-write after the await so clients cannot interleave.
+            total_tokens += tokens
+
+    stop = asyncio.Event()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        probe = asyncio.create_task(_probe_loop_lag(loop_lag, stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(client(executor) for _ in range(concurrency)))
+        elapsed_seconds = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    row: dict[str, Any] = {
+        'concurrency': concurrency,
+        'requests': total_requests,
+        'elapsed_ms': elapsed_seconds * 1000.0,
+        'analyses_per_sec': safe_divide(total_requests, elapsed_seconds),
+        'tokens_per_sec': safe_divide(total_tokens, elapsed_seconds),
+    }
+    for label, quantile in LATENCY_PERCENTILES:
+        row[f'latency_{label}_ms'] = request_latency.percentile_ns(quantile) / 1e6
+    row['loop_lag_p50_ms'] = loop_lag.percentile_ns(0.50) / 1e6
+    row['loop_lag_p99_ms'] = loop_lag.percentile_ns(0.99) / 1e6
+    row['loop_lag_max_ms'] = loop_lag.max_ns / 1e6
+    return row
+
+
+def run_async_concurrency_sweep(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    """Sweep in-flight coroutine counts against one shared Kiwi instance.
+
+    Parallel efficiency near 1 means the native call releases the GIL well
+    enough for a shared instance to scale; a flat curve means callers need
+    one instance per thread or process.
+    """
+    lease = acquire_kiwi(config, kiwi_pool)
+    kiwi = bind_analyze_impl(lease.kiwi, sentence_rows, config.analyze_impl)
+    init_ms = lease.init_ms
+    warmup = run_warmup(kiwi, sentence_rows, config)
+
+    sentences = [sentence for sentence, _ in sentence_rows]
+    series: list[dict[str, Any]] = []
+    for concurrency in config.async_concurrency_sweep:
+        safe_print_line(f'[async] concurrency={concurrency}')
+        series.append(
+            asyncio.run(
+                _drive_async_level(
+                    kiwi,
+                    sentences,
+                    concurrency=concurrency,
+                    config=config,
+                )
+            )
+        )
+
+    baseline = series[0]
+    for row in series:
+        speedup = safe_divide(
+            row['analyses_per_sec'],
+            baseline['analyses_per_sec'],
+        )
+        row['speedup'] = speedup
+        row['parallel_efficiency'] = safe_divide(
+            speedup,
+            row['concurrency'] / baseline['concurrency'],
+        )
+
+    return {
+        **run_metadata(config),
+        'task': 'async_concurrency_sweep',
+        'sentence_count': len(sentences),
+        'init_ms': init_ms,
+        **warmup,
+        'cpu_count': os.cpu_count(),
+        'async_concurrency_sweep': list(config.async_concurrency_sweep),
+        'loop_lag_probe_interval_ms': LOOP_LAG_PROBE_INTERVAL_S * 1000.0,
+        'series': series,
+    }
+
+
+def has_matrix_axes(config: BenchmarkConfig) -> bool:
+    return bool(
+        config.matrix_build_options
+        or config.matrix_model_types
+        or config.matrix_top_n
+        or config.matrix_analyze_match_options
+    )
+
+
+def run_config_matrix(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+) -> dict[str, Any]:
+    """Benchmark the Cartesian product of create- and analyze-time axes.
+
+    Create-time combinations (build options with model type) form the outer
+    loop, so one `Kiwi` serves every top_n/match option row beneath it and
+    is dropped before the next one loads. Each reused row reports the init
+    cost of the instance it ran on.
+    """
+    build_options_axis = config.matrix_build_options or (config.build_options,)
+    if config.matrix_model_types:
+        build_options_axis = tuple(
+            dict.fromkeys(
+                with_model_type(build_options, model_type)
+                for build_options in build_options_axis
+                for model_type in config.matrix_model_types
+            )
+        )
+    top_n_axis = config.matrix_top_n or (config.top_n,)
+    match_options_axis = config.matrix_analyze_match_options or (
+        config.analyze_match_options,
+    )
+
+    rows: list[dict[str, Any]] = []
+    for build_options in build_options_axis:
+        create_config = replace(config, build_options=build_options)
+        gc.collect()
+        rss_before_init = read_rss_bytes()
+        init_started = time.perf_counter()
+        kiwi = create_kiwi(create_config)
+        init_ms = (time.perf_counter() - init_started) * 1000.0
+        rss_after_init = read_rss_bytes()
+        kiwi = bind_analyze_impl(kiwi, sentence_rows, config.analyze_impl)
+
+        for row_index, (top_n, match_options) in enumerate(
+            itertools.product(top_n_axis, match_options_axis)
+        ):
+            row_config = replace(
+                create_config,
+                top_n=top_n,
+                analyze_match_options=match_options,
+            )
+            safe_print_line(
+                f'[matrix] build_options={build_options} '
+                f'model_type={resolve_model_type(build_options) or "none"} '
+                f'top_n={top_n} analyze_match_options={match_options}'
+            )
+            warmup = run_warmup(
+                kiwi,
+                sentence_rows,
+                row_config,
+                execution_mode=row_config.execution_mode,
+            )
+            with RssSampler() as rss_sampler:
+                stats = run_measurement(
+                    kiwi,
+                    sentence_rows,
+                    runs=row_config.measure_runs,
+                    top_n=top_n,
+                    match_options=match_options,
+                    analyze_impl=row_config.analyze_impl,
+                    execution_mode=row_config.execution_mode,
+                    batch_size=row_config.batch_size,
+                )
+            elapsed_seconds = stats.elapsed_ms / 1000.0
+            row: dict[str, Any] = {
+                'build_options': build_options,
+                **build_option_flags(build_options),
+                'top_n': top_n,
+                'analyze_match_options': match_options,
+                'kiwi_reused': row_index > 0,
+                'init_ms': init_ms,
+                'init_rss_delta_bytes': (
+                    rss_after_init - rss_before_init
+                    if rss_before_init is not None and rss_after_init is not None
+                    else None
+                ),
+                'peak_rss_measure_bytes': rss_sampler.peak_bytes,
+                'warmup_passes': warmup['warmup_passes'],
+                'elapsed_ms': stats.elapsed_ms,
+                'total_analyses': stats.total_analyses,
+                'analyses_per_sec': safe_divide(
+                    stats.total_analyses,
+                    elapsed_seconds,
+                ),
+                'chars_per_sec': safe_divide(stats.total_chars, elapsed_seconds),
+                'tokens_per_sec': safe_divide(stats.total_tokens, elapsed_seconds),
+                'avg_latency_ms': safe_divide(
+                    stats.elapsed_ms,
+                    stats.total_analyses,
+                ),
+            }
+            row.update(latency_payload(stats.latency))
+            del row['latency_histogram']
+            rows.append(row)
+        del kiwi
+
+    return {
+        **run_metadata(config),
+        'task': 'config_matrix',
+        'sentence_count': len(sentence_rows),
+        'matrix_axes': {
+            'build_options': list(build_options_axis),
+            'top_n': list(top_n_axis),
+            'analyze_match_options': list(match_options_axis),
+        },
+        'kiwi_instances': len(build_options_axis),
+        'matrix_rows': rows,
+    }
+
+
+def measure_document_strategy(
+    kiwi: Any,
+    documents: list[str],
+    *,
+    strategy: str,
+    config: BenchmarkConfig,
+) -> dict[str, Any]:
+    """Time whole-document analysis or split-then-analyze per document.
+
+    Latency is per document. For `split`, the `split_into_sents` call is
+    inside the timed region and its share is reported separately.
+    """
+
+    def analyze_document(document: str) -> tuple[int, int, int]:
+        if strategy == _DOCUMENT_WHOLE:
+            tokens = analyze_sentence_tokens(
+                kiwi,
+                document,
+                top_n=config.top_n,
+                match_options=config.analyze_match_options,
+                analyze_impl=config.analyze_impl,
+            )
+            return len(tokens), 1, 0
+        split_started_ns = time.perf_counter_ns()
+        sentences = extract_tokens(
+            kiwi.split_into_sents(
+                document,
+                match_options=config.analyze_match_options,
+            ),
+            analyze_impl=_ANALYZE_IMPL_SPLIT,
+        )
+        split_ns = time.perf_counter_ns() - split_started_ns
+        token_count = 0
+        for sentence in sentences:
+            token_count += len(
+                analyze_sentence_tokens(
+                    kiwi,
+                    sentence,
+                    top_n=config.top_n,
+                    match_options=config.analyze_match_options,
+                    analyze_impl=config.analyze_impl,
+                )
+            )
+        return token_count, len(sentences), split_ns
+
+    for _ in range(max(1, config.warmup_runs)):
+        for document in documents:
+            analyze_document(document)
+
+    gc.collect()
+    rss_before = read_rss_bytes()
+    latency = LatencyHistogram()
+    total_tokens = 0
+    total_sentences = 0
+    total_split_ns = 0
+    clock_ns = time.perf_counter_ns
+    started = time.perf_counter()
+    with RssSampler() as rss_sampler:
+        for _ in range(config.measure_runs):
+            for document in documents:
+                call_started_ns = clock_ns()
+                tokens, sentences, split_ns = analyze_document(document)
+                latency.record(clock_ns() - call_started_ns)
+                total_tokens += tokens
+                total_sentences += sentences
+                total_split_ns += split_ns
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+    total_documents = len(documents) * config.measure_runs
+    total_chars = sum(len(document) for document in documents) * (
+        config.measure_runs
+    )
+    total_bytes = sum(len(document.encode('utf-8')) for document in documents) * (
+        config.measure_runs
+    )
+    elapsed_seconds = elapsed_ms / 1000.0
+    row: dict[str, Any] = {
+        'elapsed_ms': elapsed_ms,
+        'documents_per_sec': safe_divide(total_documents, elapsed_seconds),
+        'chars_per_sec': safe_divide(total_chars, elapsed_seconds),
+        'tokens_per_sec': safe_divide(total_tokens, elapsed_seconds),
+        'avg_latency_ms': safe_divide(elapsed_ms, total_documents),
+        'ms_per_kb': safe_divide(elapsed_ms, total_bytes / 1024.0),
+        'tokens_per_document': safe_divide(total_tokens, total_documents),
+        'sentences_per_document': safe_divide(total_sentences, total_documents),
+        'sentence_split_share': safe_divide(total_split_ns / 1e6, elapsed_ms),
+        'peak_rss_delta_bytes': (
+            rss_sampler.peak_bytes - rss_before
+            if rss_sampler.peak_bytes is not None and rss_before is not None
+            else None
+        ),
+    }
+    row.update(latency_payload(latency))
+    del row['latency_histogram']
+    if strategy == _DOCUMENT_WHOLE:
+        del row['sentences_per_document']
+        del row['sentence_split_share']
+    return row
+
+
+def fit_document_exponent(levels: list[dict[str, Any]], key: str) -> float | None:
+    """Log-log slope of per-document latency against document bytes."""
+    points = [
+        (math.log(level['mean_document_bytes']), math.log(level[key]))
+        for level in levels
+        if level['mean_document_bytes'] > 0 and level[key] > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator <= 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def run_document_benchmark(
+    config: BenchmarkConfig,
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus,
+    *,
+    kiwi_pool: KiwiPool | None = None,
+) -> dict[str, Any]:
+    """Scale document length and compare whole vs split-then-analyze.
+
+    `max_whole_document_kb` is the largest size whose whole-document cost
+    per KiB stays within `DOCUMENT_COST_GROWTH_LIMIT` of the cheapest size,
+    a starting point for where to chunk long inputs.
+    """
+    lease = acquire_kiwi(config, kiwi_pool)
+    kiwi = lease.kiwi
+    if config.document_file is not None:
+        units = load_paragraphs(config.document_file)
+        separator = '\n\n'
+    else:
+        units = [sentence for sentence, _ in sentence_rows]
+        separator = ' '
+
+    levels: list[dict[str, Any]] = []
+    for size_kb in config.document_sizes_kb:
+        safe_print_line(f'[document] target_kb={size_kb:g}')
+        documents = build_documents(
+            units,
+            target_bytes=max(1, round(size_kb * 1024)),
+            count=config.documents_per_size,
+            separator=separator,
+        )
+        document_bytes = [len(document.encode('utf-8')) for document in documents]
+        whole = measure_document_strategy(
+            kiwi,
+            documents,
+            strategy=_DOCUMENT_WHOLE,
+            config=config,
+        )
+        split = measure_document_strategy(
+            kiwi,
+            documents,
+            strategy=_DOCUMENT_SPLIT,
+            config=config,
+        )
+        level: dict[str, Any] = {
+            'target_kb': size_kb,
+            'documents': len(documents),
+            'mean_document_bytes': statistics.fmean(document_bytes),
+            'mean_document_chars': statistics.fmean(
+                len(document) for document in documents
+            ),
+        }
+        level['sentence_split_share'] = split.pop('sentence_split_share')
+        level.update({f'whole_{key}': value for key, value in whole.items()})
+        level.update({f'split_{key}': value for key, value in split.items()})
+        level['whole_vs_split_speedup'] = safe_divide(
+            split['avg_latency_ms'],
+            whole['avg_latency_ms'],
+        )
+        level['whole_vs_split_token_ratio'] = safe_divide(
+            whole['tokens_per_document'],
+            split['tokens_per_document'],
+        )
+        levels.append(level)
+
+    min_cost = min(
+        (level['whole_ms_per_kb'] for level in levels if level['whole_ms_per_kb']),
+        default=0.0,
+    )
+    max_whole_document_kb = None
+    for level in sorted(levels, key=lambda item: item['target_kb']):
+        if level['whole_ms_per_kb'] <= min_cost * DOCUMENT_COST_GROWTH_LIMIT:
+            max_whole_document_kb = level['target_kb']
+
+    return {
+        **run_metadata(config),
+        'task': 'document_scaling',
+        'document_source': (
+            'paragraphs' if config.document_file is not None else 'corpus_lines'
+        ),
+        'document_file': (
+            str(config.document_file) if config.document_file is not None else None
+        ),
+        'document_sizes_kb': list(config.document_sizes_kb),
+        'documents_per_size': config.documents_per_size,
+        'init_ms': lease.init_ms,
+        'kiwi_pool_hit': lease.pool_hit,
+        'document_levels': levels,
+        'whole_latency_exponent': fit_document_exponent(
+            levels,
+            'whole_avg_latency_ms',
+        ),
+        'split_latency_exponent': fit_document_exponent(
+            levels,
+            'split_avg_latency_ms',
+        ),
+        'document_cost_growth_limit': DOCUMENT_COST_GROWTH_LIMIT,
+        'max_whole_document_kb': max_whole_document_kb,
+    }
+
+
+# Runs under `python -c` so the interpreter phase only pays for `json`/`sys`.
+_COLD_START_PROBE = '''
+import time
+started_ns = time.time_ns()
+import json
+import sys
+spec = json.loads(sys.argv[1])
+import_started = time.perf_counter_ns()
+from kiwipiepy import Kiwi
+import_ended = time.perf_counter_ns()
+import inspect
+supported = set(inspect.signature(Kiwi.__init__).parameters)
+kwargs = {k: v for k, v in spec['kwargs'].items() if k in supported}
+construct_started = time.perf_counter_ns()
+kiwi = Kiwi(**kwargs)
+construct_ended = time.perf_counter_ns()
+if spec['analyze_impl'] == 'tokenize':
+    kiwi.tokenize(spec['sentence'], match_options=spec['match_options'])
+elif spec['analyze_impl'] == 'split_into_sents':
+    kiwi.split_into_sents(spec['sentence'], match_options=spec['match_options'])
+elif spec['analyze_impl'] == 'space':
+    kiwi.space(spec['sentence'])
+elif spec['analyze_impl'] == 'join':
+    # join needs morphemes, so the first call includes one tokenize.
+    kiwi.join(kiwi.tokenize(spec['sentence']))
+else:
+    kiwi.analyze(
+        spec['sentence'],
+        top_n=spec['top_n'],
+        match_options=spec['match_options'],
+    )
+analyze_ended = time.perf_counter_ns()
+print('KIWI_COLD_START_JSON=' + json.dumps({
+    'started_ns': started_ns,
+    'import_ms': (import_ended - import_started) / 1e6,
+    'construct_ms': (construct_ended - construct_started) / 1e6,
+    'first_analyze_ms': (analyze_ended - construct_ended) / 1e6,
+}))
+'''
+COLD_START_PHASES: tuple[str, ...] = (
+    'interpreter_start_ms',
+    'import_ms',
+    'construct_ms',
+    'first_analyze_ms',
+    'total_ms',
+)
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    if not values:
+        return 0.0
+    sorted_values = sorted(values)
+    position = (len(sorted_values) - 1) * min(max(quantile, 0.0), 1.0)
+    lower_index = math.floor(position)
+    upper_index = math.ceil(position)
+    lower = sorted_values[lower_index]
+    upper = sorted_values[upper_index]
+    return lower + ((upper - lower) * (position - lower_index))
+
+
+def drop_page_cache() -> str:
+    """Evict the OS page cache: returns `dropped`, `denied` or `unsupported`."""
+    if sys.platform.startswith('linux'):
+        try:
+            os.sync()
+            Path('/proc/sys/vm/drop_caches').write_text('3\n', encoding='ascii')
+        except OSError:
+            return 'denied'
+        return 'dropped'
+    if sys.platform == 'darwin' and shutil.which('purge'):
+        completed = subprocess.run(['purge'], check=False, capture_output=True)
+        return 'dropped' if completed.returncode == 0 else 'denied'
+    return 'unsupported'
+
+
+def run_cold_start_probe(
+    config: BenchmarkConfig,
+    sentence: str,
+) -> dict[str, float]:
+    spec = {
+        'kwargs': build_kiwi_kwargs(config),
+        'sentence': sentence,
+        'top_n': config.top_n,
+        'match_options': config.analyze_match_options,
+        'analyze_impl': config.analyze_impl,
+    }
+    marker = 'KIWI_COLD_START_JSON='
+    launched_ns = time.time_ns()
+    launch_started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-c', _COLD_START_PROBE, json.dumps(spec)],
+        check=False,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        timeout=600,
+    )
+    total_ms = (time.perf_counter() - launch_started) * 1000.0
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f'Cold-start probe failed: {completed.stderr.strip()[-500:]}'
+        )
+    for line in completed.stdout.splitlines():
+        if line.startswith(marker):
+            result = json.loads(line[len(marker) :])
+            break
+    else:
+        raise RuntimeError('Cold-start probe did not report timings.')
+
+    return {
+        'interpreter_start_ms': (result['started_ns'] - launched_ns) / 1e6,
+        'import_ms': result['import_ms'],
+        'construct_ms': result['construct_ms'],
+        'first_analyze_ms': result['first_analyze_ms'],
+        'total_ms': total_ms,
+    }
+
+
+def summarize_cold_start(runs: list[dict[str, float]]) -> dict[str, Any]:
+    return {
+        phase: {
+            'median': statistics.median(run[phase] for run in runs),
+            'p95': percentile([run[phase] for run in runs], 0.95),
+            'values': [run[phase] for run in runs],
+        }
+        for phase in COLD_START_PHASES
+    }
+
+
+def run_cold_start(config: BenchmarkConfig, sentence: str) -> dict[str, Any]:
+    """Time cold-start phases in fresh interpreters, warm and cache-dropped.
+
+    `interpreter_start_ms` compares wall clocks across processes, so it has
+    clock-read granularity but no cross-process skew on one host.
+    """
+    series: dict[str, Any] = {}
+    warm_runs = [
+        run_cold_start_probe(config, sentence)
+        for _ in range(config.cold_start_runs)
+    ]
+    series['warm'] = summarize_cold_start(warm_runs)
+
+    page_cache_drop = 'not_requested'
+    if config.cold_start_drop_caches:
+        page_cache_drop = drop_page_cache()
+        if page_cache_drop == 'dropped':
+            dropped_runs: list[dict[str, float]] = []
+            for _ in range(config.cold_start_runs):
+                if drop_page_cache() != 'dropped':
+                    page_cache_drop = 'partial'
+                    break
+                dropped_runs.append(run_cold_start_probe(config, sentence))
+            if dropped_runs:
+                series['dropped'] = summarize_cold_start(dropped_runs)
+
+    return {
+        'cold_start_runs': config.cold_start_runs,
+        'cold_start_page_cache_drop': page_cache_drop,
+        'cold_start': series,
+    }
+
+
+def emit_payload(payload: dict[str, Any], output_path: Path | None) -> None:
+    # Keep stdout payload ASCII-only for robust parsing on Windows runners.
+    encoded_stdout = json.dumps(payload, ensure_ascii=True)
+    safe_print_line(f'KIWI_BENCHMARK_JSON={encoded_stdout}')
+
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
             json.dumps(payload, ensure_ascii=False, indent=2),
             encoding='utf-8',
         )
 
+
+def main() -> int:
+    config = parse_args()
+    noise = probe_system_noise(apply_cpu_affinity(config))
+    sentence_rows: list[tuple[str, int]] | StreamingCorpus | BinaryCorpus
+    load_started = time.perf_counter()
+    compiled = open_compiled_corpus(config.corpus_path)
+    if config.stream_corpus:
+        if compiled is not None:
+            sentence_rows = compiled
+        else:
+            sentence_rows = StreamingCorpus(config.corpus_path)
+        if len(sentence_rows) == 0:
+            raise ValueError(f'Corpus is empty: {config.corpus_path}')
+    else:
+        if compiled is not None:
+            sentence_rows = compiled.to_rows()
+        else:
+            sentences = load_sentences(config.corpus_path)
+            sentence_rows = [
+                (sentence, len(sentence)) for sentence in sentences
+            ]
+        if config.replay_duplicate_rate is not None:
+            sentence_rows = build_replay_rows(
+                sentence_rows,
+                config.replay_duplicate_rate,
+                seed=config.sample_seed,
+            )
+    corpus_load_ms = (time.perf_counter() - load_started) * 1000.0
+
+    kiwi_pool = KiwiPool(config.kiwi_pool_size, kiwi_class=backend_class(config))
+    if config.analyze_impl_sweep:
+        payload = run_analyze_impl_sweep(
+            config,
+            sentence_rows,
+            kiwi_pool=kiwi_pool if config.kiwi_pool_size else None,
+        )
+    elif config.num_workers_sweep:
+        payload = run_num_workers_sweep(
+            config,
+            sentence_rows,
+            kiwi_pool=kiwi_pool,
+        )
+    elif config.processes:
+        payload = run_process_pool(config, sentence_rows)
+    elif config.async_concurrency_sweep:
+        payload = run_async_concurrency_sweep(
+            config,
+            sentence_rows,
+            kiwi_pool=kiwi_pool,
+        )
+    elif has_matrix_axes(config):
+        payload = run_config_matrix(config, sentence_rows)
+    elif config.document_sizes_kb:
+        payload = run_document_benchmark(
+            config,
+            sentence_rows,
+            kiwi_pool=kiwi_pool,
+        )
+    elif config.open_loop_qps:
+        payload = run_open_loop(config, sentence_rows, kiwi_pool=kiwi_pool)
+    else:
+        payload = run_benchmark(config, sentence_rows, kiwi_pool=kiwi_pool)
+    payload.update(kiwi_pool.to_payload())
+    payload.update(noise)
+    payload.update(describe_corpus(config.corpus_path))
+    payload['corpus_load_ms'] = corpus_load_ms
+    if config.cold_start_runs:
+        first_sentence = next(iter(sentence_rows))[0]
+        payload.update(run_cold_start(config, first_sentence))
+
+    emit_payload(payload, config.output_path)
     return 0
 
 
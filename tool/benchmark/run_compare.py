@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import base64
 import json
+import math
 import os
 import queue
 import shlex
@@ -17,6 +18,8 @@ import time
 from pathlib import Path
 from typing import TextIO
 
+from bootstrap_ci import bootstrap_mean_ci
+
 
 def write_log_line(line: str) -> None:
     """Write a log line without failing on Windows console encodings."""
@@ -50,7 +53,36 @@ def parse_args() -> argparse.Namespace:
         '--warmup-runs',
         type=int,
         default=3,
-        help='Warm-up pass count for both runtimes.',
+        help=(
+            'Warm-up pass count for both runtimes (the minimum with '
+            '--adaptive-warmup).'
+        ),
+    )
+    parser.add_argument(
+        '--adaptive-warmup',
+        action='store_true',
+        help=(
+            'Warm both runtimes up until per-pass throughput CV over '
+            '--warmup-window passes is <= --warmup-cv-threshold.'
+        ),
+    )
+    parser.add_argument(
+        '--warmup-cv-threshold',
+        type=float,
+        default=0.05,
+        help='Steady-state CV threshold for --adaptive-warmup.',
+    )
+    parser.add_argument(
+        '--warmup-window',
+        type=int,
+        default=3,
+        help='Sliding window of warm-up passes used for the CV check.',
+    )
+    parser.add_argument(
+        '--warmup-max-runs',
+        type=int,
+        default=50,
+        help='Upper bound on adaptive warm-up passes.',
     )
     parser.add_argument(
         '--measure-runs',
@@ -110,9 +142,120 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         '--kiwi-analyze-impl',
-        choices=('analyze', 'tokenize'),
+        choices=('analyze', 'tokenize', 'split_into_sents', 'space', 'join'),
         default='analyze',
-        help='kiwipiepy benchmark API path: analyze(top_n) or tokenize().',
+        help=(
+            'kiwipiepy benchmark API path: analyze(top_n), tokenize(), '
+            'split_into_sents(), space() or join().'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-backend',
+        choices=('kiwipiepy', 'fake'),
+        default='kiwipiepy',
+        help=(
+            'Analyzer behind the kiwipiepy runner. fake: deterministic '
+            'stand-in for offline pipeline runs.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-fake-call-cost-us',
+        type=float,
+        default=0.0,
+        help='Synthetic per-call cost for `--kiwi-backend fake`.',
+    )
+    parser.add_argument(
+        '--kiwi-fake-char-cost-us',
+        type=float,
+        default=0.0,
+        help='Synthetic per-char cost for `--kiwi-backend fake`.',
+    )
+    parser.add_argument(
+        '--kiwi-layers',
+        action='store_true',
+        help=(
+            'Add a kiwipiepy pass that splits cost into native call, '
+            'extraction and formatting (pure/full, like Flutter).'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-harness-baseline',
+        action='store_true',
+        help=(
+            'Also time the kiwipiepy loop against a no-op analyzer and report '
+            'net throughput with the harness floor subtracted.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-cpu-affinity',
+        default='',
+        help='Pin kiwipiepy trials to a CPU list such as `0,2-3` (Linux).',
+    )
+    parser.add_argument(
+        '--kiwi-isolate',
+        action='store_true',
+        help='Give kiwipiepy measured work dedicated cores from its affinity mask.',
+    )
+    parser.add_argument(
+        '--kiwi-gc-mode',
+        choices=('enabled', 'freeze', 'disabled'),
+        default='enabled',
+        help=(
+            'Cyclic GC during the kiwipiepy measured phase; collector pauses '
+            'are reported in every mode.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-document-sizes-kb',
+        default='',
+        help=(
+            'kiwipiepy document mode: comma-separated target document sizes '
+            'in KiB; the report adds a document scaling table.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-document-file',
+        type=Path,
+        default=None,
+        help=(
+            'Blank-line-delimited paragraph file used to build documents '
+            'for `--kiwi-document-sizes-kb` instead of corpus lines.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-analyze-impl-sweep',
+        default='',
+        help=(
+            'Comma-separated kiwipiepy API paths benchmarked on one shared '
+            '`Kiwi` per trial; the report adds an API coverage table.'
+        ),
+    )
+    parser.add_argument(
+        '--kiwi-execution-mode',
+        choices=('single', 'batch'),
+        default='single',
+        help='kiwipiepy execution mode: single(sentence loop) or batch(iterable API).',
+    )
+    parser.add_argument(
+        '--kiwi-batch-size',
+        type=int,
+        default=0,
+        help='Sentences per kiwipiepy iterable call in batch mode (0 = whole corpus).',
+    )
+    parser.add_argument(
+        '--kiwi-cold-start-runs',
+        type=int,
+        default=0,
+        help='Fresh-interpreter cold-start probes per kiwipiepy trial (0 = off).',
+    )
+    parser.add_argument(
+        '--kiwi-profile',
+        choices=('cprofile', 'sample'),
+        default=None,
+        help=(
+            'Profile the kiwipiepy measured phase; writes pstats/collapsed '
+            'stacks next to each kiwipiepy trial JSON.'
+        ),
     )
     parser.add_argument(
         '--sample-count',
@@ -124,7 +267,32 @@ def parse_args() -> argparse.Namespace:
         '--trials',
         type=int,
         default=5,
-        help='Number of repeated benchmark trials per runtime.',
+        help=(
+            'Number of repeated benchmark trials per runtime (the minimum '
+            'with --target-ci-percent).'
+        ),
+    )
+    parser.add_argument(
+        '--target-ci-percent',
+        type=float,
+        default=0.0,
+        help=(
+            'Keep adding trials until the bootstrap 95%% CI half-width of '
+            'trial throughput is below this percentage of the mean on both '
+            'runtimes (0 = fixed --trials).'
+        ),
+    )
+    parser.add_argument(
+        '--time-budget-seconds',
+        type=float,
+        default=1800.0,
+        help='Wall-clock cap on trials with --target-ci-percent.',
+    )
+    parser.add_argument(
+        '--max-trials',
+        type=int,
+        default=30,
+        help='Upper bound on trials with --target-ci-percent.',
     )
     parser.add_argument(
         '--model-path',
@@ -157,6 +325,19 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def throughput_ci_half_width_percent(trials: list[dict[str, object]]) -> float:
+    values = [
+        float(trial['analyses_per_sec'])
+        for trial in trials
+        if isinstance(trial.get('analyses_per_sec'), (int, float))
+    ]
+    if len(values) < 2:
+        return math.inf
+    low, high = bootstrap_mean_ci(values)
+    mean = sum(values) / len(values)
+    return (high - low) / 2.0 / mean * 100.0 if mean > 0 else math.inf
+
+
 def run_command(command: list[str], *, cwd: Path | None = None) -> None:
     print(f"$ {shlex.join(command)}", flush=True)
     subprocess.run(command, cwd=cwd, check=True)
@@ -457,6 +638,19 @@ def run_flutter_benchmark(
 
 def main() -> int:
     args = parse_args()
+    if args.target_ci_percent < 0:
+        raise ValueError('--target-ci-percent must be >= 0')
+    if args.time_budget_seconds <= 0:
+        raise ValueError('--time-budget-seconds must be > 0')
+    if args.target_ci_percent and args.max_trials < args.trials:
+        raise ValueError('--max-trials must be >= --trials')
+    if args.target_ci_percent and args.trials < 2:
+        raise ValueError('--target-ci-percent needs --trials >= 2')
+    if args.target_ci_percent and args.kiwi_document_sizes_kb:
+        raise ValueError(
+            '--target-ci-percent cannot be combined with '
+            '--kiwi-document-sizes-kb (no throughput to converge on)'
+        )
     if args.trials < 1:
         raise ValueError('--trials must be >= 1')
     if args.build_options < 0:
@@ -467,6 +661,21 @@ def main() -> int:
         raise ValueError('--analyze-match-options must be >= 0')
     if args.sample_count < 0:
         raise ValueError('--sample-count must be >= 0')
+    if args.kiwi_batch_size < 0:
+        raise ValueError('--kiwi-batch-size must be >= 0')
+    if args.kiwi_cold_start_runs < 0:
+        raise ValueError('--kiwi-cold-start-runs must be >= 0')
+    if args.warmup_cv_threshold <= 0:
+        raise ValueError('--warmup-cv-threshold must be > 0')
+    if args.warmup_window < 2:
+        raise ValueError('--warmup-window must be >= 2')
+    if args.adaptive_warmup and args.warmup_max_runs < max(
+        args.warmup_runs,
+        args.warmup_window,
+    ):
+        raise ValueError(
+            '--warmup-max-runs must be >= --warmup-runs and --warmup-window'
+        )
 
     repo_root = Path(__file__).resolve().parents[2]
     output_dir = args.output_dir
@@ -507,6 +716,16 @@ def main() -> int:
         f'--dart-define=KIWI_BENCH_EXECUTION_MODE={args.flutter_execution_mode}',
         f'--dart-define=KIWI_BENCH_SAMPLE_COUNT={args.sample_count}',
     ]
+    if args.adaptive_warmup:
+        flutter_command.extend(
+            [
+                '--dart-define=KIWI_BENCH_WARMUP_MODE=adaptive',
+                '--dart-define=KIWI_BENCH_WARMUP_CV_THRESHOLD='
+                f'{args.warmup_cv_threshold}',
+                f'--dart-define=KIWI_BENCH_WARMUP_WINDOW={args.warmup_window}',
+                f'--dart-define=KIWI_BENCH_WARMUP_MAX_RUNS={args.warmup_max_runs}',
+            ]
+        )
     if args.model_path:
         flutter_command.append(
             f'--dart-define=KIWI_BENCH_MODEL_PATH={args.model_path}'
@@ -533,19 +752,76 @@ def main() -> int:
         str(args.analyze_match_options),
         '--analyze-impl',
         args.kiwi_analyze_impl,
+        '--execution-mode',
+        args.kiwi_execution_mode,
+        '--batch-size',
+        str(args.kiwi_batch_size),
         '--sample-count',
         str(args.sample_count),
+        '--cold-start-runs',
+        str(args.kiwi_cold_start_runs),
     ]
     if args.model_path:
         kiwi_command_base.extend(['--model-path', args.model_path])
+    if args.adaptive_warmup:
+        kiwi_command_base.extend(
+            [
+                '--adaptive-warmup',
+                '--warmup-cv-threshold',
+                str(args.warmup_cv_threshold),
+                '--warmup-window',
+                str(args.warmup_window),
+                '--warmup-max-runs',
+                str(args.warmup_max_runs),
+            ]
+        )
+    if args.kiwi_profile:
+        kiwi_command_base.extend(['--profile', args.kiwi_profile])
+    if args.kiwi_backend != 'kiwipiepy':
+        kiwi_command_base.extend(
+            [
+                '--backend',
+                args.kiwi_backend,
+                '--fake-call-cost-us',
+                str(args.kiwi_fake_call_cost_us),
+                '--fake-char-cost-us',
+                str(args.kiwi_fake_char_cost_us),
+            ]
+        )
+    if args.kiwi_layers:
+        kiwi_command_base.append('--layers')
+    if args.kiwi_harness_baseline:
+        kiwi_command_base.append('--harness-baseline')
+    if args.kiwi_cpu_affinity:
+        kiwi_command_base.extend(['--cpu-affinity', args.kiwi_cpu_affinity])
+    if args.kiwi_isolate:
+        kiwi_command_base.append('--isolate')
+    if args.kiwi_gc_mode != 'enabled':
+        kiwi_command_base.extend(['--gc-mode', args.kiwi_gc_mode])
+    if args.kiwi_document_sizes_kb:
+        kiwi_command_base.extend(
+            ['--document-sizes-kb', args.kiwi_document_sizes_kb]
+        )
+    if args.kiwi_document_file is not None:
+        kiwi_command_base.extend(
+            ['--document-file', str(args.kiwi_document_file.resolve())]
+        )
+    if args.kiwi_analyze_impl_sweep:
+        kiwi_command_base.extend(
+            ['--analyze-impl-sweep', args.kiwi_analyze_impl_sweep]
+        )
 
     run_command([flutter_executable, 'pub', 'get'], cwd=example_dir)
 
     flutter_trials: list[dict[str, object]] = []
     kiwi_trials: list[dict[str, object]] = []
 
-    for trial_id in range(1, args.trials + 1):
-        print(f'\n=== Trial {trial_id}/{args.trials} ===', flush=True)
+    trial_cap = args.max_trials if args.target_ci_percent else args.trials
+    deadline = time.monotonic() + args.time_budget_seconds
+    trial_id = 0
+    while trial_id < trial_cap:
+        trial_id += 1
+        print(f'\n=== Trial {trial_id}/{trial_cap} ===', flush=True)
 
         flutter_trial_json = (
             output_dir / f'flutter_kiwi_benchmark_trial_{trial_id:02d}.json'
@@ -584,6 +860,25 @@ def main() -> int:
             raise TypeError('kiwipiepy benchmark payload must be a JSON object.')
         kiwi_trials.append(kiwi_payload_raw)
 
+        if not args.target_ci_percent or trial_id < args.trials:
+            continue
+        half_widths = [
+            throughput_ci_half_width_percent(trials)
+            for trials in (flutter_trials, kiwi_trials)
+        ]
+        print(
+            'Throughput 95% CI half-width: '
+            f'flutter {half_widths[0]:.2f}%, kiwipiepy {half_widths[1]:.2f}% '
+            f'(target {args.target_ci_percent:.2f}%)',
+            flush=True,
+        )
+        if max(half_widths) <= args.target_ci_percent:
+            print('CI target reached; stopping trials.', flush=True)
+            break
+        if time.monotonic() >= deadline:
+            print('Time budget exhausted; stopping trials.', flush=True)
+            break
+
     flutter_trials_json.write_text(
         json.dumps(flutter_trials, ensure_ascii=False, indent=2),
         encoding='utf-8',